@@ -0,0 +1,440 @@
+"""
+Deterministic local stand-ins for the LLM, embedder and graph store.
+
+They are registered as extra backends of the regular factories ("bench_llm",
+"bench_embedder", "bench_graph"), so the code under test is constructed from
+ordinary configs and runs its real code paths; only the remote services are
+replaced.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from pydantic import Field
+
+from memos.configs.base import BaseConfig
+from memos.configs.embedder import BaseEmbedderConfig, EmbedderConfigFactory
+from memos.configs.graph_db import GraphDBConfigFactory
+from memos.configs.llm import BaseLLMConfig, LLMConfigFactory
+from memos.embedders.base import BaseEmbedder
+from memos.embedders.factory import EmbedderFactory
+from memos.filters import normalize_filter
+from memos.graph_dbs.factory import GraphStoreFactory
+from memos.llms.base import BaseLLM
+from memos.llms.factory import LLMFactory
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_UUID_PATTERN = re.compile(r"\[([0-9a-f\-]{36})\]")
+
+
+class FakeLLMConfig(BaseLLMConfig):
+    """Configuration of the fake LLM."""
+
+    latency_ms: float = Field(default=0.0, description="Simulated latency of every call")
+
+
+class FakeLLM(BaseLLM):
+    """
+    LLM that answers each prompt family of MemOS with a fixed, well-formed response:
+    memory extraction JSON for the mem reader, the first memory ids for the reasoner,
+    and a short text otherwise.
+    """
+
+    def __init__(self, config: FakeLLMConfig):
+        self.config = config
+        self.calls = 0
+
+    def generate(self, messages, **kwargs) -> str:
+        self.calls += 1
+        if self.config.latency_ms:
+            time.sleep(self.config.latency_ms / 1000)
+        prompt = messages[-1]["content"]
+
+        if '"memory list"' in prompt:
+            conversation = prompt[-400:]
+            return json.dumps(
+                {
+                    "memory list": [
+                        {
+                            "key": "benchmark fact",
+                            "memory_type": "LongTermMemory",
+                            "value": f"The user said: {conversation}",
+                            "tags": ["benchmark", "fact"],
+                        }
+                    ],
+                    "summary": "Benchmark conversation.",
+                }
+            )
+        selected = _UUID_PATTERN.findall(prompt)
+        if selected:
+            return json.dumps({"selected_ids": selected[:3]})
+        return "Benchmark response."
+
+
+class HashEmbedder(BaseEmbedder):
+    """
+    Bag-of-words embedder: every token maps to a fixed pseudo-random unit vector
+    (seeded by its hash) and a text is the normalized sum of its token vectors.
+    Texts sharing words are therefore similar, as with a real model.
+    """
+
+    def __init__(self, config: BaseEmbedderConfig):
+        self.config = config
+        self.dims = config.embedding_dims or 384
+        self._token_vectors: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            seed = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+            vector = np.random.default_rng(seed).standard_normal(self.dims).astype(np.float32)
+            with self._lock:
+                self._token_vectors[token] = vector
+        return vector
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in _TOKEN_PATTERN.findall(text.lower()):
+                vectors[i] += self._token_vector(token)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+        return vectors.tolist()
+
+
+class InMemoryGraphConfig(BaseConfig):
+    """Configuration of the in-process graph store."""
+
+    embedding_dimension: int = Field(default=384, description="Dimension of vector embedding")
+
+
+class InMemoryGraphStore:
+    """
+    In-process stand-in for `Neo4jGraphDB` with the same method signatures for
+    everything TreeTextMemory, MemoryManager and the retrievers call.
+
+    Vector search is exact (brute-force cosine over a float32 matrix per memory
+    type), so it gives a lower bound on the graph store's share of latency.
+    """
+
+    def __init__(self, config: InMemoryGraphConfig):
+        self.config = config
+        self.db_name = "bench"
+        self.nodes: dict[str, dict[str, Any]] = {}
+        self.edges: set[tuple[str, str, str]] = set()
+        self._structure_nodes: dict[str, str] = {}
+        self._lock = threading.RLock()
+        # memory_type -> (ids, matrix); rebuilt lazily after writes
+        self._index: dict[str, tuple[list[str], np.ndarray]] = {}
+
+    # ─── Nodes ─────────────────────────────────────────────────────────────────
+
+    def add_node(self, id: str, memory: str, metadata: dict[str, Any]) -> None:
+        now = datetime.now().isoformat()
+        metadata = dict(metadata)
+        metadata.setdefault("created_at", now)
+        metadata.setdefault("updated_at", now)
+        with self._lock:
+            self.nodes[id] = {"id": id, "memory": memory, "metadata": metadata}
+            self._index.pop(metadata.get("memory_type"), None)
+
+    def import_nodes(self, nodes: list[dict[str, Any]]) -> None:
+        with self._lock:
+            for node in nodes:
+                self.nodes[node["id"]] = {
+                    "id": node["id"],
+                    "memory": node["memory"],
+                    "metadata": dict(node["metadata"]),
+                }
+            self._index.clear()
+
+    def update_node(self, id: str, fields: dict[str, Any]) -> None:
+        with self._lock:
+            node = self.nodes.get(id)
+            if node is not None:
+                node["metadata"].update(fields)
+                self._index.pop(node["metadata"].get("memory_type"), None)
+
+    def delete_node(self, id: str) -> None:
+        with self._lock:
+            node = self.nodes.pop(id, None)
+            if node is not None:
+                self._index.pop(node["metadata"].get("memory_type"), None)
+            self.edges = {e for e in self.edges if id not in (e[0], e[1])}
+
+    def get_node(self, id: str) -> dict[str, Any] | None:
+        return self.nodes.get(id)
+
+    def get_nodes(self, ids: list[str]) -> list[dict[str, Any]]:
+        return [self.nodes[node_id] for node_id in ids if node_id in self.nodes]
+
+    def get_node_fields(self, ids: list[str], fields: tuple[str, ...] = ("memory",)):
+        results = []
+        for node_id in ids:
+            node = self.nodes.get(node_id)
+            if node is not None:
+                values = {
+                    f: node["memory"] if f == "memory" else node["metadata"].get(f) for f in fields
+                }
+                results.append({"id": node_id, **values})
+        return results
+
+    def get_all_memory_items(self, scope: str) -> list[dict]:
+        return [n for n in list(self.nodes.values()) if n["metadata"].get("memory_type") == scope]
+
+    def get_memory_count(self, memory_type: str) -> int:
+        return len(self.get_all_memory_items(memory_type))
+
+    def remove_oldest_memory(self, memory_type: str, keep_latest: int) -> None:
+        with self._lock:
+            nodes = self.get_all_memory_items(memory_type)
+            if len(nodes) <= keep_latest:
+                return
+            nodes.sort(key=lambda n: n["metadata"].get("updated_at") or "", reverse=True)
+            for node in nodes[keep_latest:]:
+                del self.nodes[node["id"]]
+            self._index.pop(memory_type, None)
+
+    def delete_oldest_memory(self, memory_type: str, count: int) -> int:
+        with self._lock:
+            nodes = self.get_all_memory_items(memory_type)
+            oldest = sorted(nodes, key=lambda n: n["metadata"].get("updated_at") or "")
+            oldest = oldest[: max(count, 0)]
+            for node in oldest:
+                del self.nodes[node["id"]]
+            self._index.pop(memory_type, None)
+            return len(oldest)
+
+    def get_grouped_counts(self, group_fields: list[str], where_clause: str = "", params=None):
+        counts: dict[tuple, int] = {}
+        for node in list(self.nodes.values()):
+            key = tuple(node["metadata"].get(field) for field in group_fields)
+            counts[key] = counts.get(key, 0) + 1
+        return [
+            {**dict(zip(group_fields, key, strict=True)), "count": count}
+            for key, count in counts.items()
+        ]
+
+    # ─── Edges ─────────────────────────────────────────────────────────────────
+
+    def add_edge(self, source_id: str, target_id: str, type: str) -> None:
+        with self._lock:
+            self.edges.add((source_id, target_id, type))
+
+    def delete_edge(self, source_id: str, target_id: str, type: str) -> None:
+        with self._lock:
+            self.edges.discard((source_id, target_id, type))
+
+    def edge_exists(self, source_id: str, target_id: str, type: str = "ANY", direction="OUTGOING"):
+        for s, t, ty in self.edges:
+            if type not in ("ANY", ty):
+                continue
+            if (s, t) == (source_id, target_id):
+                return True
+            if direction == "ANY" and (s, t) == (target_id, source_id):
+                return True
+        return False
+
+    def get_edges(self, id: str, type: str = "ANY", direction: str = "ANY") -> list[dict]:
+        return [
+            {"from": s, "to": t, "type": ty}
+            for s, t, ty in self.edges
+            if id in (s, t) and type in ("ANY", ty)
+        ]
+
+    def add_merged_node(
+        self,
+        original_id: str,
+        merged_node: dict[str, Any],
+        archived_source: dict[str, Any],
+        related_ids: list[str] | None = None,
+    ) -> None:
+        with self._lock:
+            if original_id not in self.nodes:
+                return
+            merged_id = merged_node["id"]
+            for node in (merged_node, archived_source):
+                self.add_node(node["id"], node["memory"], node["metadata"])
+            self.update_node(original_id, {"status": "archived"})
+            self.add_edge(original_id, merged_id, "MERGED_TO")
+            self.add_edge(archived_source["id"], merged_id, "MERGED_TO")
+            for s, t, ty in list(self.edges):
+                if ty == "MERGED_TO" or original_id not in (s, t) or s == t:
+                    continue
+                self.edges.discard((s, t, ty))
+                new_s = merged_id if s == original_id else s
+                new_t = merged_id if t == original_id else t
+                if not self.edge_exists(new_s, new_t, ty, direction="ANY"):
+                    self.edges.add((new_s, new_t, ty))
+            for related_id in related_ids or []:
+                if related_id in self.nodes and not self.edge_exists(
+                    merged_id, related_id, direction="ANY"
+                ):
+                    self.edges.add((merged_id, related_id, "RELATE"))
+
+    # ─── Search ────────────────────────────────────────────────────────────────
+
+    def _matrix(self, scope: str | None) -> tuple[list[str], np.ndarray]:
+        key = scope or "*"
+        with self._lock:
+            cached = self._index.get(key)
+            if cached is None:
+                ids, rows = [], []
+                for node in self.nodes.values():
+                    meta = node["metadata"]
+                    if scope and meta.get("memory_type") != scope:
+                        continue
+                    if meta.get("embedding"):
+                        ids.append(node["id"])
+                        rows.append(meta["embedding"])
+                dims = self.config.embedding_dimension
+                matrix = np.asarray(rows, dtype=np.float32).reshape(len(rows), dims)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix /= np.where(norms == 0, 1, norms)
+                cached = self._index[key] = (ids, matrix)
+            return cached
+
+    def search_by_embedding(
+        self, vector, top_k: int = 5, scope=None, status=None, threshold=None
+    ) -> list[dict]:
+        ids, matrix = self._matrix(scope)
+        if not ids:
+            return []
+        query = np.asarray(vector, dtype=np.float32)
+        scores = matrix @ (query / (np.linalg.norm(query) or 1.0))
+        k = min(top_k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        results = []
+        for i in top:
+            node = self.nodes.get(ids[i])
+            if node is None or (status and node["metadata"].get("status") != status):
+                continue
+            if threshold is not None and scores[i] < threshold:
+                continue
+            results.append({"id": ids[i], "score": float(scores[i])})
+        return results
+
+    def search_by_embeddings(self, vectors, top_k=5, scope=None, status=None, threshold=None):
+        return [self.search_by_embedding(v, top_k, scope, status, threshold) for v in vectors]
+
+    def search_by_fulltext(self, text: str, top_k: int = 5, scope=None, status=None):
+        terms = set(_TOKEN_PATTERN.findall(text.lower()))
+        scored = []
+        for node in list(self.nodes.values()):
+            meta = node["metadata"]
+            if scope and meta.get("memory_type") != scope:
+                continue
+            hits = len(terms & set(_TOKEN_PATTERN.findall(node["memory"].lower())))
+            if hits:
+                scored.append({"id": node["id"], "score": float(hits)})
+        scored.sort(key=lambda r: r["score"], reverse=True)
+        return scored[:top_k]
+
+    def get_structure_node(self, structure_key: str) -> str | None:
+        # Entries of evicted or deleted nodes are stale
+        node_id = self._structure_nodes.get(structure_key)
+        return node_id if node_id in self.nodes else None
+
+    def merge_structure_node(
+        self, structure_key: str, id: str, memory: str, metadata: dict[str, Any]
+    ) -> tuple[str, bool]:
+        with self._lock:
+            existing = self.get_structure_node(structure_key)
+            if existing is not None:
+                return existing, False
+            self.add_node(id, memory, {**metadata, "structure_key": structure_key})
+            self._structure_nodes[structure_key] = id
+            return id, True
+
+    def get_by_metadata(self, filters) -> list[str]:
+        tree = normalize_filter(filters)
+        return [n["id"] for n in list(self.nodes.values()) if _matches(tree, n)]
+
+    # ─── Bulk ──────────────────────────────────────────────────────────────────
+
+    def clear(self) -> None:
+        with self._lock:
+            self.nodes.clear()
+            self.edges.clear()
+            self._index.clear()
+
+    def export_graph(self) -> dict[str, Any]:
+        return {
+            "nodes": list(self.nodes.values()),
+            "edges": [{"source": s, "target": t, "type": ty} for s, t, ty in self.edges],
+        }
+
+
+def _matches(tree: dict | None, node: dict) -> bool:
+    if tree is None:
+        return True
+    if "and" in tree:
+        return all(_matches(child, node) for child in tree["and"])
+    if "or" in tree:
+        return any(_matches(child, node) for child in tree["or"])
+    if "not" in tree:
+        return not _matches(tree["not"], node)
+
+    field, op, value = tree["field"], tree["op"], tree["value"]
+    actual = node["memory"] if field == "memory" else node["metadata"].get(field)
+    if op == "=":
+        return actual == value
+    if op == "!=":
+        return actual != value
+    if op == "in":
+        return actual in value
+    if op == "not_in":
+        return actual not in value
+    if op == "contains":
+        return bool(set(actual or []) & set(value))
+    if op == "starts_with":
+        return isinstance(actual, str) and actual.startswith(value)
+    if op == "ends_with":
+        return isinstance(actual, str) and actual.endswith(value)
+    if actual is None:
+        return False
+    return {
+        ">": actual > value,
+        ">=": actual >= value,
+        "<": actual < value,
+        "<=": actual <= value,
+    }[op]
+
+
+def register_fake_backends() -> None:
+    """Make the stand-ins available to the config and module factories."""
+    LLMConfigFactory.backend_to_class["bench_llm"] = FakeLLMConfig
+    LLMFactory.backend_to_class["bench_llm"] = FakeLLM
+    EmbedderConfigFactory.backend_to_class["bench_embedder"] = BaseEmbedderConfig
+    EmbedderFactory.backend_to_class["bench_embedder"] = HashEmbedder
+    GraphDBConfigFactory.backend_to_class["bench_graph"] = InMemoryGraphConfig
+    GraphStoreFactory.backend_to_class["bench_graph"] = InMemoryGraphStore
+
+
+def llm_config(latency_ms: float = 0.0) -> dict[str, Any]:
+    return {
+        "backend": "bench_llm",
+        "config": {"model_name_or_path": "bench", "temperature": 0.0, "latency_ms": latency_ms},
+    }
+
+
+def embedder_config(dims: int) -> dict[str, Any]:
+    return {
+        "backend": "bench_embedder",
+        "config": {"model_name_or_path": "bench", "embedding_dims": dims},
+    }
+
+
+def graph_config(dims: int) -> dict[str, Any]:
+    return {"backend": "bench_graph", "config": {"embedding_dimension": dims}}
@@ -0,0 +1,96 @@
+"""Timing, memory and reporting helpers of the benchmark suite."""
+
+import json
+import resource
+import sys
+import time
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class BenchResult:
+    """Latency samples of one operation at one corpus size."""
+
+    suite: str
+    operation: str
+    size: int
+    samples_ms: list[float] = field(repr=False)
+    setup_s: float = 0.0
+    peak_rss_mb: float = 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        return float(np.percentile(self.samples_ms, 50))
+
+    @property
+    def p95_ms(self) -> float:
+        return float(np.percentile(self.samples_ms, 95))
+
+    @property
+    def throughput(self) -> float:
+        """Sequential operations per second."""
+        total_s = sum(self.samples_ms) / 1000
+        return len(self.samples_ms) / total_s if total_s else float("inf")
+
+    def summary(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("samples_ms")
+        data.update(
+            iterations=len(self.samples_ms),
+            p50_ms=round(self.p50_ms, 3),
+            p95_ms=round(self.p95_ms, 3),
+            throughput_ops=round(self.throughput, 1),
+        )
+        return data
+
+
+def measure(op: Callable[[int], Any], iterations: int, warmup: int) -> list[float]:
+    """Run `op(i)` `warmup` times untimed, then `iterations` times; return ms per call."""
+    for i in range(warmup):
+        op(i)
+    samples = []
+    for i in range(warmup, warmup + iterations):
+        start = time.perf_counter()
+        op(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def format_table(results: list[BenchResult]) -> str:
+    header = ("suite", "operation", "size", "p50 ms", "p95 ms", "ops/s", "setup s", "peak RSS MB")
+    rows = [
+        (
+            r.suite,
+            r.operation,
+            f"{r.size:,}",
+            f"{r.p50_ms:.2f}",
+            f"{r.p95_ms:.2f}",
+            f"{r.throughput:.1f}",
+            f"{r.setup_s:.1f}",
+            f"{r.peak_rss_mb:.0f}",
+        )
+        for r in results
+    ]
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows, strict=True)]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(header, widths, strict=True))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)))
+    return "\n".join(lines)
+
+
+def write_json(results: list[BenchResult], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([r.summary() for r in results], f, indent=2)
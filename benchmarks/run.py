@@ -0,0 +1,124 @@
+"""
+Offline performance benchmarks of the MemOS memory hot paths.
+
+Usage:
+    python benchmarks/run.py                          # all suites at 1k/10k/100k
+    python benchmarks/run.py --suites tree kv --sizes 1000 10000
+    python benchmarks/run.py --json results.json
+
+Each (suite, size) case runs in a fresh process, so peak RSS is per case and
+state files (user database, Qdrant data) go to a temporary directory.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from queue import Empty
+
+from harness import BenchResult, format_table, measure, peak_rss_mb, write_json
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def run_case(suite: str, size: int, options: argparse.Namespace) -> list[BenchResult]:
+    # MemOS keeps its user database under the current working directory
+    os.chdir(tempfile.mkdtemp(prefix="memos-bench-"))
+
+    from fakes import register_fake_backends
+    from suites import SUITES
+
+    register_fake_backends()
+    start = time.perf_counter()
+    operations = SUITES[suite](size, options)
+    setup_s = time.perf_counter() - start
+
+    results = []
+    for name, op in operations.items():
+        samples = measure(op, options.iterations, options.warmup)
+        results.append(
+            BenchResult(
+                suite=suite,
+                operation=name,
+                size=size,
+                samples_ms=samples,
+                setup_s=setup_s,
+                peak_rss_mb=peak_rss_mb(),
+            )
+        )
+    return results
+
+
+def _worker(suite: str, size: int, options: argparse.Namespace, queue) -> None:
+    try:
+        queue.put(run_case(suite, size, options))
+    except Exception as e:
+        queue.put(e)
+
+
+def _wait(process, queue) -> list[BenchResult] | Exception:
+    """Result of a case process, or an error if it died without reporting one."""
+    while True:
+        try:
+            outcome = queue.get(timeout=1)
+            break
+        except Empty:
+            if not process.is_alive():
+                outcome = RuntimeError(f"process exited with code {process.exitcode}")
+                break
+    process.join()
+    return outcome
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    from suites import SUITES
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--suites", nargs="+", choices=sorted(SUITES), default=list(SUITES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--iterations", type=int, default=50, help="timed calls per operation")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed calls per operation")
+    parser.add_argument("--top-k", dest="top_k", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=384, help="embedding dimension")
+    parser.add_argument(
+        "--llm-latency-ms",
+        dest="llm_latency_ms",
+        type=float,
+        default=0.0,
+        help="simulated latency of every fake LLM call",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    options = parse_args(argv)
+    ctx = multiprocessing.get_context("spawn")
+    results: list[BenchResult] = []
+    failed = False
+    for suite in options.suites:
+        for size in options.sizes:
+            print(f"Running {suite} @ {size:,} ...", file=sys.stderr, flush=True)
+            queue = ctx.Queue()
+            process = ctx.Process(target=_worker, args=(suite, size, options, queue))
+            process.start()
+            outcome = _wait(process, queue)
+            if isinstance(outcome, Exception):
+                print(f"  failed: {outcome!r}", file=sys.stderr)
+                failed = True
+                continue
+            results.extend(outcome)
+
+    print(format_table(results))
+    if options.json:
+        write_json(results, os.path.abspath(options.json))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
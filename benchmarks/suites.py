@@ -0,0 +1,270 @@
+"""
+Benchmark suites.
+
+A suite is a function `(size, options) -> dict[operation name, op]` that builds a
+corpus of `size` memories and returns the operations to time; `op(i)` runs the
+i-th iteration. Setup is not timed.
+"""
+
+import random
+import tempfile
+import uuid
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from fakes import embedder_config, graph_config, llm_config
+
+
+Operation = Callable[[int], Any]
+
+_NAMES = ["Alice", "Bob", "Chen", "Dana", "Emre", "Fatima", "Goro", "Hana", "Ivan", "Jia"]
+_VERBS = ["visited", "discussed", "planned", "cancelled", "reviewed", "bought", "painted", "fixed"]
+_OBJECTS = ["the garden", "a budget", "the release", "a bicycle", "the roof", "a novel", "a trip"]
+_PLACES = ["Kyoto", "Lisbon", "Nairobi", "Oslo", "Lima", "Hanoi", "Denver", "Porto"]
+
+
+def synthetic_memory(rng: random.Random, i: int) -> str:
+    return (
+        f"{rng.choice(_NAMES)} {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} in "
+        f"{rng.choice(_PLACES)} with project-{rng.randrange(10_000)} on day {i}"
+    )
+
+
+def synthetic_query(rng: random.Random) -> str:
+    return (
+        f"What did {rng.choice(_NAMES)} do in {rng.choice(_PLACES)} about {rng.choice(_OBJECTS)}?"
+    )
+
+
+def _tree_memory_config(dims: int, latency_ms: float) -> dict[str, Any]:
+    return {
+        "extractor_llm": llm_config(latency_ms),
+        "dispatcher_llm": llm_config(latency_ms),
+        "embedder": embedder_config(dims),
+        "graph_db": graph_config(dims),
+    }
+
+
+def _tree_node(rng: random.Random, i: int, embedding: list[float], memory_type: str) -> dict:
+    updated_at = (datetime(2025, 1, 1) + timedelta(minutes=i)).isoformat()
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "memory": None,
+        "metadata": {
+            "memory_type": memory_type,
+            "status": "activated",
+            "type": "fact",
+            "key": f"fact {i}",
+            "tags": [f"tag{i % 50}", f"tag{i % 7}"],
+            "embedding": embedding,
+            "usage": [],
+            "sources": [],
+            "background": "",
+            "confidence": 0.99,
+            "user_id": "bench_user",
+            "created_at": updated_at,
+            "updated_at": updated_at,
+        },
+    }
+
+
+def _preload_tree(text_mem, size: int, rng: random.Random, batch_size: int = 2000) -> None:
+    """Bulk-load LongTermMemory/UserMemory nodes plus a full working memory."""
+    working_size = text_mem.memory_manager.memory_size["WorkingMemory"]
+    for start in range(0, size + working_size, batch_size):
+        indices = range(start, min(start + batch_size, size + working_size))
+        texts = [synthetic_memory(rng, i) for i in indices]
+        embeddings = text_mem.embedder.embed(texts)
+        nodes = []
+        for i, text, embedding in zip(indices, texts, embeddings, strict=True):
+            if i >= size:
+                memory_type = "WorkingMemory"
+            else:
+                memory_type = "UserMemory" if i % 5 == 0 else "LongTermMemory"
+            node = _tree_node(rng, i, embedding, memory_type)
+            node["memory"] = text
+            nodes.append(node)
+        text_mem.graph_store.import_nodes(nodes)
+    text_mem.memory_manager._refresh_memory_size()
+
+
+def tree_memory_suite(size: int, options) -> dict[str, Operation]:
+    """TreeTextMemory.search (fast/fine) and MemoryManager.add over the in-process graph."""
+    from memos.configs.memory import TreeTextMemoryConfig
+    from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+    from memos.memories.textual.tree import TreeTextMemory
+
+    rng = random.Random(options.seed)
+    text_mem = TreeTextMemory(
+        TreeTextMemoryConfig(**_tree_memory_config(options.dims, options.llm_latency_ms))
+    )
+    _preload_tree(text_mem, size, rng)
+
+    queries = [synthetic_query(rng) for _ in range(256)]
+    new_texts = [synthetic_memory(rng, size + i) for i in range(1024)]
+    new_embeddings = text_mem.embedder.embed(new_texts)
+
+    def add_one(i: int) -> None:
+        j = i % len(new_texts)
+        text_mem.memory_manager.add(
+            [
+                TextualMemoryItem(
+                    memory=new_texts[j],
+                    metadata=TreeNodeTextualMemoryMetadata(
+                        memory_type="LongTermMemory",
+                        status="activated",
+                        key=f"new fact {j}",
+                        tags=["benchmark"],
+                        embedding=new_embeddings[j],
+                        usage=[],
+                        sources=[],
+                        background="",
+                        confidence=0.99,
+                    ),
+                )
+            ]
+        )
+
+    return {
+        "TreeTextMemory.search[fast]": lambda i: text_mem.search(
+            queries[i % len(queries)], top_k=options.top_k, mode="fast"
+        ),
+        "TreeTextMemory.search[fine]": lambda i: text_mem.search(
+            queries[i % len(queries)], top_k=options.top_k, mode="fine"
+        ),
+        "MemoryManager.add": add_one,
+    }
+
+
+def general_memory_suite(size: int, options) -> dict[str, Operation]:
+    """GeneralTextMemory.search over a local (embedded) Qdrant collection."""
+    from memos.configs.memory import GeneralTextMemoryConfig
+    from memos.memories.textual.general import GeneralTextMemory
+    from memos.memories.textual.item import TextualMemoryItem
+
+    rng = random.Random(options.seed)
+    text_mem = GeneralTextMemory(
+        GeneralTextMemoryConfig(
+            extractor_llm=llm_config(options.llm_latency_ms),
+            embedder=embedder_config(options.dims),
+            vector_db={
+                "backend": "qdrant",
+                "config": {
+                    "collection_name": "bench",
+                    "vector_dimension": options.dims,
+                    "distance_metric": "cosine",
+                    "path": tempfile.mkdtemp(prefix="memos-bench-qdrant-"),
+                },
+            },
+        )
+    )
+    for start in range(0, size, 5000):
+        text_mem.add(
+            [
+                TextualMemoryItem(memory=synthetic_memory(rng, i))
+                for i in range(start, min(start + 5000, size))
+            ]
+        )
+
+    queries = [synthetic_query(rng) for _ in range(256)]
+    return {
+        "GeneralTextMemory.search": lambda i: text_mem.search(
+            queries[i % len(queries)], top_k=options.top_k
+        ),
+    }
+
+
+def kv_cache_suite(size: int, options) -> dict[str, Operation]:
+    """KVCacheMemory.get_cache merging synthetic DynamicCache entries."""
+    import torch
+
+    from memos.memories.activation.item import KVCacheItem
+    from memos.memories.activation.kv import KVCacheMemory
+    from transformers import DynamicCache
+
+    layers, heads, tokens, head_dim = 4, 2, 16, 32
+
+    def make_cache() -> DynamicCache:
+        cache = DynamicCache()
+        for _ in range(layers):
+            cache.key_cache.append(torch.randn(1, heads, tokens, head_dim))
+            cache.value_cache.append(torch.randn(1, heads, tokens, head_dim))
+        return cache
+
+    # The extractor LLM (a HuggingFace model) is only needed to build caches, which
+    # are synthetic here, so the memory is created without loading a model.
+    kv_mem = KVCacheMemory.__new__(KVCacheMemory)
+    kv_mem.config = None
+    kv_mem.llm = None
+    kv_mem.kv_cache_memories = {}
+    kv_mem.add([KVCacheItem(memory=make_cache()) for _ in range(size)])
+
+    rng = random.Random(options.seed)
+    cache_ids = list(kv_mem.kv_cache_memories)
+    selections = [rng.sample(cache_ids, k=min(4, size)) for _ in range(256)]
+    return {
+        "KVCacheMemory.get_cache[4]": lambda i: kv_mem.get_cache(selections[i % len(selections)]),
+    }
+
+
+def mos_suite(size: int, options) -> dict[str, Operation]:
+    """MOSCore.add (mem reader + tree memory) and MOSCore.search end to end."""
+    from memos.configs.mem_cube import GeneralMemCubeConfig
+    from memos.configs.mem_os import MOSConfig
+    from memos.mem_cube.general import GeneralMemCube
+    from memos.mem_os.core import MOSCore
+
+    rng = random.Random(options.seed)
+    mos = MOSCore(
+        MOSConfig(
+            user_id="root",
+            chat_model=llm_config(options.llm_latency_ms),
+            mem_reader={
+                "backend": "simple_struct",
+                "config": {
+                    "llm": llm_config(options.llm_latency_ms),
+                    "embedder": embedder_config(options.dims),
+                    "chunker": {
+                        "backend": "sentence",
+                        "config": {"tokenizer_or_token_counter": "word"},
+                    },
+                },
+            },
+            top_k=options.top_k,
+        )
+    )
+    cube = GeneralMemCube(
+        GeneralMemCubeConfig(
+            user_id="root",
+            cube_id="bench_cube",
+            text_mem={
+                "backend": "tree_text",
+                "config": _tree_memory_config(options.dims, options.llm_latency_ms),
+            },
+        )
+    )
+    _preload_tree(cube.text_mem, size, rng)
+    mos.mem_cubes["bench_cube"] = cube
+    mos.register_mem_cube("bench_cube", mem_cube_id="bench_cube")
+
+    queries = [synthetic_query(rng) for _ in range(256)]
+    return {
+        "MOSCore.search": lambda i: mos.search(queries[i % len(queries)]),
+        "MOSCore.add": lambda i: mos.add(
+            messages=[
+                {"role": "user", "content": synthetic_memory(rng, size + i)},
+                {"role": "assistant", "content": "Noted."},
+            ],
+            mem_cube_id="bench_cube",
+        ),
+    }
+
+
+SUITES: dict[str, Callable[[int, Any], dict[str, Operation]]] = {
+    "tree": tree_memory_suite,
+    "general": general_memory_suite,
+    "kv": kv_cache_suite,
+    "mos": mos_suite,
+}
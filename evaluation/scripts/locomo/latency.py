@@ -0,0 +1,104 @@
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+
+# Word and punctuation tokens; the LLM/embedder backends do not report usage
+# through `generate`/`embed`, so token counts are estimated from the texts.
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+PERCENTILES = [50, 95, 99]
+
+
+def count_tokens(text) -> int:
+    return len(TOKEN_PATTERN.findall(text)) if isinstance(text, str) else 0
+
+
+class CallStats:
+    """Thread-safe counters of the LLM and embedding calls made by MemOS clients."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wrapped = set()
+        self.counts = {
+            "llm_calls": 0,
+            "llm_prompt_tokens": 0,
+            "llm_completion_tokens": 0,
+            "embedding_calls": 0,
+            "embedded_texts": 0,
+            "embedding_tokens": 0,
+        }
+
+    def attach(self, mos) -> None:
+        """Count the calls of every LLM and embedder of `mos` and its registered cubes."""
+        components = [mos.chat_llm, getattr(mos.mem_reader, "llm", None)]
+        components.append(getattr(mos.mem_reader, "embedder", None))
+        for mem_cube in mos.mem_cubes.values():
+            text_mem = mem_cube.text_mem
+            for name in ("extractor_llm", "dispatcher_llm", "embedder"):
+                components.append(getattr(text_mem, name, None))
+
+        for component in components:
+            if component is None or id(component) in self._wrapped:
+                continue
+            self._wrapped.add(id(component))
+            if hasattr(component, "generate"):
+                component.generate = self._wrap_generate(component.generate)
+            if hasattr(component, "embed"):
+                component.embed = self._wrap_embed(component.embed)
+
+    def _wrap_generate(self, generate):
+        def wrapper(messages, *args, **kwargs):
+            response = generate(messages, *args, **kwargs)
+            prompt_tokens = sum(count_tokens(message.get("content")) for message in messages)
+            self._add(
+                llm_calls=1,
+                llm_prompt_tokens=prompt_tokens,
+                llm_completion_tokens=count_tokens(response),
+            )
+            return response
+
+        return wrapper
+
+    def _wrap_embed(self, embed):
+        def wrapper(texts, *args, **kwargs):
+            embeddings = embed(texts, *args, **kwargs)
+            self._add(
+                embedding_calls=1,
+                embedded_texts=len(texts),
+                embedding_tokens=sum(count_tokens(text) for text in texts),
+            )
+            return embeddings
+
+        return wrapper
+
+    def _add(self, **deltas) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                self.counts[key] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+    def since(self, before: dict) -> dict:
+        """Counts accumulated since `before` (a previous snapshot)."""
+        now = self.snapshot()
+        return {key: now[key] - before.get(key, 0) for key in now}
+
+
+def percentile_row(name: str, values: list) -> dict:
+    row = {"metric": name, "count": len(values)}
+    row["mean"] = float(np.mean(values)) if values else 0.0
+    for p in PERCENTILES:
+        row[f"p{p}"] = float(np.percentile(values, p)) if values else 0.0
+    return row
+
+
+def save_stats(stats: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(stats, f, indent=2)
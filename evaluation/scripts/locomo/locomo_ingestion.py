@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 import pandas as pd
 
 from dotenv import load_dotenv
+from latency import CallStats, save_stats
 from mem0 import MemoryClient
 from tqdm import tqdm
 from zep_cloud.client import Zep
@@ -47,6 +48,9 @@ Generate personal memories that follow these guidelines:
 5. Format each memory as a paragraph with a clear narrative structure that captures the person's experience, challenges, and aspirations
 """
 
+# LLM/embedding calls of the MemOS clients
+call_stats = CallStats()
+
 
 def get_client(frame: str, user_id: str | None = None, version: str = "default"):
     if frame == "zep":
@@ -224,7 +228,7 @@ def ingest_session(client, session, frame, metadata, revised_client=None):
     return elapsed_time
 
 
-def process_user(conv_idx, frame, locomo_df, version, num_workers=1):
+def process_user(conv_idx, frame, locomo_df, version, num_workers=1, stats=None):
     try:
         conversation = locomo_df["conversation"].iloc[conv_idx]
         max_session_count = 35
@@ -246,6 +250,9 @@ def process_user(conv_idx, frame, locomo_df, version, num_workers=1):
             speaker_b_user_id = conv_id + "_speaker_b"
             client = get_client("memos", speaker_a_user_id, version)
             revised_client = get_client("memos", speaker_b_user_id, version)
+            call_stats.attach(client)
+            call_stats.attach(revised_client)
+        calls_before = call_stats.snapshot()
 
         sessions_to_process = []
         for session_idx in range(max_session_count):
@@ -282,6 +289,14 @@ def process_user(conv_idx, frame, locomo_df, version, num_workers=1):
                 try:
                     session_time = future.result()
                     total_session_time += session_time
+                    if stats is not None:
+                        stats["sessions"].append(
+                            {
+                                "conv_idx": conv_idx,
+                                "session_key": session_key,
+                                "duration_ms": session_time * 1000,
+                            }
+                        )
                     print(f"User {conv_idx}, {session_key} processed in {session_time} seconds")
                 except Exception as e:
                     print(f"Error processing user {conv_idx}, session {session_key}: {e!s}")
@@ -289,6 +304,16 @@ def process_user(conv_idx, frame, locomo_df, version, num_workers=1):
         end_time = time.time()
         elapsed_time = round(end_time - start_time, 2)
         print(f"User {conv_idx} processed successfully in {elapsed_time} seconds")
+        if stats is not None:
+            # Sessions of a user may run concurrently, so calls are attributed per user
+            stats["users"].append(
+                {
+                    "conv_idx": conv_idx,
+                    "sessions": valid_sessions,
+                    "duration_ms": elapsed_time * 1000,
+                    "calls": call_stats.since(calls_before),
+                }
+            )
 
         return elapsed_time
 
@@ -303,6 +328,7 @@ def main(frame, version="default", num_workers=4):
     num_users = 10
     start_time = time.time()
     total_time = 0
+    stats = {"frame": frame, "sessions": [], "users": []}
 
     print(
         f"Starting processing for {num_users} users in serial mode, each user using {num_workers} workers for sessions..."
@@ -310,7 +336,7 @@ def main(frame, version="default", num_workers=4):
 
     for user_id in range(num_users):
         try:
-            result = process_user(user_id, frame, locomo_df, version, num_workers)
+            result = process_user(user_id, frame, locomo_df, version, num_workers, stats)
             if isinstance(result, float):
                 total_time += result
             else:
@@ -327,6 +353,11 @@ def main(frame, version="default", num_workers=4):
             f"The frame {frame} processed {num_users} users in average of {average_time_formatted} per user."
         )
 
+    stats["calls"] = call_stats.snapshot()
+    stats_path = f"results/locomo/{frame}-{version}/{frame}_locomo_ingestion_stats.json"
+    save_stats(stats, stats_path)
+    print(f"Ingestion latency and call stats saved to {stats_path}")
+
     end_time = time.time()
     elapsed_time = round(end_time - start_time, 2)
     minutes = int(elapsed_time // 60)
@@ -1,9 +1,12 @@
 import argparse
 import json
+import os
 
 import numpy as np
 import pandas as pd
 
+from latency import percentile_row
+
 
 parser = argparse.ArgumentParser()
 parser.add_argument(
@@ -25,6 +28,8 @@ version = args.version
 
 judged_path = f"results/locomo/{lib}-{version}/{lib}_locomo_judged.json"
 grade_path = f"results/locomo/{lib}-{version}/{lib}_locomo_grades.json"
+ingestion_stats_path = f"results/locomo/{lib}-{version}/{lib}_locomo_ingestion_stats.json"
+search_stats_path = f"results/locomo/{lib}-{version}/{lib}_locomo_search_stats.json"
 
 # Load the input data from the file
 with open(judged_path) as file:
@@ -292,6 +297,55 @@ def calculate_scores(data):
     }
 
 
+def load_stats(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def calculate_latency(data, ingestion_stats, search_stats):
+    """p50/p95/p99 latency per stage and LLM/embedding calls per operation."""
+    latency_rows = []
+    for metric in ["search_duration_ms", "response_duration_ms", "total_duration_ms"]:
+        values = [
+            question[metric]
+            for questions in data.values()
+            for question in questions
+            if question.get(metric) is not None
+        ]
+        latency_rows.append(percentile_row(metric, values))
+
+    call_rows = []
+    if ingestion_stats:
+        latency_rows.append(
+            percentile_row(
+                "ingestion_session_duration_ms",
+                [session["duration_ms"] for session in ingestion_stats["sessions"]],
+            )
+        )
+        latency_rows.append(
+            percentile_row(
+                "ingestion_user_duration_ms",
+                [user["duration_ms"] for user in ingestion_stats["users"]],
+            )
+        )
+        sessions = sum(user["sessions"] for user in ingestion_stats["users"])
+        call_rows.append({"stage": "ingestion", "operations": sessions, **ingestion_stats["calls"]})
+
+    if search_stats:
+        queries = sum(user["queries"] for user in search_stats["users"])
+        call_rows.append({"stage": "search", "operations": queries, **search_stats["calls"]})
+
+    # Per-operation averages: per ingested session, per searched query
+    for row in call_rows:
+        operations = row["operations"]
+        for key in [k for k in row if k not in ("stage", "operations")]:
+            row[f"{key}_per_op"] = row[key] / operations if operations else 0.0
+
+    return {"latency": latency_rows, "calls": call_rows}
+
+
 def save_to_excel(results, output_path):
     # Create a combined data structure for metrics and category scores
     combined_data = []
@@ -347,12 +401,22 @@ def save_to_excel(results, output_path):
     # Create a pandas Excel writer
     with pd.ExcelWriter(output_path) as writer:
         combined_df.to_excel(writer, sheet_name="Metrics", index=False)
+        pd.DataFrame(results["latency"]["latency"]).to_excel(
+            writer, sheet_name="Latency", index=False
+        )
+        if results["latency"]["calls"]:
+            pd.DataFrame(results["latency"]["calls"]).to_excel(
+                writer, sheet_name="Calls", index=False
+            )
 
     print(f"Excel file saved to: {output_path}")
 
 
 # Calculate scores
 results = calculate_scores(data)
+results["latency"] = calculate_latency(
+    data, load_stats(ingestion_stats_path), load_stats(search_stats_path)
+)
 
 # Output the result to a file
 with open(grade_path, "w") as outfile:
@@ -377,5 +441,18 @@ for metric in ["response_duration_ms", "search_duration_ms", "total_duration_ms"
     print(f"{metric} (P50): {results['metrics']['duration'][f'{metric}_p50']:.2f} ms")
     print(f"{metric} (P95): {results['metrics']['duration'][f'{metric}_p95']:.2f} ms")
 
+print("\n=== Latency Percentiles ===")
+for row in results["latency"]["latency"]:
+    print(
+        f"{row['metric']}: P50 {row['p50']:.2f} ms, P95 {row['p95']:.2f} ms, "
+        f"P99 {row['p99']:.2f} ms (n={row['count']})"
+    )
+for row in results["latency"]["calls"]:
+    print(
+        f"{row['stage']}: {row['llm_calls_per_op']:.2f} LLM calls, "
+        f"{row['llm_prompt_tokens_per_op'] + row['llm_completion_tokens_per_op']:.0f} LLM tokens, "
+        f"{row['embedding_calls_per_op']:.2f} embedding calls per operation"
+    )
+
 print(f"\nResults have been written to {grade_path}")
 print(f"Excel report has been saved to {excel_path}")
@@ -9,6 +9,7 @@ from time import time
 import pandas as pd
 
 from dotenv import load_dotenv
+from latency import CallStats, save_stats
 from mem0 import MemoryClient
 from tqdm import tqdm
 from utils import filter_memory_data
@@ -47,6 +48,9 @@ def get_client(frame: str, user_id: str | None = None, version: str = "default",
         return mos
 
 
+# LLM/embedding calls of the MemOS clients
+call_stats = CallStats()
+
 TEMPLATE_ZEP = """
 FACTS and ENTITIES represent relevant context to the current conversation.
 
@@ -334,7 +338,7 @@ def load_existing_results(frame, version, group_idx):
     return {}, False
 
 
-def process_user(group_idx, locomo_df, frame, version, top_k=20, num_workers=1):
+def process_user(group_idx, locomo_df, frame, version, top_k=20, num_workers=1, stats=None):
     search_results = defaultdict(list)
     qa_set = locomo_df["qa"].iloc[group_idx]
     conversation = locomo_df["conversation"].iloc[group_idx]
@@ -364,8 +368,11 @@ def process_user(group_idx, locomo_df, frame, version, top_k=20, num_workers=1):
         speaker_b_user_id = conv_id + "_speaker_b"
         client = get_client(frame, speaker_a_user_id, version, top_k=top_k)
         reversed_client = get_client(frame, speaker_b_user_id, version, top_k=top_k)
+        call_stats.attach(client)
+        call_stats.attach(reversed_client)
     else:
         client = get_client(frame, conv_id, version)
+    calls_before = call_stats.snapshot()
 
     def process_qa(qa):
         query = qa.get("question")
@@ -402,6 +409,16 @@ def process_user(group_idx, locomo_df, frame, version, top_k=20, num_workers=1):
                 )
                 search_results[conv_id].append(result)
 
+    if stats is not None:
+        # Queries of a user may run concurrently, so calls are attributed per user
+        stats["users"].append(
+            {
+                "conv_idx": group_idx,
+                "queries": len(search_results[conv_id]),
+                "calls": call_stats.since(calls_before),
+            }
+        )
+
     os.makedirs(f"results/locomo/{frame}-{version}/tmp/", exist_ok=True)
     with open(
         f"results/locomo/{frame}-{version}/tmp/{frame}_locomo_search_results_{group_idx}.json", "w"
@@ -419,11 +436,12 @@ def main(frame, version="default", num_workers=1, top_k=20):
     num_users = 10
     os.makedirs(f"results/locomo/{frame}-{version}/", exist_ok=True)
     all_search_results = defaultdict(list)
+    stats = {"frame": frame, "users": []}
 
     for idx in range(num_users):
         try:
             print(f"Processing user {idx}...")
-            user_results = process_user(idx, locomo_df, frame, version, top_k, num_workers)
+            user_results = process_user(idx, locomo_df, frame, version, top_k, num_workers, stats)
             for conv_id, results in user_results.items():
                 all_search_results[conv_id].extend(results)
         except Exception as e:
@@ -433,6 +451,10 @@ def main(frame, version="default", num_workers=1, top_k=20):
         json.dump(dict(all_search_results), f, indent=2)
         print("Save all search results")
 
+    stats["calls"] = call_stats.snapshot()
+    save_stats(stats, f"results/locomo/{frame}-{version}/{frame}_locomo_search_stats.json")
+    print("Save search call stats")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
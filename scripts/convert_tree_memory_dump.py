@@ -0,0 +1,28 @@
+import argparse
+import json
+
+from memos.memories.textual.tree_text_memory.columnar_dump import convert_json_dump
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert a TreeTextMemory JSON dump into the columnar dump format."
+    )
+    parser.add_argument("json_file", type=str, help="Path of the JSON dump.")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output directory (defaults to the JSON path with a .columnar suffix).",
+    )
+    parser.add_argument(
+        "--embedding-dtype",
+        type=str,
+        default="float32",
+        choices=["float32", "float16", "int8"],
+        help="Storage dtype of the embedding matrix.",
+    )
+    args = parser.parse_args()
+    output = args.output or args.json_file.rsplit(".", 1)[0] + ".columnar"
+    manifest = convert_json_dump(args.json_file, output, embedding_dtype=args.embedding_dtype)
+    print(json.dumps(manifest, indent=2))
@@ -6,9 +6,10 @@ from typing import Any, Generic, TypeVar
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from pydantic import BaseModel, Field
 
+from memos import telemetry
 from memos.configs.mem_os import MOSConfig
 from memos.mem_os.main import MOS
 from memos.mem_user.user_manager import UserManager, UserRole
@@ -41,6 +42,12 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Pipeline metrics are served at /metrics; OpenTelemetry spans are opt-in
+telemetry.configure(
+    metrics=os.getenv("MOS_METRICS_ENABLED", "true").lower() == "true",
+    tracing=os.getenv("MOS_TRACING_ENABLED", "false").lower() == "true",
+)
+
 # Initialize MOS instance with lazy initialization
 MOS_INSTANCE = None
 
@@ -401,6 +408,14 @@ async def home():
     return RedirectResponse(url="/docs", status_code=307)
 
 
+@app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics():
+    """Expose pipeline stage durations, errors and token usage in the Prometheus format."""
+    return PlainTextResponse(
+        telemetry.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Handle ValueError exceptions globally."""
@@ -15,6 +15,16 @@ class BaseInternetRetrieverConfig(BaseConfig):
     search_engine_id: str | None = Field(
         None, description="Search engine ID (required for Google Custom Search)"
     )
+    timeout: float = Field(default=10.0, description="Timeout in seconds of each HTTP request")
+    max_workers: int = Field(
+        default=4, description="Result pages fetched concurrently (and pooled connections)"
+    )
+    cache_ttl_seconds: float = Field(
+        default=600.0,
+        description="Seconds the results of a query are reused before searching again; "
+        "0 disables the cache",
+    )
+    cache_max_entries: int = Field(default=256, description="Maximum number of cached queries")
 
 
 class GoogleCustomSearchConfig(BaseInternetRetrieverConfig):
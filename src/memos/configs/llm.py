@@ -44,11 +44,34 @@ class HFLLMConfig(BaseLLMConfig):
     )
 
 
+class LLMCacheConfig(BaseConfig):
+    """Configuration for the LLM response cache."""
+
+    max_entries: int = Field(default=1024, description="Maximum number of cached responses")
+    ttl_seconds: float | None = Field(
+        default=3600.0,
+        description="Seconds a cached response stays valid; None keeps it until evicted",
+    )
+    sqlite_path: str | None = Field(
+        default=None,
+        description="Optional SQLite file to persist cached responses across processes and runs",
+    )
+    cache_sampled_calls: bool = Field(
+        default=False,
+        description="Also cache calls with temperature > 0. By default only deterministic "
+        "(temperature 0) calls and calls made with `cache=True` are cached",
+    )
+
+
 class LLMConfigFactory(BaseConfig):
     """Factory class for creating LLM configurations."""
 
     backend: str = Field(..., description="Backend for LLM")
     config: dict[str, Any] = Field(..., description="Configuration for the LLM backend")
+    cache: LLMCacheConfig | None = Field(
+        default=None,
+        description="Response cache configuration; the cache is disabled when not set",
+    )
 
     backend_to_class: ClassVar[dict[str, Any]] = {
         "openai": OpenAILLMConfig,
@@ -7,10 +7,57 @@ from memos.mem_scheduler.modules.schemas import (
     DEFAULT_ACT_MEM_DUMP_PATH,
     DEFAULT_ACTIVATION_MEM_SIZE,
     DEFAULT_CONSUME_INTERVAL_SECONDS,
+    DEFAULT_EVIDENCE_SEARCH_TIMEOUT_SECONDS,
+    DEFAULT_INTENT_COVERAGE_HIGH,
+    DEFAULT_INTENT_COVERAGE_LOW,
+    DEFAULT_QUERY_LIST_CAPACITY,
     DEFAULT_THREAD__POOL_MAX_WORKERS,
 )
 
 
+class RedisStreamQueueConfig(BaseConfig):
+    """Redis Streams consumer group used as the scheduler message queue."""
+
+    url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    stream_key: str = Field(
+        default="memos:scheduler:messages", description="Stream holding scheduler messages"
+    )
+    consumer_group: str = Field(
+        default="memos-scheduler",
+        description="Consumer group shared by all scheduler processes consuming the stream",
+    )
+    consumer_name: str | None = Field(
+        default=None,
+        description="Name of this consumer within the group (default: <hostname>-<pid>)",
+    )
+    batch_size: int = Field(
+        default=32, gt=0, description="Maximum number of messages read per XREADGROUP call"
+    )
+    block_ms: int = Field(
+        default=2000, gt=0, description="How long XREADGROUP blocks waiting for new messages"
+    )
+    claim_idle_ms: int = Field(
+        default=60000,
+        gt=0,
+        description="Pending messages idle for longer than this (e.g. from a crashed "
+        "consumer) are reclaimed and processed again",
+    )
+    max_deliveries: int = Field(
+        default=5,
+        gt=0,
+        description="Deliveries after which a message that keeps failing is moved to the "
+        "dead-letter stream instead of being reclaimed again",
+    )
+    dead_letter_stream: str | None = Field(
+        default="memos:scheduler:dead-letter",
+        description="Stream receiving messages over `max_deliveries`; None drops them",
+    )
+    max_stream_length: int | None = Field(
+        default=100000,
+        description="Approximate cap on the stream length when adding messages; None disables trimming",
+    )
+
+
 class BaseSchedulerConfig(BaseConfig):
     """Base configuration class for mem_scheduler."""
 
@@ -33,6 +80,11 @@ class BaseSchedulerConfig(BaseConfig):
         le=60,
         description=f"Interval for consuming messages from queue in seconds (default: {DEFAULT_CONSUME_INTERVAL_SECONDS})",
     )
+    redis_stream: RedisStreamQueueConfig | None = Field(
+        default=None,
+        description="Use a Redis Streams consumer group instead of the in-process queue, "
+        "so several scheduler processes can share the load",
+    )
 
 
 class GeneralSchedulerConfig(BaseSchedulerConfig):
@@ -50,6 +102,36 @@ class GeneralSchedulerConfig(BaseSchedulerConfig):
         default=DEFAULT_ACT_MEM_DUMP_PATH,  # Replace with DEFAULT_ACT_MEM_DUMP_PATH
         description="File path for dumping activation memory",
     )
+    enable_intent_precheck: bool = Field(
+        default=True,
+        description="Decide clear-cut turns by query/working-memory embedding similarity "
+        "and only call the LLM intent detector for ambiguous ones",
+    )
+    intent_coverage_high: float = Field(
+        default=DEFAULT_INTENT_COVERAGE_HIGH,
+        ge=-1.0,
+        le=1.0,
+        description="Cosine coverage at or above which working memory is considered "
+        "sufficient and retrieval is skipped",
+    )
+    intent_coverage_low: float = Field(
+        default=DEFAULT_INTENT_COVERAGE_LOW,
+        ge=-1.0,
+        le=1.0,
+        description="Cosine coverage at or below which retrieval is triggered for the query "
+        "without asking the LLM",
+    )
+    query_list_capacity: int = Field(
+        default=DEFAULT_QUERY_LIST_CAPACITY,
+        gt=0,
+        description="Number of recent queries kept per user and memory cube",
+    )
+    evidence_search_timeout: float = Field(
+        default=DEFAULT_EVIDENCE_SEARCH_TIMEOUT_SECONDS,
+        gt=0,
+        description="Deadline in seconds for the batched missing-evidence searches; scopes "
+        "that have not answered by then are left out of the working-memory refresh",
+    )
 
 
 class SchedulerConfigFactory(BaseConfig):
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field, field_validator, model_validator
 
@@ -7,6 +7,7 @@ from memos.configs.embedder import EmbedderConfigFactory
 from memos.configs.graph_db import GraphDBConfigFactory
 from memos.configs.internet_retriever import InternetRetrieverConfigFactory
 from memos.configs.llm import LLMConfigFactory
+from memos.configs.reranker import RerankerConfigFactory
 from memos.configs.vec_db import VectorDBConfigFactory
 from memos.exceptions import ConfigurationError
 
@@ -133,6 +134,64 @@ class GeneralTextMemoryConfig(BaseTextMemoryConfig):
     )
 
 
+class SearchDeadlineConfig(BaseConfig):
+    """
+    Deadlines, in seconds, of the parallel retrieval paths of tree memory search.
+
+    A path that misses its deadline is left to finish in the background and the
+    search returns the results of the other paths, marked as partial. None waits
+    for the path to finish.
+    """
+
+    working_memory: float | None = Field(None, description="Working memory retrieval path")
+    long_term: float | None = Field(None, description="Long-term and user memory retrieval path")
+    internet: float | None = Field(None, description="Internet retrieval path")
+    total: float | None = Field(
+        None, description="Budget of the whole search, from the start of goal parsing"
+    )
+
+
+class ReorganizerConfig(BaseConfig):
+    """
+    Background reorganization of tree memory: near-duplicate activated nodes of a
+    scope are clustered by embedding similarity and merged in batches, and
+    optionally, similar pairs are checked for contradictions by the dispatcher LLM.
+    """
+
+    enabled: bool = Field(False, description="Run the reorganizer on a background thread")
+    interval_seconds: float = Field(
+        600.0, gt=0, description="Pause between the end of one pass and the start of the next"
+    )
+    scopes: list[Literal["WorkingMemory", "LongTermMemory", "UserMemory"]] = Field(
+        default_factory=lambda: ["LongTermMemory", "UserMemory"],
+        description="Memory types reorganized by each pass",
+    )
+    merge_threshold: float = Field(
+        0.92, description="Cosine similarity from which two nodes are merged as duplicates"
+    )
+    conflict_threshold: float | None = Field(
+        None,
+        description="Cosine similarity from which pairs below `merge_threshold` are checked "
+        "for contradictions by the LLM; None disables conflict detection",
+    )
+    block_size: int = Field(
+        1024, gt=0, description="Rows per block of the blocked similarity matrix product"
+    )
+    max_merges_per_run: int = Field(
+        500, ge=0, description="Maximum number of nodes archived into duplicates per pass"
+    )
+    max_conflict_checks_per_run: int = Field(
+        20, ge=0, description="Maximum number of LLM conflict checks per pass"
+    )
+    cpu_budget: float = Field(
+        1.0,
+        gt=0,
+        le=1,
+        description="Fraction of one core a pass may use; the pass sleeps between blocks "
+        "to stay under it",
+    )
+
+
 class TreeTextMemoryConfig(BaseTextMemoryConfig):
     """Tree text memory configuration class."""
 
@@ -160,6 +219,43 @@ class TreeTextMemoryConfig(BaseTextMemoryConfig):
         None,
         description="Internet retriever configuration (optional)",
     )
+    cache_working_memory: bool = Field(
+        True,
+        description="Serve working memory reads from an in-process snapshot that is refreshed "
+        "after writes through this memory. Disable if other processes write the same graph.",
+    )
+    background_eviction: bool = Field(
+        False,
+        description="Evict memories over the per-type capacity on a background maintenance "
+        "thread instead of at the end of every `add`",
+    )
+    inline_dedup: bool = Field(
+        True,
+        description="Check every new long-term or user memory against its nearest neighbors "
+        "and merge near-duplicates on `add`. Disable when the reorganizer deduplicates.",
+    )
+    reorganizer: ReorganizerConfig = Field(
+        default_factory=ReorganizerConfig,
+        description="Background deduplication and conflict detection of the memory graph",
+    )
+    reranker: RerankerConfigFactory | None = Field(
+        None,
+        description="Reranker used by the 'balanced' search mode (optional)",
+    )
+    search_deadlines: SearchDeadlineConfig = Field(
+        default_factory=SearchDeadlineConfig,
+        description="Per-path and overall deadlines of the parallel retrieval in `search`",
+    )
+    dump_format: Literal["json", "columnar"] = Field(
+        "json",
+        description="On-disk format used by `dump`: a single JSON file, or a columnar "
+        "directory with a float32 embedding matrix and JSON Lines nodes/edges",
+    )
+    dump_embedding_dtype: Literal["float32", "float16", "int8"] = Field(
+        "float32",
+        description="Storage dtype of embeddings in columnar dumps. float16 halves and int8 "
+        "(with a per-vector scale) quarters the embedding matrix; loads restore float32.",
+    )
 
 
 # ─── 3. Global Memory Config Factory ──────────────────────────────────────────
@@ -0,0 +1,62 @@
+"""Configuration classes for search rerankers."""
+
+from typing import Any, ClassVar, Literal
+
+from pydantic import Field, field_validator, model_validator
+
+from memos.configs.base import BaseConfig
+from memos.exceptions import ConfigurationError
+
+
+class BaseRerankerConfig(BaseConfig):
+    """Base configuration class for rerankers."""
+
+    top_n: int = Field(
+        default=20,
+        description="Number of best retrieval candidates passed to the reranker",
+    )
+
+
+class CrossEncoderRerankerConfig(BaseRerankerConfig):
+    """Configuration class for a local sentence-transformers cross-encoder."""
+
+    model_name_or_path: str = Field(
+        default="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        description="Cross-encoder model name or local path",
+    )
+    device: str = Field(default="cpu", description="Device to run the model on")
+    model_backend: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description="Inference backend; 'onnx' requires the onnxruntime extra of sentence-transformers",
+    )
+    batch_size: int = Field(default=32, description="Number of pairs scored per forward pass")
+    max_length: int = Field(default=512, description="Maximum tokens of a (query, memory) pair")
+    trust_remote_code: bool = Field(
+        default=False,
+        description="Whether to trust remote code when loading the model",
+    )
+
+
+class RerankerConfigFactory(BaseConfig):
+    """Factory class for creating reranker configurations."""
+
+    backend: str = Field(..., description="Backend for the reranker")
+    config: dict[str, Any] = Field({}, description="Configuration for the reranker backend")
+
+    backend_to_class: ClassVar[dict[str, Any]] = {
+        "cross_encoder": CrossEncoderRerankerConfig,
+    }
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, backend: str) -> str:
+        """Validate the backend field."""
+        if backend not in cls.backend_to_class:
+            raise ConfigurationError(f"Invalid reranker backend: {backend}")
+        return backend
+
+    @model_validator(mode="after")
+    def create_config(self) -> "RerankerConfigFactory":
+        config_class = self.backend_to_class[self.backend]
+        self.config = config_class(**self.config)
+        return self
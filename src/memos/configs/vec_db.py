@@ -27,6 +27,47 @@ class QdrantVecDBConfig(BaseVecDBConfig):
     host: str | None = Field(default=None, description="Host for Qdrant")
     port: int | None = Field(default=None, description="Port for Qdrant")
     path: str | None = Field(default=None, description="Path for Qdrant")
+    prefer_grpc: bool = Field(
+        default=False,
+        description="Whether to talk to a Qdrant server over gRPC instead of HTTP (ignored in local mode)",
+    )
+    grpc_port: int = Field(default=6334, description="gRPC port for Qdrant")
+    upload_batch_size: int = Field(
+        default=256, description="Number of points sent per upsert request in bulk inserts"
+    )
+    upload_workers: int = Field(
+        default=4,
+        description="Number of concurrent upsert requests in bulk inserts (local mode always uses 1)",
+    )
+    vector_datatype: Literal["float32", "float16"] = Field(
+        default="float32",
+        description="Storage datatype of the vectors. float16 halves vector memory with "
+        "negligible recall loss for typical text embeddings. For 8-bit vectors use "
+        "`quantization='int8'`, which rescores with the original vectors.",
+    )
+    quantization: Literal["int8", "binary"] | None = Field(
+        default=None,
+        description="Qdrant native quantization kept in RAM for the ANN stage. Results are "
+        "rescored with the original vectors, so only candidate generation is approximate.",
+    )
+    quantization_oversampling: float = Field(
+        default=2.0,
+        description="How many times top_k candidates are fetched from the quantized index "
+        "before full-precision rescoring",
+    )
+    payload_indexes: dict[
+        str, Literal["keyword", "integer", "float", "bool", "datetime", "text", "uuid"]
+    ] = Field(
+        default_factory=lambda: {
+            "metadata.user_id": "keyword",
+            "metadata.session_id": "keyword",
+            "metadata.status": "keyword",
+            "metadata.tags": "keyword",
+            "metadata.updated_at": "datetime",
+        },
+        description="Payload fields to index when the collection is created, mapped to their "
+        "Qdrant schema type. Indexed fields make filtered search a pre-filter instead of a scan.",
+    )
 
     @model_validator(mode="after")
     def set_default_path(self):
@@ -1,5 +1,6 @@
 from ollama import Client
 
+from memos import telemetry
 from memos.configs.embedder import OllamaEmbedderConfig
 from memos.embedders.base import BaseEmbedder
 from memos.log import get_logger
@@ -67,8 +68,10 @@ class OllamaEmbedder(BaseEmbedder):
         Returns:
             List of embeddings, each represented as a list of floats.
         """
-        response = self.client.embed(
-            model=self.config.model_name_or_path,
-            input=texts,
-        )
+        with telemetry.span("embed", backend="ollama", num_texts=len(texts)):
+            response = self.client.embed(
+                model=self.config.model_name_or_path,
+                input=texts,
+            )
+        telemetry.record_embedding("ollama", len(texts))
         return response.embeddings
@@ -1,5 +1,6 @@
 from sentence_transformers import SentenceTransformer
 
+from memos import telemetry
 from memos.configs.embedder import SenTranEmbedderConfig
 from memos.embedders.base import BaseEmbedder
 from memos.log import get_logger
@@ -36,5 +37,7 @@ class SenTranEmbedder(BaseEmbedder):
         Returns:
             List of embeddings, each represented as a list of floats.
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        with telemetry.span("embed", backend="sentence_transformer", num_texts=len(texts)):
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+        telemetry.record_embedding("sentence_transformer", len(texts))
         return embeddings.tolist()
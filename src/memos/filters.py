@@ -0,0 +1,124 @@
+"""Backend-agnostic metadata filter language.
+
+Filters are plain Python structures so they can be written in configs, passed over the
+API and shared between the graph store (`Neo4jGraphDB.get_by_metadata`) and the vector
+store (`QdrantVecDB.search`). Each backend compiles the normalized tree into its own
+query language.
+
+Accepted forms:
+
+- A condition: ``{"field": "user_id", "op": "=", "value": "u1"}``
+- A logical group: ``{"and": [...]}``, ``{"or": [...]}``, ``{"not": <filter>}``
+- A list of filters, combined with AND (the historical `get_by_metadata` format)
+- A plain mapping ``{"user_id": "u1", "status": "activated"}``, meaning exact matches
+  combined with AND (the historical `QdrantVecDB` format)
+
+Supported operators: ``=``, ``!=``, ``in``, ``not_in``, ``contains`` (array field shares at
+least one value), ``starts_with``, ``ends_with``, ``>``, ``>=``, ``<``, ``<=``.
+"""
+
+import re
+
+from typing import Any, TypeAlias
+
+
+MetadataFilter: TypeAlias = dict[str, Any] | list[Any]
+
+COMPARISON_OPS = {
+    "=",
+    "!=",
+    "in",
+    "not_in",
+    "contains",
+    "starts_with",
+    "ends_with",
+    ">",
+    ">=",
+    "<",
+    "<=",
+}
+RANGE_OPS = {">", ">=", "<", "<="}
+LOGICAL_OPS = {"and", "or", "not"}
+
+_FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def normalize_filter(filters: MetadataFilter | None) -> dict[str, Any] | None:
+    """
+    Convert any accepted filter form into a canonical tree.
+
+    The returned tree only contains ``{"and": [...]}``, ``{"or": [...]}``,
+    ``{"not": node}`` and ``{"field": ..., "op": ..., "value": ...}`` nodes.
+
+    Args:
+        filters: Filter in any of the accepted forms, or None.
+
+    Returns:
+        The canonical filter tree, or None if there is nothing to filter on.
+
+    Raises:
+        ValueError: If the filter is malformed or uses an unknown operator.
+    """
+    if filters is None:
+        return None
+
+    if isinstance(filters, list):
+        children = [node for node in (normalize_filter(f) for f in filters) if node]
+        return {"and": children} if children else None
+
+    if not isinstance(filters, dict):
+        raise ValueError(f"Unsupported filter type: {type(filters).__name__}")
+
+    if not filters:
+        return None
+
+    logical_keys = LOGICAL_OPS & filters.keys()
+    if logical_keys:
+        if len(filters) != 1:
+            raise ValueError(f"Logical filter must have exactly one key, got: {list(filters)}")
+        op = logical_keys.pop()
+        if op == "not":
+            child = normalize_filter(filters["not"])
+            if child is None:
+                raise ValueError("'not' filter requires a non-empty operand")
+            return {"not": child}
+        operands = filters[op]
+        if not isinstance(operands, list):
+            raise ValueError(f"'{op}' filter expects a list of filters")
+        children = [node for node in (normalize_filter(f) for f in operands) if node]
+        return {op: children} if children else None
+
+    if "field" in filters:
+        return _normalize_condition(filters)
+
+    # Plain mapping of exact matches
+    return {
+        "and": [
+            _normalize_condition({"field": field, "op": "=", "value": value})
+            for field, value in filters.items()
+        ]
+    }
+
+
+def _normalize_condition(condition: dict[str, Any]) -> dict[str, Any]:
+    unknown_keys = set(condition) - {"field", "op", "value"}
+    if unknown_keys:
+        raise ValueError(f"Unknown keys in filter condition: {sorted(unknown_keys)}")
+
+    field = condition["field"]
+    op = condition.get("op", "=")
+    if "value" not in condition:
+        raise ValueError(f"Filter condition on '{field}' is missing a value")
+    value = condition["value"]
+
+    if not isinstance(field, str) or not _FIELD_PATTERN.match(field):
+        raise ValueError(f"Invalid filter field name: {field!r}")
+    if op not in COMPARISON_OPS:
+        raise ValueError(f"Unsupported operator: {op}")
+
+    if op in {"in", "not_in", "contains"} and not isinstance(value, list | tuple | set):
+        value = [value]
+    if isinstance(value, tuple | set):
+        value = list(value)
+
+    return {"field": field, "op": op, "value": value}
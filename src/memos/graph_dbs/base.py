@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Literal
 
+from memos.filters import MetadataFilter
+
 
 class BaseGraphDB(ABC):
     """
@@ -146,13 +148,41 @@ class BaseGraphDB(ABC):
         """
 
     @abstractmethod
-    def get_by_metadata(self, filters: dict[str, Any]) -> list[str]:
+    def search_by_fulltext(self, text: str, top_k: int = 5) -> list[dict]:
+        """
+        Retrieve node IDs by lexical (keyword) relevance of their memory text and key.
+
+        Args:
+            text (str): Free-text query; it is tokenized, not parsed as a query language.
+            top_k (int): Number of top matching nodes to retrieve.
+
+        Returns:
+            list[dict]: A list of dicts with 'id' and 'score', ordered by relevance.
+        """
+
+    @abstractmethod
+    def search_by_embeddings(self, vectors: list[list[float]], top_k: int = 5) -> list[list[dict]]:
+        """
+        Run several vector similarity searches in one round trip.
+
+        Args:
+            vectors (list[list[float]]): Query embeddings.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+
+        Returns:
+            list[list[dict]]: For each input vector, a list of dicts with 'id' and 'score',
+            ordered by similarity.
+        """
+
+    @abstractmethod
+    def get_by_metadata(self, filters: MetadataFilter) -> list[str]:
         """
         Retrieve node IDs that match given metadata filters.
 
         Args:
-            filters (dict[str, Any]): A dictionary of attribute-value filters.
-                Example: {"topic": "psychology", "importance": 2}
+            filters (MetadataFilter): Filter in the shared filter language (`memos.filters`).
+                Example: [{"field": "topic", "op": "=", "value": "psychology"},
+                          {"field": "importance", "op": ">=", "value": 2}]
 
         Returns:
             list[str]: Node IDs whose metadata match the filter conditions.
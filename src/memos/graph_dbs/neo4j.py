@@ -1,11 +1,14 @@
+import re
 import time
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal
 
 from neo4j import GraphDatabase
 
 from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.filters import MetadataFilter, normalize_filter
 from memos.graph_dbs.base import BaseGraphDB
 from memos.log import get_logger
 
@@ -24,6 +27,50 @@ def _parse_node(node_data: dict[str, Any]) -> dict[str, Any]:
     return {"id": node.pop("id"), "memory": node.pop("memory", ""), "metadata": node}
 
 
+def _filter_to_cypher(node: dict[str, Any], params: dict[str, Any], alias: str = "n") -> str:
+    """
+    Compile a normalized filter tree (see `memos.filters`) into a Cypher WHERE expression.
+    Values are bound as parameters and collected into `params`.
+    """
+    if "and" in node:
+        return "(" + " AND ".join(_filter_to_cypher(c, params, alias) for c in node["and"]) + ")"
+    if "or" in node:
+        return "(" + " OR ".join(_filter_to_cypher(c, params, alias) for c in node["or"]) + ")"
+    if "not" in node:
+        return f"(NOT {_filter_to_cypher(node['not'], params, alias)})"
+
+    field, op, value = node["field"], node["op"], node["value"]
+    param_key = f"val{len(params)}"
+    params[param_key] = value
+    prop = f"{alias}.{field}"
+    param = f"${param_key}"
+    if field in ("created_at", "updated_at") and isinstance(value, str):
+        # Timestamps are stored as Neo4j datetimes
+        param = f"datetime(${param_key})"
+
+    if op == "=":
+        return f"{prop} = {param}"
+    if op == "!=":
+        return f"{prop} <> {param}"
+    if op == "in":
+        return f"{prop} IN {param}"
+    if op == "not_in":
+        return f"NOT {prop} IN {param}"
+    if op == "contains":
+        return f"ANY(x IN {param} WHERE x IN {prop})"
+    if op == "starts_with":
+        return f"{prop} STARTS WITH {param}"
+    if op == "ends_with":
+        return f"{prop} ENDS WITH {param}"
+    if op in (">", ">=", "<", "<="):
+        return f"{prop} {op} {param}"
+    raise ValueError(f"Unsupported operator: {op}")
+
+
+# Relationship types are interpolated into Cypher, so only plain upper-case names are allowed
+_RELATIONSHIP_TYPE = re.compile(r"[A-Z_][A-Z0-9_]*")
+
+
 def _compose_node(item: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
     node_id = item["id"]
     memory = item["memory"]
@@ -31,6 +78,66 @@ def _compose_node(item: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
     return node_id, memory, metadata
 
 
+def _node_row(node: dict[str, Any]) -> dict[str, Any]:
+    """Query parameters of a node (`{"id", "memory", "metadata"}`), as used by SET clauses."""
+    id, memory, metadata = _compose_node(node)
+    metadata = _prepare_node_metadata(dict(metadata))
+    return {
+        "id": id,
+        "memory": memory,
+        "created_at": metadata.pop("created_at"),
+        "updated_at": metadata.pop("updated_at"),
+        "metadata": metadata,
+    }
+
+
+def _list_union_cypher(field: str) -> str:
+    """Cypher expression: list property `field` of `m` plus new values from `duplicates`."""
+    return (
+        f"reduce(acc = coalesce(m.{field}, []), d IN duplicates | "
+        f"acc + [v IN coalesce(d.{field}, []) WHERE NOT v IN acc])"
+    )
+
+
+def _inheritable_edge_types(tx, ids: list[str]) -> list[str]:
+    """Types of the non-lineage edges of the nodes `ids`, read inside transaction `tx`."""
+    result = tx.run(
+        """
+        MATCH (o:Memory)-[r]-(:Memory)
+        WHERE o.id IN $ids AND type(r) <> 'MERGED_TO'
+        RETURN DISTINCT type(r) AS type
+        """,
+        ids=ids,
+    )
+    return [record["type"] for record in result]
+
+
+def _inherit_edges_cypher(edge_types: list[str]) -> str:
+    """
+    Cypher subqueries moving the `edge_types` edges of node `o` to node `m`, unless an
+    edge of the same type already connects `m` to the same neighbor.
+
+    Relationship types cannot be query parameters, so the caller reads the types
+    present (see `_inheritable_edge_types`) and gets one subquery per type and direction.
+    """
+    return "".join(
+        f"""
+        CALL {{
+            WITH o, m
+            MATCH (o){left}[r:{edge_type}]{right}(x:Memory)
+            WHERE x <> o AND x <> m
+            DELETE r
+            WITH DISTINCT m, x
+            WHERE NOT EXISTS {{ (m)-[:{edge_type}]-(x) }}
+            CREATE (m){left}[:{edge_type}]{right}(x)
+        }}
+        """
+        for edge_type in edge_types
+        # Outgoing, then incoming edges of the original node
+        for left, right in (("-", "->"), ("<-", "-"))
+    )
+
+
 def _prepare_node_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     """
     Ensure metadata has proper datetime fields and normalized types.
@@ -74,13 +181,18 @@ class Neo4jGraphDB(BaseGraphDB):
         index_name: str = "memory_vector_index",
     ) -> None:
         """
-        Create the vector index for embedding and datetime indexes for created_at and updated_at fields.
+        Create the vector index for embedding, the full-text index for memory and key,
+        datetime indexes for created_at and updated_at fields, and the uniqueness
+        constraint on structure node keys, then key legacy structure nodes.
         """
         # Create vector index if it doesn't exist
         if not self._vector_index_exists(index_name):
             self._create_vector_index(label, vector_property, dimensions, index_name)
         # Create indexes
         self._create_basic_property_indexes()
+        self._create_structure_key_constraint()
+        self._migrate_legacy_structure_nodes()
+        self._create_fulltext_index(label)
 
     def get_memory_count(self, memory_type: str) -> int:
         query = """
@@ -110,6 +222,34 @@ class Neo4jGraphDB(BaseGraphDB):
         with self.driver.session(database=self.db_name) as session:
             session.run(query)
 
+    def delete_oldest_memory(self, memory_type: str, count: int) -> int:
+        """
+        Delete the `count` least recently updated nodes of a memory type.
+
+        Unlike `remove_oldest_memory`, this does not sort all nodes of the type: the
+        (memory_type, updated_at) index yields the oldest ones in order.
+
+        Args:
+            memory_type (str): Memory type (e.g., 'WorkingMemory', 'LongTermMemory').
+            count (int): Number of nodes to delete.
+
+        Returns:
+            int: Number of nodes deleted.
+        """
+        if count <= 0:
+            return 0
+        query = """
+        MATCH (n:Memory)
+        WHERE n.memory_type = $memory_type AND n.updated_at IS NOT NULL
+        WITH n ORDER BY n.updated_at ASC
+        LIMIT $count
+        DETACH DELETE n
+        RETURN count(*) AS deleted
+        """
+        with self.driver.session(database=self.db_name) as session:
+            result = session.run(query, memory_type=memory_type, count=count)
+            return result.single()["deleted"]
+
     def add_node(self, id: str, memory: str, metadata: dict[str, Any]) -> None:
         # Safely process metadata
         metadata = _prepare_node_metadata(metadata)
@@ -203,6 +343,68 @@ class Neo4jGraphDB(BaseGraphDB):
                 target=target_id,
             )
 
+    def add_merged_node(
+        self,
+        original_id: str,
+        merged_node: dict[str, Any],
+        archived_source: dict[str, Any],
+        related_ids: list[str] | None = None,
+    ) -> None:
+        """
+        Record the merge of a new memory into an existing node, in one transaction.
+
+        The merged node and the archived copy of the new memory are created, both and
+        the (now archived) original get a MERGED_TO edge to the merged node, the
+        original's other edges move to the merged node (unless an edge of the same
+        type already connects it to the same neighbor), and the merged node gets a
+        RELATE edge to each of `related_ids` it is not yet connected to.
+
+        Args:
+            original_id: ID of the existing node merged into.
+            merged_node: The merged node, as `{"id", "memory", "metadata"}`.
+            archived_source: The archived new memory, as `{"id", "memory", "metadata"}`.
+            related_ids: IDs of other similar nodes to relate the merged node to.
+        """
+        params = {
+            "original_id": original_id,
+            "merged": _node_row(merged_node),
+            "source": _node_row(archived_source),
+            "related_ids": related_ids or [],
+        }
+
+        def merge(tx) -> None:
+            inherit = _inherit_edges_cypher(_inheritable_edge_types(tx, [original_id]))
+            tx.run(
+                f"""
+                MATCH (o:Memory {{id: $original_id}})
+                SET o.status = 'archived'
+                CREATE (m:Memory {{id: $merged.id}})
+                SET m.memory = $merged.memory,
+                    m.created_at = datetime($merged.created_at),
+                    m.updated_at = datetime($merged.updated_at),
+                    m += $merged.metadata
+                CREATE (s:Memory {{id: $source.id}})
+                SET s.memory = $source.memory,
+                    s.created_at = datetime($source.created_at),
+                    s.updated_at = datetime($source.updated_at),
+                    s += $source.metadata
+                CREATE (o)-[:MERGED_TO]->(m), (s)-[:MERGED_TO]->(m)
+                WITH o, m
+                {inherit}
+                CALL {{
+                    WITH m
+                    UNWIND $related_ids AS related_id
+                    MATCH (x:Memory {{id: related_id}})
+                    WHERE NOT EXISTS {{ (m)--(x) }}
+                    CREATE (m)-[:RELATE]->(x)
+                }}
+                """,
+                params,
+            ).consume()
+
+        with self.driver.session(database=self.db_name) as session:
+            session.execute_write(merge)
+
     def edge_exists(
         self, source_id: str, target_id: str, type: str = "ANY", direction: str = "OUTGOING"
     ) -> bool:
@@ -255,6 +457,53 @@ class Neo4jGraphDB(BaseGraphDB):
             record = result.single()
             return _parse_node(dict(record["n"])) if record else None
 
+    def get_structure_node(self, structure_key: str) -> str | None:
+        """
+        Look up a structure node by its unique `structure_key` (an indexed lookup).
+
+        Returns:
+            The node ID, or None if no structure node has this key.
+        """
+        with self.driver.session(database=self.db_name) as session:
+            record = session.run(
+                "MATCH (n:Memory {structure_key: $structure_key}) RETURN n.id AS id",
+                structure_key=structure_key,
+            ).single()
+            return record["id"] if record else None
+
+    def merge_structure_node(
+        self, structure_key: str, id: str, memory: str, metadata: dict[str, Any]
+    ) -> tuple[str, bool]:
+        """
+        Get or atomically create the structure node with `structure_key`.
+
+        The uniqueness constraint on `structure_key` makes concurrent calls for the same
+        key resolve to a single node. Structure nodes written before structure keys
+        existed are given their key once by `create_index`.
+
+        Args:
+            structure_key: Unique key of the structure node.
+            id: ID of the node if it is created.
+            memory: Memory text of the node if it is created.
+            metadata: Metadata of the node if it is created.
+
+        Returns:
+            The node ID, and whether the node was created by this call.
+        """
+        row = _node_row({"id": id, "memory": memory, "metadata": metadata})
+        query = """
+            MERGE (n:Memory {structure_key: $structure_key})
+            ON CREATE SET n.id = $node.id,
+                n.memory = $node.memory,
+                n.created_at = datetime($node.created_at),
+                n.updated_at = datetime($node.updated_at),
+                n += $node.metadata
+            RETURN n.id AS id, n.id = $node.id AS created
+        """
+        with self.driver.session(database=self.db_name) as session:
+            record = session.run(query, structure_key=structure_key, node=row).single()
+            return record["id"], record["created"]
+
     def get_nodes(self, ids: list[str]) -> list[dict[str, Any]]:
         """
         Retrieve the metadata and memory of a list of nodes.
@@ -275,6 +524,33 @@ class Neo4jGraphDB(BaseGraphDB):
             results = session.run(query, {"ids": ids})
             return [_parse_node(dict(record["n"])) for record in results]
 
+    def get_node_fields(
+        self, ids: list[str], fields: tuple[str, ...] = ("memory",)
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve selected properties of a list of nodes in one query.
+
+        Unlike `get_nodes`, only the requested properties are returned, so large
+        properties such as embeddings do not travel over the wire.
+        Args:
+            ids: List of Node identifier.
+            fields: Node properties to return besides 'id'.
+        Returns:
+            list[dict]: One flat dict per found node with 'id' and the requested fields,
+            in the order of `ids`.
+        """
+        if not ids:
+            return []
+        for field in fields:
+            if not field.isidentifier():
+                raise ValueError(f"Invalid node field: {field!r}")
+
+        projection = ", ".join(f"n.{field} AS {field}" for field in fields)
+        query = f"MATCH (n:Memory) WHERE n.id IN $ids RETURN n.id AS id, {projection}"
+        with self.driver.session(database=self.db_name) as session:
+            records = {record["id"]: dict(record) for record in session.run(query, {"ids": ids})}
+        return [records[node_id] for node_id in ids if node_id in records]
+
     def get_edges(self, id: str, type: str = "ANY", direction: str = "ANY") -> list[dict[str, str]]:
         """
         Get edges connected to a node, with optional type and direction filter.
@@ -353,9 +629,19 @@ class Neo4jGraphDB(BaseGraphDB):
             target_id: Target node ID.
             max_depth: Maximum path length to traverse.
         Returns:
-            Ordered list of node IDs along the path.
+            Ordered list of node IDs along the path, or an empty list if there is none.
         """
-        raise NotImplementedError
+        if source_id == target_id:
+            # shortestPath rejects paths whose start and end node are the same
+            return [source_id]
+        query = f"""
+        MATCH (a:Memory {{id: $source_id}}), (b:Memory {{id: $target_id}})
+        MATCH p = shortestPath((a)-[*..{int(max_depth)}]-(b))
+        RETURN [n IN nodes(p) | n.id] AS ids
+        """
+        with self.driver.session(database=self.db_name) as session:
+            record = session.run(query, source_id=source_id, target_id=target_id).single()
+            return record["ids"] if record else []
 
     def get_subgraph(
         self, center_id: str, depth: int = 2, center_status: str = "activated"
@@ -411,16 +697,43 @@ class Neo4jGraphDB(BaseGraphDB):
 
             return {"core_node": core_node, "neighbors": neighbors, "edges": edges}
 
-    def get_context_chain(self, id: str, type: str = "FOLLOWS") -> list[str]:
+    def get_context_chain(self, id: str, type: str = "FOLLOWS", max_depth: int = 100) -> list[str]:
         """
         Get the ordered context chain starting from a node, following a relationship type.
+
+        The chain is walked one hop at a time, so the cost is one indexed lookup per
+        node in the chain instead of an enumeration of all paths. Where a node has
+        several outgoing relationships of `type`, the one to the smallest node ID is
+        followed. The walk stops at the end of the chain, on a cycle or after
+        `max_depth` hops.
         Args:
             id: Starting node ID.
             type: Relationship type to follow (e.g., 'FOLLOWS').
+            max_depth: Maximum number of relationships followed.
         Returns:
-            List of ordered node IDs in the chain.
+            List of ordered node IDs in the chain, empty if the start node does not exist.
         """
-        raise NotImplementedError
+        if not _RELATIONSHIP_TYPE.fullmatch(type):
+            raise ValueError(f"Invalid relationship type: {type!r}")
+        query = f"""
+        MATCH (a:Memory {{id: $id}})
+        OPTIONAL MATCH (a)-[:{type}]->(b:Memory)
+        RETURN b.id AS next
+        ORDER BY next
+        LIMIT 1
+        """
+        chain: list[str] = []
+        with self.driver.session(database=self.db_name) as session:
+            current = id
+            while current is not None and current not in chain:
+                record = session.run(query, id=current).single()
+                if record is None:
+                    break
+                chain.append(current)
+                if len(chain) > max_depth:
+                    break
+                current = record["next"]
+        return chain
 
     # Search / recall operations
     def search_by_embedding(
@@ -487,63 +800,141 @@ class Neo4jGraphDB(BaseGraphDB):
 
         return records
 
-    def get_by_metadata(self, filters: list[dict[str, Any]]) -> list[str]:
+    def search_by_fulltext(
+        self,
+        text: str,
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+    ) -> list[dict]:
+        """
+        Retrieve node IDs by BM25 relevance of their `memory` and `key` text.
+
+        Args:
+            text (str): Free-text query. It is split into word tokens that are each
+                quoted, so Lucene syntax in user input (including the AND, OR and NOT
+                operators) is never interpreted.
+            top_k (int): Number of top matching nodes to retrieve.
+            scope (str, optional): Memory type filter (e.g., 'WorkingMemory', 'LongTermMemory').
+            status (str, optional): Node status filter (e.g., 'activated', 'archived').
+
+        Returns:
+            list[dict]: A list of dicts with 'id' and 'score', ordered by relevance.
+
+        Notes:
+            - Uses the 'memory_fulltext_index' full-text index created by `create_index`.
+            - Filters are applied before the limit, so up to `top_k` results are
+              returned per scope.
+        """
+        tokens = re.findall(r"\w+", text)
+        if not tokens:
+            return []
+
+        where_clauses = []
+        if scope:
+            where_clauses.append("node.memory_type = $scope")
+        if status:
+            where_clauses.append("node.status = $status")
+        where_clause = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+
+        query = f"""
+            CALL db.index.fulltext.queryNodes('memory_fulltext_index', $text)
+            YIELD node, score
+            {where_clause}
+            RETURN node.id AS id, score
+            LIMIT $k
         """
-        TODO:
-        1. ADD logic: "AND" vs "OR"(support logic combination);
-        2. Support nested conditional expressions;
+        # Quoted terms are matched as text; any word is enough (Lucene's default OR)
+        lucene_query = " ".join(f'"{token}"' for token in tokens)
+        parameters = {"text": lucene_query, "k": top_k, "scope": scope, "status": status}
+        with self.driver.session(database=self.db_name) as session:
+            result = session.run(query, parameters)
+            return [{"id": record["id"], "score": record["score"]} for record in result]
 
+    def search_by_embeddings(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+    ) -> list[list[dict]]:
+        """
+        Run several vector similarity searches in a single query.
+
+        Args:
+            vectors (list[list[float]]): Query embeddings.
+            top_k (int): Number of top similar nodes to retrieve per vector.
+            scope (str, optional): Memory type filter (e.g., 'LongTermMemory').
+            status (str, optional): Node status filter (e.g., 'activated').
+            threshold (float, optional): Minimum similarity score threshold (0 ~ 1).
+
+        Returns:
+            list[list[dict]]: For each input vector, dicts with 'id' and 'score' ordered by
+            similarity, with the same filtering as `search_by_embedding`.
+        """
+        if not vectors:
+            return []
+
+        where_clauses = []
+        if scope:
+            where_clauses.append("node.memory_type = $scope")
+        if status:
+            where_clauses.append("node.status = $status")
+        where_clause = ""
+        if where_clauses:
+            where_clause = "WHERE " + " AND ".join(where_clauses)
+
+        query = f"""
+            UNWIND $queries AS q
+            CALL db.index.vector.queryNodes('memory_vector_index', $k, q.embedding)
+            YIELD node, score
+            {where_clause}
+            RETURN q.index AS index, node.id AS id, score
+            ORDER BY index, score DESC
+        """
+        parameters = {
+            "queries": [{"index": i, "embedding": vector} for i, vector in enumerate(vectors)],
+            "k": top_k,
+        }
+        if scope:
+            parameters["scope"] = scope
+        if status:
+            parameters["status"] = status
+
+        results: list[list[dict]] = [[] for _ in vectors]
+        with self.driver.session(database=self.db_name) as session:
+            for record in session.run(query, parameters):
+                if threshold is not None and record["score"] < threshold:
+                    continue
+                results[record["index"]].append({"id": record["id"], "score": record["score"]})
+        return results
+
+    def get_by_metadata(self, filters: MetadataFilter) -> list[str]:
+        """
         Retrieve node IDs that match given metadata filters.
-        Supports exact match.
 
         Args:
-        filters: List of filter dicts like:
+        filters: A filter in the shared filter language (see `memos.filters`). A list
+            of conditions is combined with AND, e.g.:
             [
                 {"field": "key", "op": "in", "value": ["A", "B"]},
                 {"field": "confidence", "op": ">=", "value": 80},
-                {"field": "tags", "op": "contains", "value": "AI"},
+                {"field": "tags", "op": "contains", "value": ["AI"]},
+                {"or": [{"field": "user_id", "op": "=", "value": "u1"}, ...]},
                 ...
             ]
 
         Returns:
-            list[str]: Node IDs whose metadata match the filter conditions. (AND logic).
+            list[str]: Node IDs whose metadata match the filter conditions.
 
         Notes:
             - Supports structured querying such as tag/category/importance/time filtering.
             - Can be used for faceted recall or prefiltering before embedding rerank.
         """
-        where_clauses = []
-        params = {}
-
-        for i, f in enumerate(filters):
-            field = f["field"]
-            op = f.get("op", "=")
-            value = f["value"]
-            param_key = f"val{i}"
-
-            # Build WHERE clause
-            if op == "=":
-                where_clauses.append(f"n.{field} = ${param_key}")
-                params[param_key] = value
-            elif op == "in":
-                where_clauses.append(f"n.{field} IN ${param_key}")
-                params[param_key] = value
-            elif op == "contains":
-                where_clauses.append(f"ANY(x IN ${param_key} WHERE x IN n.{field})")
-                params[param_key] = value
-            elif op == "starts_with":
-                where_clauses.append(f"n.{field} STARTS WITH ${param_key}")
-                params[param_key] = value
-            elif op == "ends_with":
-                where_clauses.append(f"n.{field} ENDS WITH ${param_key}")
-                params[param_key] = value
-            elif op in [">", ">=", "<", "<="]:
-                where_clauses.append(f"n.{field} {op} ${param_key}")
-                params[param_key] = value
-            else:
-                raise ValueError(f"Unsupported operator: {op}")
-
-        where_str = " AND ".join(where_clauses)
+        node = normalize_filter(filters)
+        params: dict[str, Any] = {}
+        where_str = _filter_to_cypher(node, params) if node else "true"
         query = f"MATCH (n:Memory) WHERE {where_str} RETURN n.id AS id"
 
         with self.driver.session(database=self.db_name) as session:
@@ -591,28 +982,106 @@ class Neo4jGraphDB(BaseGraphDB):
     def deduplicate_nodes(self) -> None:
         """
         Deduplicate redundant or semantically similar nodes.
-        This typically involves identifying nodes with identical or near-identical memory.
+
+        Activated nodes with identical memory text and memory type are merged into the
+        most recently updated one. Near-duplicates are found by the background
+        `GraphReorganizer`, which merges them with `merge_node_group`.
         """
-        raise NotImplementedError
+        query = """
+        MATCH (n:Memory)
+        WHERE n.status = 'activated' AND n.structure_key IS NULL
+        WITH n ORDER BY n.updated_at DESC
+        WITH n.memory_type AS memory_type, n.memory AS memory, collect(n.id) AS ids
+        WHERE size(ids) > 1
+        RETURN ids
+        """
+        with self.driver.session(database=self.db_name) as session:
+            groups = [record["ids"] for record in session.run(query)]
+        for ids in groups:
+            self.merge_node_group(ids[0], ids[1:])
+        if groups:
+            logger.info(f"Merged {sum(len(ids) - 1 for ids in groups)} duplicate nodes")
 
     def detect_conflicts(self) -> list[tuple[str, str]]:
         """
         Detect conflicting nodes based on logical or semantic inconsistency.
+
+        Conflicts are recorded as CONFLICT edges (e.g. by the `GraphReorganizer`);
+        this returns the pairs of activated nodes they connect.
+
         Returns:
             A list of (node_id1, node_id2) tuples that conflict.
         """
-        raise NotImplementedError
+        query = """
+        MATCH (a:Memory)-[:CONFLICT]->(b:Memory)
+        WHERE a.status = 'activated' AND b.status = 'activated'
+        RETURN a.id AS id1, b.id AS id2
+        """
+        with self.driver.session(database=self.db_name) as session:
+            return [(record["id1"], record["id2"]) for record in session.run(query)]
 
     def merge_nodes(self, id1: str, id2: str) -> str:
         """
         Merge two similar or duplicate nodes into one.
         Args:
-            id1: First node ID.
-            id2: Second node ID.
+            id1: First node ID; this node is kept.
+            id2: Second node ID; this node is archived into the first.
         Returns:
             ID of the resulting merged node.
         """
-        raise NotImplementedError
+        self.merge_node_group(id1, [id2])
+        return id1
+
+    def merge_node_group(self, keep_id: str, duplicate_ids: list[str]) -> None:
+        """
+        Merge duplicate nodes into `keep_id`, in one transaction.
+
+        The kept node gains the tags, sources and usage of the duplicates; each
+        duplicate is archived with a MERGED_TO edge to the kept node, and its other
+        edges move to the kept node.
+
+        Args:
+            keep_id: ID of the node to keep.
+            duplicate_ids: IDs of the nodes to archive into it.
+        """
+        duplicate_ids = [duplicate_id for duplicate_id in duplicate_ids if duplicate_id != keep_id]
+        if not duplicate_ids:
+            return
+
+        def merge(tx) -> None:
+            inherit = _inherit_edges_cypher(_inheritable_edge_types(tx, duplicate_ids))
+            tx.run(
+                f"""
+                MATCH (m:Memory {{id: $keep_id}})
+                MATCH (d:Memory)
+                WHERE d.id IN $duplicate_ids
+                WITH m, collect(d) AS duplicates
+                SET m.tags = {_list_union_cypher("tags")},
+                    m.sources = {_list_union_cypher("sources")},
+                    m.usage = {_list_union_cypher("usage")},
+                    m.updated_at = datetime()
+                WITH m, duplicates
+                CALL {{
+                    WITH duplicates
+                    UNWIND duplicates AS a
+                    MATCH (a)-[r]-(b:Memory)
+                    WHERE b IN duplicates
+                    WITH DISTINCT r
+                    DELETE r
+                }}
+                WITH m, duplicates
+                UNWIND duplicates AS o
+                SET o.status = 'archived'
+                CREATE (o)-[:MERGED_TO]->(m)
+                WITH o, m
+                {inherit}
+                """,
+                keep_id=keep_id,
+                duplicate_ids=duplicate_ids,
+            ).consume()
+
+        with self.driver.session(database=self.db_name) as session:
+            session.execute_write(merge)
 
     # Utilities
     def clear(self) -> None:
@@ -664,49 +1133,88 @@ class Neo4jGraphDB(BaseGraphDB):
 
             return {"nodes": nodes, "edges": edges}
 
-    def import_graph(self, data: dict[str, Any]) -> None:
+    def import_graph(self, data: dict[str, Any], batch_size: int = 1000) -> None:
         """
         Import the entire graph from a serialized dictionary.
 
         Args:
             data: A dictionary containing all nodes and edges to be loaded.
+            batch_size: Number of nodes/edges written per query.
         """
-        with self.driver.session(database=self.db_name) as session:
-            for node in data.get("nodes", []):
-                id, memory, metadata = _compose_node(node)
+        nodes = data.get("nodes", [])
+        for i in range(0, len(nodes), batch_size):
+            self.import_nodes(nodes[i : i + batch_size])
 
-                metadata = _prepare_node_metadata(metadata)
+        edges = data.get("edges", [])
+        for i in range(0, len(edges), batch_size):
+            self.import_edges(edges[i : i + batch_size])
 
-                # Merge node and set metadata
-                created_at = metadata.pop("created_at")
-                updated_at = metadata.pop("updated_at")
+    def import_nodes(self, nodes: list[dict[str, Any]]) -> None:
+        """
+        Upsert a batch of nodes (`{"id", "memory", "metadata"}`) in a single query.
+        """
+        rows = [_node_row(node) for node in nodes]
+        if not rows:
+            return
 
-                session.run(
-                    """
-                    MERGE (n:Memory {id: $id})
-                    SET n.memory = $memory,
-                        n.created_at = datetime($created_at),
-                        n.updated_at = datetime($updated_at),
-                        n += $metadata
-                    """,
-                    id=id,
-                    memory=memory,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    metadata=metadata,
-                )
+        with self.driver.session(database=self.db_name) as session:
+            session.run(
+                """
+                UNWIND $rows AS row
+                MERGE (n:Memory {id: row.id})
+                SET n.memory = row.memory,
+                    n.created_at = datetime(row.created_at),
+                    n.updated_at = datetime(row.updated_at),
+                    n += row.metadata
+                """,
+                rows=rows,
+            )
+
+    def import_edges(self, edges: list[dict[str, Any]]) -> None:
+        """
+        Create a batch of edges (`{"source", "target", "type"}`), one query per edge type.
+        """
+        edges_by_type: dict[str, list[dict[str, str]]] = {}
+        for edge in edges:
+            edges_by_type.setdefault(edge["type"], []).append(
+                {"source": edge["source"], "target": edge["target"]}
+            )
 
-            for edge in data.get("edges", []):
+        with self.driver.session(database=self.db_name) as session:
+            for edge_type, rows in edges_by_type.items():
                 session.run(
                     f"""
-                    MATCH (a:Memory {{id: $source_id}})
-                    MATCH (b:Memory {{id: $target_id}})
-                    MERGE (a)-[:{edge["type"]}]->(b)
+                    UNWIND $rows AS row
+                    MATCH (a:Memory {{id: row.source}})
+                    MATCH (b:Memory {{id: row.target}})
+                    MERGE (a)-[:{edge_type}]->(b)
                     """,
-                    source_id=edge["source"],
-                    target_id=edge["target"],
+                    rows=rows,
                 )
 
+    def iter_nodes(self) -> Iterator[dict[str, Any]]:
+        """
+        Stream all nodes without materializing the whole result.
+        Records are pulled from the server in fetch-size batches as the caller consumes them.
+        """
+        with self.driver.session(database=self.db_name) as session:
+            for record in session.run("MATCH (n:Memory) RETURN n"):
+                yield _parse_node(dict(record["n"]))
+
+    def iter_edges(self) -> Iterator[dict[str, str]]:
+        """Stream all edges as `{"source", "target", "type"}` dicts."""
+        with self.driver.session(database=self.db_name) as session:
+            result = session.run("""
+                MATCH (a:Memory)-[r]->(b:Memory)
+                RETURN a.id AS source, b.id AS target, type(r) AS type
+            """)
+            for record in result:
+                yield {
+                    "source": record["source"],
+                    "target": record["target"],
+                    "type": record["type"],
+                }
+
     def get_all_memory_items(self, scope: str) -> list[dict]:
         """
         Retrieve all memory items of a specific memory_type.
@@ -740,7 +1248,7 @@ class Neo4jGraphDB(BaseGraphDB):
 
         with self.driver.session(database="system") as session:
             session.run(f"DROP DATABASE {self.db_name} IF EXISTS")
-            print(f"Database '{self.db_name}' has been dropped.")
+            logger.info(f"Database '{self.db_name}' has been dropped.")
 
     def _ensure_database_exists(self):
         with self.driver.session(database="system") as session:
@@ -790,7 +1298,8 @@ class Neo4jGraphDB(BaseGraphDB):
 
     def _create_basic_property_indexes(self) -> None:
         """
-        Create standard B-tree indexes on memory_type, created_at, and updated_at fields.
+        Create standard B-tree indexes on memory_type, created_at, and updated_at fields,
+        and a composite (memory_type, updated_at) index used by capacity eviction.
         """
         try:
             with self.driver.session(database=self.db_name) as session:
@@ -811,9 +1320,73 @@ class Neo4jGraphDB(BaseGraphDB):
                     FOR (n:Memory) ON (n.updated_at)
                 """)
                 logger.debug("Index 'memory_updated_at_index' ensured.")
+
+                session.run("""
+                    CREATE INDEX memory_type_updated_at_index IF NOT EXISTS
+                    FOR (n:Memory) ON (n.memory_type, n.updated_at)
+                """)
+                logger.debug("Index 'memory_type_updated_at_index' ensured.")
         except Exception as e:
             logger.warning(f"Failed to create basic property indexes: {e}")
 
+    def _create_structure_key_constraint(self) -> None:
+        """
+        Make `structure_key` unique among Memory nodes. The constraint is backed by an
+        index, and nodes without the property (all but structure nodes) are unaffected.
+        """
+        try:
+            with self.driver.session(database=self.db_name) as session:
+                session.run("""
+                    CREATE CONSTRAINT memory_structure_key_unique IF NOT EXISTS
+                    FOR (n:Memory) REQUIRE n.structure_key IS UNIQUE
+                """)
+            logger.debug("Constraint 'memory_structure_key_unique' ensured.")
+        except Exception as e:
+            logger.warning(f"Failed to create structure key constraint: {e}")
+
+    def _migrate_legacy_structure_nodes(self) -> None:
+        """
+        Give structure nodes written before structure keys existed their
+        `structure_key` ("<memory_type>:<key>"), so that `merge_structure_node` finds
+        them instead of creating duplicates. Legacy structure nodes are recognized by
+        their memory text being their key and by their outgoing PARENT edges; of
+        several for the same key, the oldest is adopted. Keyed nodes are skipped, so
+        later runs change nothing.
+        """
+        query = """
+            MATCH (n:Memory)-[:PARENT]->(:Memory)
+            WHERE n.structure_key IS NULL AND n.key IS NOT NULL AND n.memory = n.key
+            WITH DISTINCT n
+            ORDER BY n.created_at
+            WITH n.memory_type + ':' + n.key AS structure_key, collect(n)[0] AS legacy
+            WHERE NOT EXISTS { MATCH (:Memory {structure_key: structure_key}) }
+            SET legacy.structure_key = structure_key
+            RETURN count(legacy) AS adopted
+        """
+        try:
+            with self.driver.session(database=self.db_name) as session:
+                record = session.run(query).single()
+            if record and record["adopted"]:
+                logger.info(f"Keyed {record['adopted']} legacy structure nodes.")
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy structure nodes: {e}")
+
+    def _create_fulltext_index(
+        self, label: str = "Memory", index_name: str = "memory_fulltext_index"
+    ) -> None:
+        """
+        Create a full-text (BM25) index over the memory text and key of nodes.
+        """
+        try:
+            with self.driver.session(database=self.db_name) as session:
+                session.run(f"""
+                    CREATE FULLTEXT INDEX {index_name} IF NOT EXISTS
+                    FOR (n:{label}) ON EACH [n.memory, n.key]
+                """)
+            logger.debug(f"Full-text index '{index_name}' ensured.")
+        except Exception as e:
+            logger.warning(f"Failed to create full-text index '{index_name}': {e}")
+
     def _index_exists(self, index_name: str) -> bool:
         """
         Check if an index with the given name exists.
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+from memos.configs.llm import BaseLLMConfig, LLMCacheConfig
+from memos.llms.base import BaseLLM
+from memos.log import get_logger
+from memos.types import MessageList
+
+
+logger = get_logger(__name__)
+
+# Config fields that change the response and therefore belong in the cache key
+SAMPLING_FIELDS = (
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "top_k",
+    "do_sample",
+    "remove_think_prefix",
+)
+
+
+class CachedLLM(BaseLLM):
+    """
+    Response cache wrapping any LLM.
+
+    Responses are keyed by model name, normalized messages and sampling parameters.
+    Only deterministic calls (temperature 0) are cached unless the call passes
+    `cache=True` or the cache is configured with `cache_sampled_calls`. Calls with
+    extra backend arguments (e.g. `past_key_values`) always go to the wrapped LLM.
+
+    Attributes other than `generate` are forwarded to the wrapped LLM, so the wrapper
+    can be used wherever the LLM itself is.
+    """
+
+    def __init__(self, llm: BaseLLM, config: LLMCacheConfig):
+        self.llm = llm
+        self.cache_config = config
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+        self._db: sqlite3.Connection | None = None
+        if config.sqlite_path:
+            self._db = sqlite3.connect(config.sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"LLM response cache persisted to {config.sqlite_path}")
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def generate(self, messages: MessageList, cache: bool | None = None, **kwargs) -> str:
+        """
+        Generate a response, serving it from the cache when possible.
+
+        Args:
+            messages: List of message dicts containing 'role' and 'content'.
+            cache: Force caching on (True) or off (False) for this call. By default
+                only deterministic calls are cached.
+            **kwargs: Extra arguments for the wrapped LLM. Calls with extra arguments
+                bypass the cache.
+
+        Returns:
+            str: The generated (or cached) response.
+        """
+        if kwargs or not self._is_cacheable(cache):
+            with self._lock:
+                self.bypassed += 1
+            return self.llm.generate(messages, **kwargs)
+
+        key = self.cache_key(messages)
+        response = self._lookup(key)
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            return response
+
+        with self._lock:
+            self.misses += 1
+        response = self.llm.generate(messages)
+        self._store(key, response)
+        return response
+
+    def cache_key(self, messages: MessageList) -> str:
+        """Hash of model name, normalized messages and sampling parameters."""
+        llm_config: BaseLLMConfig = self.llm.config
+        payload = {
+            "model": llm_config.model_name_or_path,
+            "messages": [
+                {"role": message.get("role"), "content": _normalize_content(message.get("content"))}
+                for message in messages
+            ],
+            "params": {
+                field: getattr(llm_config, field)
+                for field in SAMPLING_FIELDS
+                if hasattr(llm_config, field)
+            },
+        }
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache hit/miss counters and the hit rate of cacheable calls."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached responses, including persisted ones."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def _is_cacheable(self, cache: bool | None) -> bool:
+        if cache is not None:
+            return cache
+        return self.cache_config.cache_sampled_calls or self.llm.config.temperature == 0
+
+    def _is_expired(self, created_at: float) -> bool:
+        ttl = self.cache_config.ttl_seconds
+        return ttl is not None and time.time() - created_at > ttl
+
+    def _lookup(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, response = entry
+                if not self._is_expired(created_at):
+                    self._entries.move_to_end(key)
+                    return response
+                del self._entries[key]
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self._is_expired(created_at):
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._put(key, created_at, response)
+            return response
+
+    def _store(self, key: str, response: str) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._put(key, created_at, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, created_at),
+                )
+                self._db.commit()
+
+    def _put(self, key: str, created_at: float, response: str) -> None:
+        # Caller holds the lock
+        self._entries[key] = (created_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.cache_config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def _normalize_content(content: Any) -> Any:
+    """Drop surrounding and trailing-line whitespace that does not change the prompt."""
+    if isinstance(content, str):
+        return "\n".join(line.rstrip() for line in content.strip().splitlines())
+    return content
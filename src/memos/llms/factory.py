@@ -2,6 +2,7 @@ from typing import Any, ClassVar
 
 from memos.configs.llm import LLMConfigFactory
 from memos.llms.base import BaseLLM
+from memos.llms.cache import CachedLLM
 from memos.llms.hf import HFLLM
 from memos.llms.ollama import OllamaLLM
 from memos.llms.openai import OpenAILLM
@@ -22,4 +23,7 @@ class LLMFactory(BaseLLM):
         if backend not in cls.backend_to_class:
             raise ValueError(f"Invalid backend: {backend}")
         llm_class = cls.backend_to_class[backend]
-        return llm_class(config_factory.config)
+        llm = llm_class(config_factory.config)
+        if config_factory.cache is not None:
+            return CachedLLM(llm, config_factory.cache)
+        return llm
@@ -10,10 +10,11 @@ from transformers import (
     TopPLogitsWarper,
 )
 
+from memos import telemetry
 from memos.configs.llm import HFLLMConfig
 from memos.llms.base import BaseLLM
 from memos.llms.utils import remove_thinking_tags
-from memos.log import get_logger
+from memos.log import Payload, get_logger
 from memos.types import MessageList
 
 
@@ -70,11 +71,14 @@ class HFLLM(BaseLLM):
         prompt = self.tokenizer.apply_chat_template(
             messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
         )
-        logger.info(f"HFLLM prompt: {prompt}")
-        if past_key_values is None:
-            return self._generate_full(prompt)
-        else:
-            return self._generate_with_cache(prompt, past_key_values)
+        logger.debug("HFLLM prompt: %s", Payload(prompt))
+        with telemetry.span(
+            "llm.generate", backend="huggingface", model=self.config.model_name_or_path
+        ):
+            if past_key_values is None:
+                return self._generate_full(prompt)
+            else:
+                return self._generate_with_cache(prompt, past_key_values)
 
     def _generate_full(self, prompt: str) -> str:
         """
@@ -102,7 +106,13 @@ class HFLLM(BaseLLM):
             for src_ids, out_ids in zip(inputs.input_ids, gen_ids, strict=False)
         ]
         response = self.tokenizer.batch_decode(new_ids, skip_special_tokens=True)[0]
-        logger.info(f"Full-gen raw response: {response}")
+        logger.debug("Full-gen raw response: %s", Payload(response))
+        telemetry.record_llm_usage(
+            "huggingface",
+            self.config.model_name_or_path,
+            inputs.input_ids.shape[-1],
+            len(new_ids[0]),
+        )
         return (
             remove_thinking_tags(response)
             if getattr(self.config, "remove_think_prefix", False)
@@ -135,7 +145,10 @@ class HFLLM(BaseLLM):
             response = self.tokenizer.decode(concat[0], skip_special_tokens=True)
         else:
             response = ""
-        logger.info(f"Cache-gen raw response: {response}")
+        logger.debug("Cache-gen raw response: %s", Payload(response))
+        telemetry.record_llm_usage(
+            "huggingface", self.config.model_name_or_path, query_ids.shape[-1], len(generated)
+        )
         return (
             remove_thinking_tags(response)
             if getattr(self.config, "remove_think_prefix", False)
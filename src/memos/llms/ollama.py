@@ -2,10 +2,11 @@ from typing import Any
 
 from ollama import Client
 
+from memos import telemetry
 from memos.configs.llm import OllamaLLMConfig
 from memos.llms.base import BaseLLM
 from memos.llms.utils import remove_thinking_tags
-from memos.log import get_logger
+from memos.log import Payload, get_logger
 from memos.types import MessageList
 
 
@@ -63,17 +64,24 @@ class OllamaLLM(BaseLLM):
         Returns:
             str: The generated response.
         """
-        response = self.client.chat(
-            model=self.config.model_name_or_path,
-            messages=messages,
-            options={
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens,
-                "top_p": self.config.top_p,
-                "top_k": self.config.top_k,
-            },
+        with telemetry.span("llm.generate", backend="ollama", model=self.config.model_name_or_path):
+            response = self.client.chat(
+                model=self.config.model_name_or_path,
+                messages=messages,
+                options={
+                    "temperature": self.config.temperature,
+                    "num_predict": self.config.max_tokens,
+                    "top_p": self.config.top_p,
+                    "top_k": self.config.top_k,
+                },
+            )
+        telemetry.record_llm_usage(
+            "ollama",
+            self.config.model_name_or_path,
+            getattr(response, "prompt_eval_count", None),
+            getattr(response, "eval_count", None),
         )
-        logger.info(f"Raw response from Ollama: {response.model_dump_json()}")
+        logger.debug("Raw response from Ollama: %s", Payload(response.model_dump_json))
 
         str_response = response["message"]["content"] or ""
         if self.config.remove_think_prefix:
@@ -1,9 +1,10 @@
 import openai
 
+from memos import telemetry
 from memos.configs.llm import OpenAILLMConfig
 from memos.llms.base import BaseLLM
 from memos.llms.utils import remove_thinking_tags
-from memos.log import get_logger
+from memos.log import Payload, get_logger
 from memos.types import MessageList
 
 
@@ -19,14 +20,22 @@ class OpenAILLM(BaseLLM):
 
     def generate(self, messages: MessageList) -> str:
         """Generate a response from OpenAI LLM."""
-        response = self.client.chat.completions.create(
-            model=self.config.model_name_or_path,
-            messages=messages,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
-            top_p=self.config.top_p,
-        )
-        logger.info(f"Response from OpenAI: {response.model_dump_json()}")
+        with telemetry.span("llm.generate", backend="openai", model=self.config.model_name_or_path):
+            response = self.client.chat.completions.create(
+                model=self.config.model_name_or_path,
+                messages=messages,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                top_p=self.config.top_p,
+            )
+        if response.usage is not None:
+            telemetry.record_llm_usage(
+                "openai",
+                self.config.model_name_or_path,
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
+            )
+        logger.debug("Response from OpenAI: %s", Payload(response.model_dump_json))
         response_content = response.choices[0].message.content
         if self.config.remove_think_prefix:
             return remove_thinking_tags(response_content)
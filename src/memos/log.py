@@ -1,8 +1,14 @@
+import atexit
 import logging
+import queue
+import threading
 
+from collections.abc import Callable
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from sys import stdout
+from typing import Any
 
 from memos import settings
 
@@ -21,13 +27,16 @@ def _setup_logfile() -> Path:
     return logfile
 
 
+STANDARD_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s"
+)
+
+# The file sink is not part of the dict config: it runs behind a queue (see setup_logging)
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
-        "standard": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s"
-        },
+        "standard": {"format": STANDARD_FORMAT},
         "no_datetime": {
             "format": "%(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s"
         },
@@ -43,18 +52,10 @@ LOGGING_CONFIG = {
             "formatter": "no_datetime",
             "filters": ["package_tree_filter"],
         },
-        "file": {
-            "level": "DEBUG",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": _setup_logfile(),
-            "maxBytes": 1024**2 * 10,
-            "backupCount": 3,
-            "formatter": "standard",
-        },
     },
     "root": {  # Root logger handles all logs
         "level": logging.DEBUG if settings.DEBUG else logging.INFO,
-        "handlers": ["console", "file"],
+        "handlers": ["console"],
     },
     "loggers": {
         "memos": {
@@ -65,12 +66,77 @@ LOGGING_CONFIG = {
 }
 
 
+_setup_lock = threading.Lock()
+_listener: QueueListener | None = None
+
+
+def setup_logging(force: bool = False) -> None:
+    """Configure logging once per process; later calls are no-ops unless `force` is set.
+
+    Records for the log file are put on an in-memory queue and written by a
+    background thread, so request threads never wait on disk I/O.
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None and not force:
+            return
+        if _listener is not None:
+            _listener.stop()
+
+        dictConfig(LOGGING_CONFIG)
+
+        file_handler = RotatingFileHandler(
+            _setup_logfile(), maxBytes=1024**2 * 10, backupCount=3, encoding="utf-8"
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter(STANDARD_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        logging.getLogger("").addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+
+
+@atexit.register
+def _flush_file_sink() -> None:
+    """Write out queued records and close the log file at interpreter exit."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+class Payload:
+    """Log argument rendered (and truncated) only if the record is actually emitted.
+
+    Example:
+        logger.debug("Response: %s", Payload(response.model_dump_json))
+    """
+
+    __slots__ = ("_limit", "_value")
+
+    def __init__(self, value: Any | Callable[[], Any], limit: int | None = None):
+        self._value = value
+        self._limit = limit
+
+    def __str__(self) -> str:
+        value = self._value() if callable(self._value) else self._value
+        text = str(value)
+        limit = self._limit if self._limit is not None else settings.LOG_PAYLOAD_MAX_CHARS
+        if len(text) <= limit:
+            return text
+        return f"{text[:limit]}... [{len(text) - limit} more chars]"
+
+
 def get_logger(name: str | None = None) -> logging.Logger:
     """returns the project logger, scoped to a child name if provided
     Args:
         name: will define a child logger
     """
-    dictConfig(LOGGING_CONFIG)
+    setup_logging()
 
     parent_logger = logging.getLogger("")
     if name:
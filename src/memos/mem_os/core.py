@@ -5,9 +5,10 @@ from pathlib import Path
 from threading import Lock
 from typing import Any, Literal
 
+from memos import telemetry
 from memos.configs.mem_os import MOSConfig
 from memos.llms.factory import LLMFactory
-from memos.log import get_logger
+from memos.log import Payload, get_logger
 from memos.mem_cube.general import GeneralMemCube
 from memos.mem_reader.factory import MemReaderFactory
 from memos.mem_scheduler.general_scheduler import GeneralScheduler
@@ -93,6 +94,8 @@ class MOSCore:
             scheduler_config = self.config.mem_scheduler
             self._mem_scheduler = SchedulerFactory.from_config(scheduler_config)
             self._mem_scheduler.initialize_modules(chat_llm=self.chat_llm)
+            # Resolve cubes of messages consumed from a shared queue by id
+            self._mem_scheduler.mem_cube_loader = lambda cube_id: self.mem_cubes.get(cube_id)
             self._mem_scheduler.start()
 
     def mem_scheduler_on(self) -> bool:
@@ -186,6 +189,7 @@ class MOSCore:
                 documents.append(str(file_path))
         return documents
 
+    @telemetry.traced("mos.chat")
     def chat(self, query: str, user_id: str | None = None) -> str:
         """
         Chat with the MOS.
@@ -226,7 +230,10 @@ class MOSCore:
 
                 memories = mem_cube.text_mem.search(query, top_k=self.config.top_k)
                 memories_all.extend(memories)
-            logger.info(f"🧠 [Memory] Searched memories:\n{self._str_memories(memories_all)}\n")
+            logger.debug(
+                "🧠 [Memory] Searched memories:\n%s\n",
+                Payload(lambda: self._str_memories(memories_all)),
+            )
             system_prompt = self._build_system_prompt(memories_all)
         else:
             system_prompt = self._build_system_prompt()
@@ -255,7 +262,7 @@ class MOSCore:
             response = self.chat_llm.generate(current_messages, past_key_values=past_key_values)
         else:
             response = self.chat_llm.generate(current_messages)
-        logger.info(f"🤖 [Assistant] {response}\n")
+        logger.debug("🤖 [Assistant] %s\n", Payload(response))
         chat_history.chat_history.append({"role": "user", "content": query})
         chat_history.chat_history.append({"role": "assistant", "content": response})
         self.chat_history_manager[user_id] = chat_history
@@ -435,6 +442,7 @@ class MOSCore:
         else:
             raise ValueError(f"MemCube with ID {mem_cube_id} does not exist.")
 
+    @telemetry.traced("mos.search")
     def search(
         self, query: str, user_id: str | None = None, install_cube_ids: list[str] | None = None
     ) -> MOSSearchResult:
@@ -475,8 +483,10 @@ class MOSCore:
             ):
                 memories = mem_cube.text_mem.search(query, top_k=self.config.top_k)
                 result["text_mem"].append({"cube_id": mem_cube_id, "memories": memories})
-                logger.info(
-                    f"🧠 [Memory] Searched memories from {mem_cube_id}:\n{self._str_memories(memories)}\n"
+                logger.debug(
+                    "🧠 [Memory] Searched memories from %s:\n%s\n",
+                    mem_cube_id,
+                    Payload(lambda memories=memories: self._str_memories(memories)),
                 )
             if (
                 (mem_cube_id in install_cube_ids)
@@ -485,11 +495,14 @@ class MOSCore:
             ):
                 memories = mem_cube.act_mem.extract(query)
                 result["act_mem"].append({"cube_id": mem_cube_id, "memories": [memories]})
-                logger.info(
-                    f"🧠 [Memory] Searched memories from {mem_cube_id}:\n{self._str_memories(memories)}\n"
+                logger.debug(
+                    "🧠 [Memory] Extracted activation memory from %s:\n%s\n",
+                    mem_cube_id,
+                    Payload(memories),
                 )
         return result
 
+    @telemetry.traced("mos.add")
     def add(
         self,
         messages: MessageList | None = None,
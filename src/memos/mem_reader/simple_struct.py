@@ -5,7 +5,7 @@ import json
 from abc import ABC
 from typing import Any
 
-from memos import log
+from memos import log, telemetry
 from memos.chunkers import ChunkerFactory
 from memos.configs.mem_reader import SimpleStructMemReaderConfig
 from memos.configs.parser import ParserConfigFactory
@@ -73,6 +73,7 @@ class SimpleStructMemReader(BaseMemReader, ABC):
 
         return chat_read_nodes
 
+    @telemetry.traced("mem_reader.get_memory")
     def get_memory(
         self, scene_data: list, type: str, info: dict[str, Any]
     ) -> list[list[TextualMemoryItem]]:
@@ -178,7 +179,7 @@ class SimpleStructMemReader(BaseMemReader, ABC):
                     parsed_text = parser.parse(item)
                     results.append({"file": item, "text": parsed_text})
                 except Exception as e:
-                    print(f"Error parsing file {item}: {e!s}")
+                    logger.error(f"Error parsing file {item}: {e!s}")
 
         return results
 
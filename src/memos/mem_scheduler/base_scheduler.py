@@ -4,12 +4,15 @@ import time
 
 from abc import abstractmethod
 from queue import Queue
+from typing import TYPE_CHECKING
 
 from memos.configs.mem_scheduler import BaseSchedulerConfig
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
+from memos.mem_cube.general import GeneralMemCube
 from memos.mem_scheduler.modules.dispatcher import SchedulerDispatcher
 from memos.mem_scheduler.modules.redis_service import RedisSchedulerModule
+from memos.mem_scheduler.modules.redis_stream_queue import RedisStreamQueue
 from memos.mem_scheduler.modules.schemas import (
     DEFAULT_CONSUME_INTERVAL_SECONDS,
     DEFAULT_THREAD__POOL_MAX_WORKERS,
@@ -18,6 +21,10 @@ from memos.mem_scheduler.modules.schemas import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
 logger = get_logger(__name__)
 
 
@@ -46,6 +53,15 @@ class BaseScheduler(RedisSchedulerModule):
         self._consume_interval = self.config.get(
             "consume_interval_seconds", DEFAULT_CONSUME_INTERVAL_SECONDS
         )
+        redis_stream_config = self.config.get("redis_stream")
+        self._stream_queue: RedisStreamQueue | None = (
+            RedisStreamQueue(redis_stream_config) if redis_stream_config is not None else None
+        )
+
+        # Cubes resolvable by id on the consumer side, for messages that arrive without
+        # the cube object (e.g. from a Redis stream written by another process)
+        self._mem_cubes_lock = threading.Lock()
+        self.mem_cube_loader: Callable[[str], GeneralMemCube | None] | None = None
 
         # others
         self._current_user_id: str | None = None
@@ -58,11 +74,39 @@ class BaseScheduler(RedisSchedulerModule):
             chat_llm: The LLM instance to be used for chat interactions
         """
 
+    def register_mem_cube(self, mem_cube_id: str, mem_cube: GeneralMemCube) -> None:
+        """Make `mem_cube` available to messages that only carry `mem_cube_id`."""
+        with self._mem_cubes_lock:
+            self.mem_cubes[mem_cube_id] = mem_cube
+
+    def resolve_mem_cube(self, mem_cube_id: str) -> GeneralMemCube | None:
+        """
+        Return the cube registered under `mem_cube_id`, asking `mem_cube_loader` (and
+        registering its result) for cubes this process has not seen yet.
+        """
+        with self._mem_cubes_lock:
+            mem_cube = self.mem_cubes.get(mem_cube_id)
+        if mem_cube is None and self.mem_cube_loader is not None:
+            mem_cube = self.mem_cube_loader(mem_cube_id)
+            if isinstance(mem_cube, GeneralMemCube):
+                self.register_mem_cube(mem_cube_id, mem_cube)
+        return mem_cube
+
     def submit_messages(self, messages: ScheduleMessageItem | list[ScheduleMessageItem]):
         """Submit multiple messages to the message queue."""
         if isinstance(messages, ScheduleMessageItem):
             messages = [messages]  # transform single message to list
 
+        for message in messages:
+            # Cubes cannot travel through Redis; keep them so consumers here can resolve them
+            if isinstance(message.mem_cube, GeneralMemCube):
+                self.register_mem_cube(message.mem_cube_id, message.mem_cube)
+
+        if self._stream_queue is not None:
+            self._stream_queue.submit(messages)
+            logger.info(f"Submitted {len(messages)} messages to the Redis stream")
+            return
+
         for message in messages:
             self.memos_message_queue.put(message)
             logger.info(f"Submitted message: {message.label} - {message.content}")
@@ -131,13 +175,37 @@ class BaseScheduler(RedisSchedulerModule):
                 logger.error(f"Unexpected error in message consumer: {e!s}")
                 time.sleep(self._consume_interval)  # Prevent tight error loops
 
+    def _dispatch_and_wait(self, messages: list[ScheduleMessageItem]) -> list[ScheduleMessageItem]:
+        """
+        Dispatch a batch and return once it is handled, so it can be acknowledged.
+
+        Returns:
+            The messages whose handler raised; they are left unacknowledged.
+        """
+        failed: list[ScheduleMessageItem] = []
+        failed_lock = threading.Lock()
+
+        def on_error(msgs: list[ScheduleMessageItem], error: Exception) -> None:
+            with failed_lock:
+                failed.extend(msgs)
+
+        self.dispatcher.dispatch(messages, on_error=on_error)
+        self.dispatcher.join()
+        return failed
+
     def start(self) -> None:
         """
         Start the message consumer thread.
 
         Initializes and starts a daemon thread that will periodically
-        check for and process messages from the queue.
+        check for and process messages from the queue. With a Redis stream
+        configured, this process joins the consumer group instead.
         """
+        if self._stream_queue is not None:
+            self._stream_queue.start(handler=self._dispatch_and_wait)
+            self._running = True
+            return
+
         if self._consumer_thread is not None and self._consumer_thread.is_alive():
             logger.warning("Consumer thread is already running")
             return
@@ -153,6 +221,11 @@ class BaseScheduler(RedisSchedulerModule):
 
     def stop(self) -> None:
         """Stop the consumer thread and clean up resources."""
+        if self._stream_queue is not None:
+            self._running = False
+            self._stream_queue.stop()
+            logger.info("Redis stream consumer stopped")
+            return
         if self._consumer_thread is None or not self._running:
             logger.warning("Consumer thread is not running")
             return
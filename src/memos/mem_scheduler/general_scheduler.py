@@ -1,18 +1,28 @@
 import json
+import threading
+import time
 
-from datetime import datetime, timedelta
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 
 from memos.configs.mem_scheduler import GeneralSchedulerConfig
+from memos.exceptions import MemCubeError
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
 from memos.mem_cube.general import GeneralMemCube
 from memos.mem_scheduler.base_scheduler import BaseScheduler
+from memos.mem_scheduler.modules.context import SchedulerContext
 from memos.mem_scheduler.modules.monitor import SchedulerMonitor
 from memos.mem_scheduler.modules.retriever import SchedulerRetriever
 from memos.mem_scheduler.modules.schemas import (
     ANSWER_LABEL,
     DEFAULT_ACT_MEM_DUMP_PATH,
     DEFAULT_ACTIVATION_MEM_SIZE,
+    DEFAULT_EVIDENCE_SEARCH_TIMEOUT_SECONDS,
+    DEFAULT_INTENT_COVERAGE_HIGH,
+    DEFAULT_INTENT_COVERAGE_LOW,
+    DEFAULT_QUERY_LIST_CAPACITY,
     NOT_INITIALIZED,
     QUERY_LABEL,
     ScheduleLogForWebItem,
@@ -40,8 +50,25 @@ class GeneralScheduler(BaseScheduler):
         )
         self.act_mem_dump_path = self.config.get("act_mem_dump_path", DEFAULT_ACT_MEM_DUMP_PATH)
         self.search_method = TextMemory_SEARCH_METHOD
-        self._last_activation_mem_update_time = 0.0
-        self.query_list = []
+        self.enable_intent_precheck = self.config.get("enable_intent_precheck", True)
+        self.intent_coverage_high = self.config.get(
+            "intent_coverage_high", DEFAULT_INTENT_COVERAGE_HIGH
+        )
+        self.intent_coverage_low = self.config.get(
+            "intent_coverage_low", DEFAULT_INTENT_COVERAGE_LOW
+        )
+        self.evidence_search_timeout = self.config.get(
+            "evidence_search_timeout", DEFAULT_EVIDENCE_SEARCH_TIMEOUT_SECONDS
+        )
+        self.query_list_capacity = self.config.get(
+            "query_list_capacity", DEFAULT_QUERY_LIST_CAPACITY
+        )
+
+        # Per-(user, mem cube) state; the context being processed is bound per thread
+        self._contexts: dict[tuple[str | None, str | None], SchedulerContext] = {}
+        self._contexts_lock = threading.Lock()
+        self._thread_state = threading.local()
+        self._default_context = self._new_context(user_id=None, mem_cube_id=None)
 
         # register handlers
         handlers = {
@@ -53,11 +80,83 @@ class GeneralScheduler(BaseScheduler):
     def initialize_modules(self, chat_llm: BaseLLM):
         self.chat_llm = chat_llm
         self.monitor = SchedulerMonitor(
-            chat_llm=self.chat_llm, activation_mem_size=self.activation_mem_size
+            chat_llm=self.chat_llm,
+            activation_mem_size=self.activation_mem_size,
+            intent_coverage_high=self.intent_coverage_high,
+            intent_coverage_low=self.intent_coverage_low,
         )
         self.retriever = SchedulerRetriever(chat_llm=self.chat_llm)
         logger.debug("GeneralScheduler has been initialized")
 
+    def _new_context(
+        self,
+        user_id: str | None,
+        mem_cube_id: str | None,
+        mem_cube: GeneralMemCube | None = None,
+    ) -> SchedulerContext:
+        return SchedulerContext(
+            user_id=user_id,
+            mem_cube_id=mem_cube_id,
+            mem_cube=mem_cube,
+            query_list_capacity=self.query_list_capacity,
+            activation_mem_size=self.activation_mem_size,
+        )
+
+    def get_context(
+        self, user_id: str, mem_cube_id: str, mem_cube: GeneralMemCube | None = None
+    ) -> SchedulerContext:
+        """
+        Return the scheduling context of a (user, mem cube) pair, creating it if needed.
+
+        Args:
+            user_id: User the messages belong to.
+            mem_cube_id: Memory cube the messages target.
+            mem_cube: The cube object; replaces the stored one when given.
+        """
+        key = (user_id, mem_cube_id)
+        with self._contexts_lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = self._new_context(user_id, mem_cube_id)
+                self._contexts[key] = context
+        if isinstance(mem_cube, GeneralMemCube):
+            context.mem_cube = mem_cube
+        elif context.mem_cube is None:
+            # Messages from a Redis stream carry only the cube id
+            context.mem_cube = self.resolve_mem_cube(mem_cube_id)
+        return context
+
+    def _message_context(self, msg: ScheduleMessageItem) -> SchedulerContext:
+        """Context of a message; fails the message if its cube cannot be resolved."""
+        context = self.get_context(msg.user_id, msg.mem_cube_id, msg.mem_cube)
+        if context.mem_cube is None:
+            raise MemCubeError(
+                f"Memory cube {msg.mem_cube_id} is not registered with this scheduler; "
+                "register it with `register_mem_cube` or set `mem_cube_loader`"
+            )
+        return context
+
+    @property
+    def current_context(self) -> SchedulerContext:
+        """Context bound to the calling thread, or the default one outside of handlers."""
+        return getattr(self._thread_state, "context", None) or self._default_context
+
+    @contextmanager
+    def _bind_context(self, context: SchedulerContext) -> Iterator[SchedulerContext]:
+        """Bind `context` to the calling thread and hold its lock while processing."""
+        previous = getattr(self._thread_state, "context", None)
+        with context.lock:
+            self._thread_state.context = context
+            try:
+                yield context
+            finally:
+                self._thread_state.context = previous
+
+    @property
+    def query_list(self) -> list[str]:
+        """Recent queries of the current context, oldest first."""
+        return list(self.current_context.query_list)
+
     def _answer_message_consume(self, messages: list[ScheduleMessageItem]) -> None:
         """
         Process and handle answer trigger messages from the queue.
@@ -72,39 +171,35 @@ class GeneralScheduler(BaseScheduler):
                 logger.error(f"_answer_message_consume is not designed for {msg.label}")
                 continue
             answer = msg.content
-            self._current_user_id = msg.user_id
-            self._current_mem_cube_id = msg.mem_cube_id
-            self._current_mem_cube = msg.mem_cube
-
-            # Get current activation memory items
-            current_activation_mem = [
-                item["memory"]
-                for item in self.monitor.activation_memory_freq_list
-                if item["memory"] is not None
-            ]
-
-            # Update memory frequencies based on the answer
-            # TODO: not implemented
-            self.monitor.activation_memory_freq_list = self.monitor.update_freq(
-                answer=answer, activation_memory_freq_list=self.monitor.activation_memory_freq_list
-            )
+            context = self._message_context(msg)
+            with self._bind_context(context):
+                # Get current activation memory items
+                current_activation_mem = [
+                    item["memory"]
+                    for item in context.activation_memory_freq_list
+                    if item["memory"] is not None
+                ]
 
-            # Check if it's time to update activation memory
-            now = datetime.now()
-            if (now - self._last_activation_mem_update_time) >= timedelta(
-                seconds=self.act_mem_update_interval
-            ):
+                # Update memory frequencies based on the answer
                 # TODO: not implemented
-                self.update_activation_memory(current_activation_mem)
-                self._last_activation_mem_update_time = now
+                context.activation_memory_freq_list = self.monitor.update_freq(
+                    answer=answer, activation_memory_freq_list=context.activation_memory_freq_list
+                )
 
-            # recording messages
-            log_message = self.create_autofilled_log_item(
-                log_title="memos answer triggers scheduling...",
-                label=ANSWER_LABEL,
-                log_content="activation_memory has been updated",
-            )
-            self._submit_web_logs(messages=log_message)
+                # Check if it's time to update activation memory
+                now = time.time()
+                if now - context.last_activation_mem_update_time >= self.act_mem_update_interval:
+                    # TODO: not implemented
+                    self.update_activation_memory(current_activation_mem)
+                    context.last_activation_mem_update_time = now
+
+                # recording messages
+                log_message = self.create_autofilled_log_item(
+                    log_title="memos answer triggers scheduling...",
+                    label=ANSWER_LABEL,
+                    log_content="activation_memory has been updated",
+                )
+                self._submit_web_logs(messages=log_message)
 
     def _query_message_consume(self, messages: list[ScheduleMessageItem]) -> None:
         """
@@ -119,10 +214,9 @@ class GeneralScheduler(BaseScheduler):
                 logger.error(f"_query_message_consume is not designed for {msg.label}")
                 continue
             # Process the query in a session turn
-            self._current_user_id = msg.user_id
-            self._current_mem_cube_id = msg.mem_cube_id
-            self._current_mem_cube = msg.mem_cube
-            self.process_session_turn(query=msg.content, top_k=self.top_k, top_n=self.top_n)
+            context = self._message_context(msg)
+            with self._bind_context(context):
+                self.process_session_turn(query=msg.content, top_k=self.top_k, top_n=self.top_n)
 
     def process_session_turn(
         self,
@@ -136,27 +230,32 @@ class GeneralScheduler(BaseScheduler):
         - Immediately switch to the new memory if retrieval is triggered.
         """
         q_list = [query]
-        self.query_list.append(query)
+        self.current_context.query_list.append(query)
         text_mem_base = self.mem_cube.text_mem
         if isinstance(text_mem_base, TreeTextMemory):
             working_memory: list[TextualMemoryItem] = text_mem_base.get_working_memory()
         else:
             logger.error("Not implemented!")
             return
-        text_working_memory: list[str] = [w_m.memory for w_m in working_memory]
-        intent_result = self.monitor.detect_intent(
-            q_list=q_list, text_working_memory=text_working_memory
-        )
+        intent_result = None
+        if self.enable_intent_precheck:
+            intent_result = self.monitor.precheck_intent(
+                query=query,
+                query_embedding=self._embed_query(text_mem_base, query, working_memory),
+                working_memory=working_memory,
+            )
+        if intent_result is None:
+            text_working_memory: list[str] = [w_m.memory for w_m in working_memory]
+            intent_result = self.monitor.detect_intent(
+                q_list=q_list, text_working_memory=text_working_memory
+            )
         if intent_result["trigger_retrieval"]:
             missing_evidence = intent_result["missing_evidence"]
             num_evidence = len(missing_evidence)
             k_per_evidence = max(1, top_k // max(1, num_evidence))
-            new_candidates = []
-            for item in missing_evidence:
-                logger.debug(f"missing_evidence: {item}")
-                results = self.search(query=item, top_k=k_per_evidence, method=self.search_method)
-                logger.debug(f"search results for {missing_evidence}: {results}")
-                new_candidates.extend(results)
+            logger.debug(f"missing_evidence: {missing_evidence}")
+            new_candidates = self.search_evidence(evidence=missing_evidence, top_k=k_per_evidence)
+            logger.debug(f"search results for {missing_evidence}: {new_candidates}")
 
             # recording messages
             log_message = self.create_autofilled_log_item(
@@ -170,6 +269,24 @@ class GeneralScheduler(BaseScheduler):
             )
             self.update_activation_memory(new_order_working_memory)
 
+    def _embed_query(
+        self,
+        text_mem_base: TreeTextMemory,
+        query: str,
+        working_memory: list[TextualMemoryItem],
+    ) -> list[float] | None:
+        """Embed the query for the intent pre-check, or None if it cannot be used."""
+        embedder = getattr(text_mem_base, "embedder", None)
+        if embedder is None or not working_memory:
+            return None
+        if not all(getattr(item.metadata, "embedding", None) for item in working_memory):
+            return None
+        try:
+            return embedder.embed([query])[0]
+        except Exception as e:
+            logger.warning(f"Query embedding for intent pre-check failed: {e}")
+            return None
+
     def create_autofilled_log_item(
         self, log_title: str, log_content: str, label: str
     ) -> ScheduleLogForWebItem:
@@ -190,9 +307,10 @@ class GeneralScheduler(BaseScheduler):
             "parameter_memory_capacity": NOT_INITIALIZED,
         }
 
+        context = self.current_context
         log_message = ScheduleLogForWebItem(
-            user_id=self._current_user_id,
-            mem_cube_id=self._current_mem_cube_id,
+            user_id=context.user_id,
+            mem_cube_id=context.mem_cube_id,
             label=label,
             log_title=log_title,
             log_content=log_content,
@@ -203,14 +321,16 @@ class GeneralScheduler(BaseScheduler):
 
     @property
     def mem_cube(self) -> GeneralMemCube:
-        """The memory cube associated with this MemChat."""
-        return self._current_mem_cube
+        """The memory cube of the current context."""
+        return self.current_context.mem_cube
 
     @mem_cube.setter
     def mem_cube(self, value: GeneralMemCube) -> None:
-        """The memory cube associated with this MemChat."""
-        self._current_mem_cube = value
-        self.retriever.mem_cube = value
+        """
+        Set the memory cube of the current context. The retriever is shared by all
+        contexts, so retrieval calls take the cube of the current context as an argument.
+        """
+        self.current_context.mem_cube = value
 
     def replace_working_memory(
         self,
@@ -269,6 +389,78 @@ class GeneralScheduler(BaseScheduler):
             results = None
         return results
 
+    def search_evidence(
+        self,
+        evidence: list[str],
+        top_k: int,
+        memory_types: tuple[str, ...] = ("LongTermMemory", "UserMemory"),
+    ) -> list[TextualMemoryItem]:
+        """
+        Retrieve candidates for several missing-evidence strings at once.
+
+        All evidence strings are embedded in one call, each memory type gets one
+        multi-vector recall, and the recalls run concurrently under
+        `evidence_search_timeout`. Memory types that miss the deadline are skipped.
+
+        Args:
+            evidence: Missing-evidence strings from intent detection.
+            top_k: Number of candidates per evidence string and memory type.
+            memory_types: Memory types to search.
+
+        Returns:
+            Deduplicated candidates, grouped by evidence string in input order.
+        """
+        text_mem_base = self.mem_cube.text_mem
+        if not evidence:
+            return []
+        if not isinstance(text_mem_base, TreeTextMemory):
+            logger.error("Not implemented.")
+            return []
+
+        embeddings = text_mem_base.embedder.embed(evidence)
+        graph_store = text_mem_base.graph_store
+
+        executor = ThreadPoolExecutor(max_workers=len(memory_types))
+        try:
+            futures = {
+                executor.submit(
+                    graph_store.search_by_embeddings, embeddings, top_k, memory_type
+                ): memory_type
+                for memory_type in memory_types
+            }
+            done, not_done = wait(futures, timeout=self.evidence_search_timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for future in not_done:
+            logger.warning(
+                f"Evidence search in {futures[future]} exceeded "
+                f"{self.evidence_search_timeout}s and was skipped"
+            )
+
+        hits_by_type = {}
+        for future in done:
+            try:
+                hits_by_type[futures[future]] = future.result()
+            except Exception as e:
+                logger.warning(f"Evidence search in {futures[future]} failed: {e}")
+
+        ordered_ids = []
+        for i in range(len(evidence)):
+            for memory_type in memory_types:
+                hits = hits_by_type.get(memory_type) or []
+                if i < len(hits):
+                    ordered_ids.extend(hit["id"] for hit in hits[i])
+        ordered_ids = list(dict.fromkeys(ordered_ids))
+        if not ordered_ids:
+            return []
+
+        nodes = {node["id"]: node for node in graph_store.get_nodes(ordered_ids)}
+        return [
+            TextualMemoryItem.from_dict(nodes[node_id])
+            for node_id in ordered_ids
+            if node_id in nodes
+        ]
+
     def update_activation_memory(self, new_memory: list[str | TextualMemoryItem]) -> None:
         """
         Update activation memory by extracting KVCacheItems from new_memory (list of str),
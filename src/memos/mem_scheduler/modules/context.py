@@ -0,0 +1,45 @@
+import threading
+
+from collections import deque
+
+from memos.mem_cube.general import GeneralMemCube
+from memos.mem_scheduler.modules.schemas import (
+    DEFAULT_ACTIVATION_MEM_SIZE,
+    DEFAULT_QUERY_LIST_CAPACITY,
+)
+
+
+class SchedulerContext:
+    """
+    Scheduling state of one (user, mem cube) pair.
+
+    Handlers for the same pair run one at a time under `lock`; different pairs share
+    nothing, so they can be scheduled concurrently.
+    """
+
+    def __init__(
+        self,
+        user_id: str | None,
+        mem_cube_id: str | None,
+        mem_cube: GeneralMemCube | None = None,
+        query_list_capacity: int = DEFAULT_QUERY_LIST_CAPACITY,
+        activation_mem_size: int = DEFAULT_ACTIVATION_MEM_SIZE,
+    ):
+        self.user_id = user_id
+        self.mem_cube_id = mem_cube_id
+        self.mem_cube = mem_cube
+        # Ring buffer: the oldest queries are dropped once capacity is reached
+        self.query_list: deque[str] = deque(maxlen=query_list_capacity)
+        self.activation_memory_freq_list = [
+            {"memory": None, "count": 0} for _ in range(activation_mem_size)
+        ]
+        # Unix timestamp of the last activation memory update
+        self.last_activation_mem_update_time = 0.0
+        self.lock = threading.RLock()
+
+    @property
+    def key(self) -> tuple[str | None, str | None]:
+        return self.user_id, self.mem_cube_id
+
+    def __repr__(self) -> str:
+        return f"SchedulerContext(user_id={self.user_id!r}, mem_cube_id={self.mem_cube_id!r})"
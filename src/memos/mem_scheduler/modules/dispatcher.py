@@ -1,4 +1,6 @@
-from collections import defaultdict
+import threading
+
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 
@@ -16,7 +18,7 @@ class SchedulerDispatcher(BaseSchedulerModule):
     based on their labels.
 
     Features:
-    - Dedicated thread pool per message label
+    - Work partitioned by (user, mem cube): ordered within a cube, parallel across cubes
     - Batch message processing
     - Graceful shutdown
     - Bulk handler registration
@@ -37,6 +39,10 @@ class SchedulerDispatcher(BaseSchedulerModule):
         logger.info(f"enable_parallel_dispatch is set to {self.enable_parallel_dispatch}")
         # Registered message handlers
         self.handlers: dict[str, Callable] = {}
+        # Pending handler calls per cube key, drained by at most one worker per key
+        self._pending: dict[tuple[str, str], deque[Callable[[], None]]] = {}
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Condition(self._pending_lock)
         # Dispatcher running state
         self._running = False
 
@@ -73,31 +79,100 @@ class SchedulerDispatcher(BaseSchedulerModule):
     def _default_message_handler(self, messages: list[ScheduleMessageItem]) -> None:
         logger.debug(f"Using _default_message_handler to deal with messages: {messages}")
 
-    def dispatch(self, msg_list: list[ScheduleMessageItem]):
+    def dispatch(
+        self,
+        msg_list: list[ScheduleMessageItem],
+        on_error: Callable[[list[ScheduleMessageItem], Exception], None] | None = None,
+    ):
         """
         Dispatch a list of messages to their respective handlers.
 
+        Messages are partitioned by (user_id, mem_cube_id). Within a partition, runs of
+        consecutive messages with the same label are handed to the label's handler in
+        submission order; in parallel mode different partitions run concurrently while
+        each partition is processed by one worker at a time.
+
         Args:
             msg_list: List of ScheduleMessageItem objects to process
+            on_error: Called with the messages of a handler call that raised and the
+                exception, in both modes; the other calls still run. Without it, serial
+                mode propagates the exception and parallel mode logs it.
         """
-
-        # Group messages by their labels
-        label_groups = defaultdict(list)
-
-        # Organize messages by label
+        # Group messages by cube, then into consecutive runs of the same label
+        partitions: dict[tuple[str, str], list[list[ScheduleMessageItem]]] = {}
         for message in msg_list:
-            label_groups[message.label].append(message)
-
-        # Process each label group
-        for label, msgs in label_groups.items():
-            if label not in self.handlers:
-                logger.error(f"No handler registered for label: {label}")
-                handler = self._default_message_handler
+            runs = partitions.setdefault((message.user_id, message.mem_cube_id), [])
+            if runs and runs[-1][0].label == message.label:
+                runs[-1].append(message)
             else:
-                handler = self.handlers[label]
-            # dispatch to different handler
-            logger.debug(f"Dispatch {len(msgs)} messages to {label} handler.")
+                runs.append([message])
+
+        for key, runs in partitions.items():
+            calls = [self._make_call(msgs, on_error) for msgs in runs]
             if self.enable_parallel_dispatch and self.dispatcher_executor is not None:
-                self.dispatcher_executor.submit(handler, msgs)
+                self._submit_partition(key, calls)
             else:
-                handler(msgs)  # Direct serial execution
+                for handler_call in calls:
+                    handler_call()  # Direct serial execution
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all dispatched messages have been handled.
+
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            True if the dispatcher is idle, False if the timeout expired first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout=timeout)
+
+    def _make_call(
+        self,
+        msgs: list[ScheduleMessageItem],
+        on_error: Callable[[list[ScheduleMessageItem], Exception], None] | None = None,
+    ) -> Callable[[], None]:
+        label = msgs[0].label
+        if label not in self.handlers:
+            logger.error(f"No handler registered for label: {label}")
+            handler = self._default_message_handler
+        else:
+            handler = self.handlers[label]
+        logger.debug(f"Dispatch {len(msgs)} messages to {label} handler.")
+        if on_error is None:
+            return lambda: handler(msgs)
+
+        def handler_call() -> None:
+            try:
+                handler(msgs)
+            except Exception as e:
+                logger.error(f"Error handling {len(msgs)} {label} messages: {e!s}")
+                on_error(msgs, e)
+
+        return handler_call
+
+    def _submit_partition(self, key: tuple[str, str], calls: list[Callable[[], None]]) -> None:
+        with self._pending_lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # A worker is already draining this partition; it will pick these up in order
+                pending.extend(calls)
+                return
+            self._pending[key] = deque(calls)
+        self.dispatcher_executor.submit(self._drain_partition, key)
+
+    def _drain_partition(self, key: tuple[str, str]) -> None:
+        while True:
+            with self._pending_lock:
+                pending = self._pending[key]
+                if not pending:
+                    del self._pending[key]
+                    if not self._pending:
+                        self._idle.notify_all()
+                    return
+                handler_call = pending.popleft()
+            try:
+                handler_call()
+            except Exception as e:
+                logger.error(f"Error handling messages for {key}: {e!s}")
@@ -1,33 +1,50 @@
 import json
+import threading
 
 from typing import Any
 
+import numpy as np
+
 from memos.log import get_logger
 from memos.mem_cube.general import GeneralMemCube
 from memos.mem_scheduler.modules.base import BaseSchedulerModule
+from memos.mem_scheduler.modules.schemas import (
+    DEFAULT_INTENT_COVERAGE_HIGH,
+    DEFAULT_INTENT_COVERAGE_LOW,
+)
 from memos.mem_scheduler.utils import extract_json_dict
-from memos.memories.textual.tree import TreeTextMemory
+from memos.memories.textual.tree import TextualMemoryItem, TreeTextMemory
 
 
 logger = get_logger(__name__)
 
 
 class SchedulerMonitor(BaseSchedulerModule):
-    def __init__(self, chat_llm, activation_mem_size=5):
+    def __init__(
+        self,
+        chat_llm,
+        activation_mem_size=5,
+        intent_coverage_high=DEFAULT_INTENT_COVERAGE_HIGH,
+        intent_coverage_low=DEFAULT_INTENT_COVERAGE_LOW,
+    ):
         super().__init__()
         self.statistics = {}
         self.intent_history: list[str] = []
         self.activation_mem_size = activation_mem_size
-        self.activation_memory_freq_list = [
-            {"memory": None, "count": 0} for _ in range(self.activation_mem_size)
-        ]
+        self.intent_coverage_high = intent_coverage_high
+        self.intent_coverage_low = intent_coverage_low
+        self.intent_precheck_stats = {"skipped": 0, "triggered": 0, "escalated": 0}
+        # Guards `statistics` and `intent_precheck_stats`: partitions of different
+        # (user, mem cube) pairs update them concurrently
+        self._stats_lock = threading.Lock()
 
         self._chat_llm = chat_llm
 
     def update_stats(self, mem_cube):
-        self.statistics["activation_mem_size"] = self.activation_mem_size
         mem_cube_info = self.get_mem_cube_info(mem_cube)
-        self.statistics.update(mem_cube_info)
+        with self._stats_lock:
+            self.statistics["activation_mem_size"] = self.activation_mem_size
+            self.statistics.update(mem_cube_info)
 
     def get_mem_cube_info(self, mem_cube: GeneralMemCube):
         mem_cube_info = {}
@@ -59,6 +76,64 @@ class SchedulerMonitor(BaseSchedulerModule):
         response = extract_json_dict(response)
         return response
 
+    @staticmethod
+    def compute_coverage(
+        query_embedding: list[float], memory_embeddings: list[list[float]]
+    ) -> float:
+        """
+        Return the highest cosine similarity between the query and any working memory.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        memories = np.asarray(memory_embeddings, dtype=np.float32)
+        if query.size == 0 or memories.size == 0:
+            return 0.0
+        memory_norms = np.linalg.norm(memories, axis=1)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return 0.0
+        similarities = (memories @ query) / (np.maximum(memory_norms, 1e-12) * query_norm)
+        return float(similarities.max())
+
+    def precheck_intent(
+        self,
+        query: str,
+        query_embedding: list[float] | None,
+        working_memory: list[TextualMemoryItem],
+    ) -> dict[str, Any] | None:
+        """
+        Decide clear-cut turns from embedding coverage, without the LLM.
+
+        Coverage is the best cosine similarity between the query and the stored
+        embeddings of the working memories.
+
+        Returns:
+            An intent result in the `detect_intent` format when coverage is clearly high
+            (no retrieval) or clearly low (retrieve for the query itself), or None when the
+            case is ambiguous and should be escalated to `detect_intent`.
+        """
+        if not working_memory:
+            self._count_precheck("triggered")
+            return {"trigger_retrieval": True, "missing_evidence": [query]}
+        memory_embeddings = [getattr(item.metadata, "embedding", None) for item in working_memory]
+        if query_embedding is None or not all(memory_embeddings):
+            self._count_precheck("escalated")
+            return None
+
+        coverage = self.compute_coverage(query_embedding, memory_embeddings)
+        logger.debug(f"Working memory coverage for query: {coverage:.3f}")
+        if coverage >= self.intent_coverage_high:
+            self._count_precheck("skipped")
+            return {"trigger_retrieval": False, "missing_evidence": []}
+        if coverage <= self.intent_coverage_low:
+            self._count_precheck("triggered")
+            return {"trigger_retrieval": True, "missing_evidence": [query]}
+        self._count_precheck("escalated")
+        return None
+
+    def _count_precheck(self, outcome: str) -> None:
+        with self._stats_lock:
+            self.intent_precheck_stats[outcome] += 1
+
     def update_freq(
         self,
         answer: str,
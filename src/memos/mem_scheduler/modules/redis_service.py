@@ -9,6 +9,7 @@ from redis import Redis
 
 from memos.log import get_logger
 from memos.mem_scheduler.modules.base import BaseSchedulerModule
+from memos.mem_scheduler.modules.schemas import DEFAULT_QUERY_LIST_CAPACITY
 
 
 logger = get_logger(__name__)
@@ -28,7 +29,7 @@ class RedisSchedulerModule(BaseSchedulerModule):
         self.redis_port: int = None
         self.redis_db: int = None
         self._redis_conn = None
-        self.query_list_capacity = 1000
+        self.query_list_capacity = DEFAULT_QUERY_LIST_CAPACITY
 
         self._redis_listener_running = False
         self._redis_listener_thread: threading.Thread | None = None
@@ -0,0 +1,279 @@
+import asyncio
+import os
+import socket
+import threading
+import time
+
+from collections.abc import Callable, Iterable
+
+import redis.asyncio as aioredis
+
+from redis.exceptions import ResponseError
+
+from memos.configs.mem_scheduler import RedisStreamQueueConfig
+from memos.log import get_logger
+from memos.mem_scheduler.modules.schemas import ScheduleMessageItem
+
+
+logger = get_logger(__name__)
+
+StreamEntry = tuple[str, ScheduleMessageItem]
+# Returns the messages that failed (None if all succeeded); raising fails the whole batch
+BatchHandler = Callable[[list[ScheduleMessageItem]], Iterable[ScheduleMessageItem] | None]
+
+
+class RedisStreamQueue:
+    """
+    Scheduler message queue backed by a Redis stream and a consumer group.
+
+    Every scheduler process joins the same consumer group, so each message is
+    delivered to one consumer. Messages are read in batches with XREADGROUP and
+    acknowledged with XACK only once handled successfully. Messages left pending, by
+    a failed handler or a crashed consumer, are taken over with XAUTOCLAIM once they
+    have been idle for `claim_idle_ms`, which gives at-least-once processing. A
+    message delivered more than `max_deliveries` times is moved to the dead-letter
+    stream instead of being processed again.
+
+    The Redis client is asynchronous (`redis.asyncio`) and runs on a private event
+    loop thread; `submit`, `start` and `stop` can be called from any thread.
+    """
+
+    def __init__(self, config: RedisStreamQueueConfig, client: aioredis.Redis | None = None):
+        self.config = config
+        self.consumer_name = config.consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self._client = client
+        self._group_ready = False
+        self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._consume_future = None
+
+    @property
+    def client(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(self.config.url, decode_responses=True)
+        return self._client
+
+    # ─── Async primitives ──────────────────────────────────────────────────────
+
+    async def ensure_group(self) -> None:
+        """Create the stream and consumer group if they do not exist yet."""
+        if self._group_ready:
+            return
+        try:
+            await self.client.xgroup_create(
+                self.config.stream_key, self.config.consumer_group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def add(self, messages: list[ScheduleMessageItem]) -> list[str]:
+        """Append messages to the stream and return their stream ids."""
+        await self.ensure_group()
+        async with self.client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.xadd(
+                    self.config.stream_key,
+                    message.to_dict(),
+                    maxlen=self.config.max_stream_length,
+                    approximate=True,
+                )
+            return await pipe.execute()
+
+    async def read(self) -> list[StreamEntry]:
+        """Read up to `batch_size` new messages for this consumer."""
+        await self.ensure_group()
+        response = await self.client.xreadgroup(
+            self.config.consumer_group,
+            self.consumer_name,
+            {self.config.stream_key: ">"},
+            count=self.config.batch_size,
+            block=self.config.block_ms,
+        )
+        entries = []
+        for _, stream_entries in _stream_items(response):
+            entries.extend(stream_entries)
+        return await self._decode(entries)
+
+    async def reclaim(self) -> list[StreamEntry]:
+        """Take over messages another consumer left pending for longer than `claim_idle_ms`."""
+        await self.ensure_group()
+        response = await self.client.xautoclaim(
+            self.config.stream_key,
+            self.config.consumer_group,
+            self.consumer_name,
+            min_idle_time=self.config.claim_idle_ms,
+            count=self.config.batch_size,
+        )
+        claimed = response[1] if response else []
+        if claimed:
+            logger.info(f"Reclaimed {len(claimed)} pending scheduler messages")
+            claimed = await self._dead_letter_exhausted(claimed)
+        return await self._decode(claimed)
+
+    async def _dead_letter_exhausted(self, entries: list) -> list:
+        """Move entries delivered more than `max_deliveries` times out of the group."""
+        pending = await asyncio.gather(
+            *(
+                self.client.xpending_range(
+                    self.config.stream_key,
+                    self.config.consumer_group,
+                    min=message_id,
+                    max=message_id,
+                    count=1,
+                )
+                for message_id, _ in entries
+            )
+        )
+        deliveries = {
+            info["message_id"]: info["times_delivered"] for infos in pending for info in infos
+        }
+        kept, exhausted = [], []
+        for message_id, fields in entries:
+            if deliveries.get(message_id, 0) > self.config.max_deliveries and fields is not None:
+                exhausted.append((message_id, fields))
+            else:
+                kept.append((message_id, fields))
+        if not exhausted:
+            return kept
+
+        dead_letter_stream = self.config.dead_letter_stream
+        if dead_letter_stream is not None:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for message_id, fields in exhausted:
+                    pipe.xadd(
+                        dead_letter_stream,
+                        {
+                            **dict(fields),
+                            "original_id": message_id,
+                            "times_delivered": deliveries[message_id],
+                        },
+                    )
+                await pipe.execute()
+        await self.ack([message_id for message_id, _ in exhausted])
+        logger.error(
+            f"Moved {len(exhausted)} scheduler messages that failed "
+            f"{self.config.max_deliveries} deliveries to {dead_letter_stream or 'nowhere'}"
+        )
+        return kept
+
+    async def ack(self, ids: list[str]) -> None:
+        """Acknowledge processed messages."""
+        if ids:
+            await self.client.xack(self.config.stream_key, self.config.consumer_group, *ids)
+
+    async def consume(self, handler: BatchHandler) -> None:
+        """
+        Read, handle and acknowledge batches while the queue is running.
+
+        The handler runs in a worker thread and returns the messages it failed to
+        process. Those, or the whole batch if the handler raises, are not acknowledged,
+        so they are delivered again through `reclaim`.
+        """
+        next_reclaim = 0.0
+        while self._running:
+            try:
+                entries = []
+                if time.monotonic() >= next_reclaim:
+                    entries = await self.reclaim()
+                    next_reclaim = time.monotonic() + self.config.claim_idle_ms / 1000
+                if not entries:
+                    entries = await self.read()
+                if not entries:
+                    continue
+                failed = await asyncio.to_thread(handler, [message for _, message in entries])
+                failed_items = {message.item_id for message in failed or ()}
+                await self.ack(
+                    [
+                        message_id
+                        for message_id, message in entries
+                        if message.item_id not in failed_items
+                    ]
+                )
+                if failed_items:
+                    logger.warning(
+                        f"{len(failed_items)} scheduler messages failed and stay pending for retry"
+                    )
+            except Exception as e:
+                logger.error(f"Error consuming scheduler stream: {e}")
+                await asyncio.sleep(1)
+
+    async def _decode(self, entries) -> list[StreamEntry]:
+        decoded = []
+        invalid_ids = []
+        for message_id, fields in entries:
+            if fields is None:
+                # Entry was trimmed from the stream while pending
+                invalid_ids.append(message_id)
+                continue
+            try:
+                decoded.append((message_id, ScheduleMessageItem.from_dict(dict(fields))))
+            except Exception as e:
+                logger.error(f"Dropping malformed scheduler message {message_id}: {e}")
+                invalid_ids.append(message_id)
+        await self.ack(invalid_ids)
+        return decoded
+
+    # ─── Thread-safe facade ────────────────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, daemon=True, name="RedisStreamQueueLoop"
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    def submit(self, messages: list[ScheduleMessageItem], timeout: float = 10.0) -> list[str]:
+        """Add messages to the stream from any thread."""
+        future = asyncio.run_coroutine_threadsafe(self.add(messages), self._ensure_loop())
+        return future.result(timeout=timeout)
+
+    def start(self, handler: BatchHandler) -> None:
+        """Start consuming in the background, passing each batch to `handler`."""
+        if self._consume_future is not None and not self._consume_future.done():
+            logger.warning("Redis stream consumer is already running")
+            return
+        self._running = True
+        self._consume_future = asyncio.run_coroutine_threadsafe(
+            self.consume(handler), self._ensure_loop()
+        )
+        logger.info(
+            f"Consuming {self.config.stream_key} as {self.consumer_name} "
+            f"in group {self.config.consumer_group}"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop consuming, close the client and shut down the event loop."""
+        self._running = False
+        if self._loop is None:
+            return
+        if self._consume_future is not None:
+            try:
+                self._consume_future.result(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Redis stream consumer did not stop cleanly: {e}")
+            self._consume_future = None
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result(
+                timeout=timeout
+            )
+            self._client = None
+            self._group_ready = False
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=timeout)
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+
+
+def _stream_items(response) -> list:
+    """Normalize XREADGROUP replies (RESP2 list or RESP3 dict) to (stream, entries) pairs."""
+    if not response:
+        return []
+    if isinstance(response, dict):
+        return [(stream, entries[0] if entries else []) for stream, entries in response.items()]
+    return response
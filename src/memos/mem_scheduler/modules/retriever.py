@@ -1,4 +1,5 @@
 from memos.log import get_logger
+from memos.mem_cube.general import GeneralMemCube
 from memos.mem_scheduler.modules.base import BaseSchedulerModule
 
 
@@ -9,7 +10,6 @@ class SchedulerRetriever(BaseSchedulerModule):
     def __init__(self, chat_llm, context_window_size=5):
         """
         monitor: Object used to acquire monitoring information
-        mem_cube: Object/interface for querying the underlying database
         context_window_size: Size of the context window for conversation history
         """
         super().__init__()
@@ -18,7 +18,6 @@ class SchedulerRetriever(BaseSchedulerModule):
         self.context_window_size = context_window_size
 
         self._chat_llm = chat_llm
-        self._current_mem_cube = None
 
     @property
     def memory_texts(self) -> list[str]:
@@ -37,5 +36,15 @@ class SchedulerRetriever(BaseSchedulerModule):
         """
         return self._memory_text_list[-self.context_window_size :]
 
-    def retrieve(self, query: str, memory_texts: list[str], top_k: int = 5) -> list[str]:
+    def retrieve(
+        self,
+        query: str,
+        memory_texts: list[str],
+        top_k: int = 5,
+        mem_cube: GeneralMemCube | None = None,
+    ) -> list[str]:
+        """
+        Retrieve memories for `query` from `mem_cube`. The retriever is shared by the
+        scheduling contexts of all (user, mem cube) pairs, so it holds no cube itself.
+        """
         return None
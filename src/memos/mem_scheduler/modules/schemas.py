@@ -21,6 +21,10 @@ DEFAULT_ACTIVATION_MEM_SIZE = 5
 DEFAULT_ACT_MEM_DUMP_PATH = f"{BASE_DIR}/outputs/mem_scheduler/mem_cube_scheduler_test.kv_cache"
 DEFAULT_THREAD__POOL_MAX_WORKERS = 5
 DEFAULT_CONSUME_INTERVAL_SECONDS = 3
+DEFAULT_INTENT_COVERAGE_HIGH = 0.85
+DEFAULT_INTENT_COVERAGE_LOW = 0.3
+DEFAULT_EVIDENCE_SEARCH_TIMEOUT_SECONDS = 10.0
+DEFAULT_QUERY_LIST_CAPACITY = 1000
 NOT_INITIALIZED = -1
 BaseModelType = TypeVar("T", bound="BaseModel")
 
@@ -68,7 +72,6 @@ class ScheduleMessageItem(BaseModel, DictConversionMixin):
             "item_id": self.item_id,
             "user_id": self.user_id,
             "cube_id": self.mem_cube_id,
-            "message_id": self.message_id,
             "label": self.label,
             "cube": "Not Applicable",  # Custom cube serialization
             "content": self.content,
@@ -81,10 +84,9 @@ class ScheduleMessageItem(BaseModel, DictConversionMixin):
         return cls(
             item_id=data.get("item_id", str(uuid4())),
             user_id=data["user_id"],
-            cube_id=data["cube_id"],
-            message_id=data.get("message_id", str(uuid4())),
+            mem_cube_id=data["cube_id"],
             label=data["label"],
-            cube="Not Applicable",  # Custom cube deserialization
+            mem_cube="Not Applicable",  # Custom cube deserialization
             content=data["content"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
         )
@@ -1,3 +1,4 @@
+import itertools
 import json
 import os
 
@@ -8,6 +9,7 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from memos.configs.memory import GeneralTextMemoryConfig
 from memos.embedders.factory import EmbedderFactory, OllamaEmbedder
+from memos.filters import MetadataFilter
 from memos.llms.factory import LLMFactory, OllamaLLM, OpenAILLM
 from memos.log import get_logger
 from memos.memories.textual.base import BaseTextMemory
@@ -19,6 +21,9 @@ from memos.vec_dbs.item import VecDBItem
 
 logger = get_logger(__name__)
 
+# Number of records handed to the vector db per `add` call when loading a dump
+LOAD_CHUNK_SIZE = 10_000
+
 
 class GeneralTextMemory(BaseTextMemory):
     """General textual memory implementation for storing and retrieving memories."""
@@ -102,16 +107,23 @@ class GeneralTextMemory(BaseTextMemory):
 
         self.vector_db.update(memory_id, vec_db_item)
 
-    def search(self, query: str, top_k: int) -> list[TextualMemoryItem]:
+    def search(
+        self, query: str, top_k: int, filter: MetadataFilter | None = None
+    ) -> list[TextualMemoryItem]:
         """Search for memories based on a query.
         Args:
             query (str): The query to search for.
             top_k (int): The number of top results to return.
+            filter (MetadataFilter, optional): Payload filter applied before ranking,
+                e.g. {"field": "metadata.user_id", "op": "=", "value": "u1"}.
         Returns:
             list[TextualMemoryItem]: List of matching memories.
         """
         query_vector = self._embed_one_sentence(query)
-        search_results = self.vector_db.search(query_vector, top_k)
+        if filter:
+            search_results = self.vector_db.search(query_vector, top_k, filter=filter)
+        else:
+            search_results = self.vector_db.search(query_vector, top_k)
         search_results = sorted(  # make higher score first
             search_results, key=lambda x: x.score, reverse=True
         )
@@ -122,7 +134,7 @@ class GeneralTextMemory(BaseTextMemory):
 
     def get(self, memory_id: str) -> TextualMemoryItem:
         """Get a memory by its ID."""
-        result = self.vector_db.get_by_id(memory_id)
+        result = self.vector_db.get_by_id(memory_id, with_vectors=False)
         if result is None:
             raise ValueError(f"Memory with ID {memory_id} not found")
         return TextualMemoryItem(**result.payload)
@@ -134,7 +146,7 @@ class GeneralTextMemory(BaseTextMemory):
         Returns:
             list[TextualMemoryItem]: List of memories with the specified IDs.
         """
-        db_items = self.vector_db.get_by_ids(memory_ids)
+        db_items = self.vector_db.get_by_ids(memory_ids, with_vectors=False)
         memories = [TextualMemoryItem(**db_item.payload) for db_item in db_items]
         return memories
 
@@ -157,6 +169,11 @@ class GeneralTextMemory(BaseTextMemory):
         self.vector_db.create_collection()
 
     def load(self, dir: str) -> None:
+        """Load memories from os.path.join(dir, self.config.memory_filename).
+
+        A `.jsonl` file is streamed line by line, so only one chunk of records is
+        resident at a time; any other file is read as a single JSON array.
+        """
         try:
             memory_file = os.path.join(dir, self.config.memory_filename)
 
@@ -164,12 +181,19 @@ class GeneralTextMemory(BaseTextMemory):
                 logger.warning(f"Memory file not found: {memory_file}")
                 return
 
+            loaded = 0
             with open(memory_file, encoding="utf-8") as f:
-                memories = json.load(f)
+                if memory_file.endswith(".jsonl"):
+                    records = (json.loads(line) for line in f if line.strip())
+                else:
+                    records = iter(json.load(f))
+
+                while chunk := list(itertools.islice(records, LOAD_CHUNK_SIZE)):
+                    self.vector_db.add([VecDBItem.from_dict(m) for m in chunk])
+                    loaded += len(chunk)
+                    logger.debug(f"Loaded {loaded} memories so far from {memory_file}")
 
-            vec_db_items = [VecDBItem.from_dict(m) for m in memories]
-            self.vector_db.add(vec_db_items)
-            logger.info(f"Loaded {len(memories)} memories from {memory_file}")
+            logger.info(f"Loaded {loaded} memories from {memory_file}")
 
         except FileNotFoundError:
             logger.error(f"Memory file not found in directory: {dir}")
@@ -179,17 +203,31 @@ class GeneralTextMemory(BaseTextMemory):
             logger.error(f"An error occurred while loading memories: {e}")
 
     def dump(self, dir: str) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)"""
-        try:
-            all_vec_db_items = self.vector_db.get_all()
-            json_memories = [memory.to_dict() for memory in all_vec_db_items]
+        """Dump memories to os.path.join(dir, self.config.memory_filename).
 
+        With a `.jsonl` filename the collection is scrolled page by page and each
+        memory is written as one JSON line; otherwise a single JSON array is written.
+        """
+        try:
             os.makedirs(dir, exist_ok=True)
             memory_file = os.path.join(dir, self.config.memory_filename)
-            with open(memory_file, "w", encoding="utf-8") as f:
-                json.dump(json_memories, f, indent=4, ensure_ascii=False)
 
-            logger.info(f"Dumped {len(all_vec_db_items)} memories to {memory_file}")
+            if memory_file.endswith(".jsonl"):
+                dumped = 0
+                with open(memory_file, "w", encoding="utf-8") as f:
+                    for page in self.vector_db.iter_by_filter(None):
+                        for memory in page:
+                            f.write(json.dumps(memory.to_dict(), ensure_ascii=False) + "\n")
+                        dumped += len(page)
+                        logger.debug(f"Dumped {dumped} memories so far to {memory_file}")
+            else:
+                all_vec_db_items = self.vector_db.get_all()
+                json_memories = [memory.to_dict() for memory in all_vec_db_items]
+                with open(memory_file, "w", encoding="utf-8") as f:
+                    json.dump(json_memories, f, indent=4, ensure_ascii=False)
+                dumped = len(all_vec_db_items)
+
+            logger.info(f"Dumped {dumped} memories to {memory_file}")
 
         except Exception as e:
             logger.error(f"An error occurred while dumping memories: {e}")
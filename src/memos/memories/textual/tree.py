@@ -14,10 +14,13 @@ from memos.llms.factory import LLMFactory, OllamaLLM, OpenAILLM
 from memos.log import get_logger
 from memos.memories.textual.base import BaseTextMemory
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory import columnar_dump
 from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager
+from memos.memories.textual.tree_text_memory.organize.reorganizer import GraphReorganizer
 from memos.memories.textual.tree_text_memory.retrieve.internet_retriever_factory import (
     InternetRetrieverFactory,
 )
+from memos.memories.textual.tree_text_memory.retrieve.reranker_factory import RerankerFactory
 from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
 from memos.types import MessageList
 
@@ -35,7 +38,21 @@ class TreeTextMemory(BaseTextMemory):
         self.dispatcher_llm: OpenAILLM | OllamaLLM = LLMFactory.from_config(config.dispatcher_llm)
         self.embedder: OllamaEmbedder = EmbedderFactory.from_config(config.embedder)
         self.graph_store: Neo4jGraphDB = GraphStoreFactory.from_config(config.graph_db)
-        self.memory_manager: MemoryManager = MemoryManager(self.graph_store, self.embedder)
+        self.memory_manager: MemoryManager = MemoryManager(
+            self.graph_store,
+            self.embedder,
+            cache_working_memory=config.cache_working_memory,
+            background_eviction=config.background_eviction,
+            inline_dedup=config.inline_dedup,
+        )
+        self.reorganizer = GraphReorganizer(
+            self.graph_store,
+            self.dispatcher_llm,
+            config.reorganizer,
+            on_change=self.memory_manager.invalidate_working_memory,
+        )
+        if config.reorganizer.enabled:
+            self.reorganizer.start()
 
         # Create internet retriever if configured
         self.internet_retriever = None
@@ -49,6 +66,12 @@ class TreeTextMemory(BaseTextMemory):
         else:
             logger.info("No internet retriever configured")
 
+        # Load the reranker model once; it is shared by all searches
+        self.reranker = None
+        if config.reranker is not None:
+            self.reranker = RerankerFactory.from_config(config.reranker)
+            logger.info(f"Reranker initialized with backend: {config.reranker.backend}")
+
     def add(self, memories: list[TextualMemoryItem | dict[str, Any]]) -> None:
         """Add memories.
         Args:
@@ -65,13 +88,15 @@ class TreeTextMemory(BaseTextMemory):
         self.memory_manager.replace_working_memory(memories)
 
     def get_working_memory(self) -> list[TextualMemoryItem]:
-        working_memories = self.graph_store.get_all_memory_items(scope="WorkingMemory")
-        items = [TextualMemoryItem.from_dict(record) for record in (working_memories)]
-        # Sort by updated_at in descending order
-        sorted_items = sorted(
-            items, key=lambda x: x.metadata.updated_at or datetime.min, reverse=True
-        )
-        return sorted_items
+        """Working memory items, most recently updated first (cached by the MemoryManager)."""
+        return self.memory_manager.get_working_memory()
+
+    def reorganize(self) -> dict[str, int]:
+        """
+        Merge near-duplicate memories and record conflicts now, in the calling thread.
+        See `GraphReorganizer.run_once`.
+        """
+        return self.reorganizer.run_once()
 
     def get_current_memory_size(self) -> dict[str, int]:
         """
@@ -98,6 +123,7 @@ class TreeTextMemory(BaseTextMemory):
             info (dict): Leave a record of memory consumption.
             mode (str, optional): The mode of the search.
             - 'fast': Uses a faster search process, sacrificing some precision for speed.
+            - 'balanced': Fast search reranked by the configured local cross-encoder.
             - 'fine': Uses a more detailed search process, invoking large models for higher precision, but slower performance.
             memory_type (str): Type restriction for search.
             ['All', 'WorkingMemory', 'LongTermMemory', 'UserMemory']
@@ -115,6 +141,9 @@ class TreeTextMemory(BaseTextMemory):
             self.graph_store,
             self.embedder,
             internet_retriever=self.internet_retriever,
+            cross_encoder_reranker=self.reranker,
+            working_memory_reader=self.memory_manager.get_working_memory,
+            deadlines=self.config.search_deadlines,
         )
         return searcher.search(query, top_k, info, mode, memory_type)
 
@@ -232,13 +261,28 @@ class TreeTextMemory(BaseTextMemory):
         """Delete all memories and their relationships from the graph store."""
         try:
             self.graph_store.clear()
+            self.memory_manager.invalidate_caches()
             logger.info("All memories and edges have been deleted from the graph.")
         except Exception as e:
             logger.error(f"An error occurred while deleting all memories: {e}")
             raise
 
     def load(self, dir: str) -> None:
+        """Load memories from a dump in `dir`.
+
+        A columnar dump directory (see `columnar_dump`) takes precedence over the
+        JSON file; it is imported in bulk batches without reading it all into memory.
+        `dump` removes the output of the other format, so only the latest snapshot
+        is kept in `dir`.
+        """
+        # Imported nodes may include working memory
+        self.memory_manager.invalidate_caches()
         try:
+            columnar_dir = self._columnar_dump_dir(dir)
+            if columnar_dump.is_columnar_dump(columnar_dir):
+                self._load_columnar(columnar_dir)
+                return
+
             memory_file = os.path.join(dir, self.config.memory_filename)
 
             if not os.path.exists(memory_file):
@@ -257,16 +301,42 @@ class TreeTextMemory(BaseTextMemory):
             logger.error(f"Error decoding JSON from memory file: {e}")
         except Exception as e:
             logger.error(f"An error occurred while loading memories: {e}")
+        finally:
+            # Reads made while the import ran may have cached a partial graph
+            self.memory_manager.invalidate_caches()
 
     def dump(self, dir: str) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)"""
+        """Dump memories to `dir` in the configured `dump_format`.
+
+        - json: os.path.join(dir, self.config.memory_filename)
+        - columnar: a directory next to it, named after the memory filename stem
+        """
         try:
+            if self.config.dump_format == "columnar":
+                columnar_dir = self._columnar_dump_dir(dir)
+                manifest = columnar_dump.write_columnar_dump(
+                    columnar_dir,
+                    self.graph_store.iter_nodes(),
+                    self.graph_store.iter_edges(),
+                    embedding_dtype=self.config.dump_embedding_dtype,
+                )
+                # Keep only the latest snapshot in `dir`
+                memory_file = os.path.join(dir, self.config.memory_filename)
+                if os.path.exists(memory_file):
+                    os.remove(memory_file)
+                logger.info(f"Dumped {manifest['num_nodes']} memories to {columnar_dir}")
+                return
+
             json_memories = self.graph_store.export_graph()
 
             os.makedirs(dir, exist_ok=True)
             memory_file = os.path.join(dir, self.config.memory_filename)
             with open(memory_file, "w", encoding="utf-8") as f:
                 json.dump(json_memories, f, indent=4, ensure_ascii=False)
+            # A columnar dump takes precedence on load, so an older one must not survive
+            columnar_dir = self._columnar_dump_dir(dir)
+            if os.path.isdir(columnar_dir):
+                shutil.rmtree(columnar_dir)
 
             logger.info(f"Dumped {len(json_memories.get('nodes'))} memories to {memory_file}")
 
@@ -274,6 +344,19 @@ class TreeTextMemory(BaseTextMemory):
             logger.error(f"An error occurred while dumping memories: {e}")
             raise
 
+    def _columnar_dump_dir(self, dir: str) -> str:
+        """Directory of the columnar dump inside `dir`, e.g. `textual_memory.columnar`."""
+        return os.path.join(dir, Path(self.config.memory_filename).stem + ".columnar")
+
+    def _load_columnar(self, columnar_dir: str, batch_size: int = 1000) -> None:
+        """Bulk-import a columnar dump batch by batch."""
+        manifest = columnar_dump.read_manifest(columnar_dir)
+        for nodes in columnar_dump.iter_columnar_nodes(columnar_dir, batch_size=batch_size):
+            self.graph_store.import_nodes(nodes)
+        for edges in columnar_dump.iter_columnar_edges(columnar_dir, batch_size=batch_size):
+            self.graph_store.import_edges(edges)
+        logger.info(f"Loaded {manifest['num_nodes']} memories from {columnar_dir}")
+
     def drop(self, keep_last_n: int = 30) -> None:
         """
         Export all memory data to a versioned backup dir and drop the Neo4j database.
@@ -294,6 +377,7 @@ class TreeTextMemory(BaseTextMemory):
             self._cleanup_old_backups(backup_root, keep_last_n)
 
             self.graph_store.drop_database()
+            self.memory_manager.invalidate_caches()
             logger.info(f"Database '{self.graph_store.db_name}' dropped after backup.")
 
         except Exception as e:
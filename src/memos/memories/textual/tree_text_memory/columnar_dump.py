@@ -0,0 +1,277 @@
+"""Columnar on-disk format for tree textual memory dumps.
+
+A dump is a directory with:
+
+- ``manifest.json``: format version and counts, written last so its presence marks a
+  complete dump.
+- ``embeddings.npy``: a ``(num_embedded_nodes, dim)`` matrix that can be memory-mapped
+  with ``np.load(..., mmap_mode="r")``. It is float32 by default; float16 halves it and
+  int8 quarters it, with one float32 scale per row stored in ``embedding_scales.npy``.
+- ``nodes.jsonl``: one node per line (``id``, ``memory``, ``metadata`` without the
+  embedding, and ``embedding_row`` pointing into the matrix or null).
+- ``edges.jsonl``: one ``{"source", "target", "type"}`` edge per line.
+
+Both export and import stream, so neither side needs the whole graph in memory.
+"""
+
+import io
+import itertools
+import json
+import os
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+FORMAT_NAME = "memos-columnar-graph"
+FORMAT_VERSION = 1
+
+MANIFEST_FILENAME = "manifest.json"
+EMBEDDINGS_FILENAME = "embeddings.npy"
+EMBEDDING_SCALES_FILENAME = "embedding_scales.npy"
+NODES_FILENAME = "nodes.jsonl"
+EDGES_FILENAME = "edges.jsonl"
+
+# Bytes reserved for the .npy header; the real header is written once the shape is known
+_NPY_HEADER_SIZE = 128
+_EMBEDDING_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "float16": np.dtype("<f2"),
+    "int8": np.dtype("i1"),
+}
+_SCALE_DTYPE = np.dtype("<f4")
+
+
+def quantize_embedding(
+    embedding: list[float] | np.ndarray, dtype: str = "float32"
+) -> tuple[np.ndarray, float | None]:
+    """
+    Convert one embedding to the storage dtype.
+
+    int8 uses symmetric per-vector scaling: ``q = round(v / scale)`` with
+    ``scale = max(|v|) / 127``, so the error per component is at most ``scale / 2``.
+
+    Returns:
+        The stored vector and its scale (None unless dtype is int8).
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if dtype != "int8":
+        return vector.astype(_EMBEDDING_DTYPES[dtype]), None
+    max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = max_abs / 127.0 if max_abs > 0 else 1.0
+    quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+    return quantized, scale
+
+
+def dequantize_embeddings(stored: np.ndarray, scales: np.ndarray | None = None) -> np.ndarray:
+    """Restore float32 embeddings from stored rows (and per-row scales for int8)."""
+    restored = np.asarray(stored, dtype=np.float32)
+    if scales is not None:
+        restored = restored * np.asarray(scales, dtype=np.float32)[..., None]
+    return restored
+
+
+def is_columnar_dump(path: str) -> bool:
+    """Return True if `path` is a complete columnar dump directory."""
+    return os.path.isfile(os.path.join(path, MANIFEST_FILENAME))
+
+
+def write_columnar_dump(
+    out_dir: str,
+    nodes: Iterable[dict[str, Any]],
+    edges: Iterable[dict[str, Any]],
+    embedding_dtype: str = "float32",
+) -> dict[str, Any]:
+    """
+    Stream graph nodes and edges into a columnar dump directory.
+
+    Args:
+        out_dir: Target directory, created if needed.
+        nodes: Node dicts as returned by the graph store (`id`, `memory`, `metadata`).
+        edges: Edge dicts with `source`, `target` and `type`.
+        embedding_dtype: Storage dtype of the embedding matrix: float32, float16 or int8.
+
+    Returns:
+        The manifest written to `manifest.json`.
+    """
+    if embedding_dtype not in _EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {embedding_dtype}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        # Invalidate the previous dump until this one is complete
+        os.remove(manifest_path)
+
+    num_nodes = 0
+    num_rows = 0
+    dim: int | None = None
+    scales: list[float] = []
+    with (
+        open(os.path.join(out_dir, EMBEDDINGS_FILENAME), "wb") as emb_file,
+        open(os.path.join(out_dir, NODES_FILENAME), "w", encoding="utf-8") as node_file,
+    ):
+        emb_file.write(b"\x00" * _NPY_HEADER_SIZE)
+        for node in nodes:
+            metadata = dict(node.get("metadata") or {})
+            embedding = metadata.pop("embedding", None)
+            row = None
+            if embedding:
+                vector, scale = quantize_embedding(embedding, embedding_dtype)
+                if dim is None:
+                    dim = len(vector)
+                elif len(vector) != dim:
+                    raise ValueError(
+                        f"Node {node['id']} has embedding dimension {len(vector)}, expected {dim}"
+                    )
+                emb_file.write(vector.tobytes())
+                if scale is not None:
+                    scales.append(scale)
+                row = num_rows
+                num_rows += 1
+            record = {
+                "id": node["id"],
+                "memory": node.get("memory", ""),
+                "metadata": metadata,
+                "embedding_row": row,
+            }
+            node_file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            num_nodes += 1
+
+        emb_file.seek(0)
+        emb_file.write(_npy_header((num_rows, dim or 0), _EMBEDDING_DTYPES[embedding_dtype]))
+
+    scales_path = os.path.join(out_dir, EMBEDDING_SCALES_FILENAME)
+    if embedding_dtype == "int8":
+        np.save(scales_path, np.asarray(scales, dtype=_SCALE_DTYPE))
+    elif os.path.exists(scales_path):
+        os.remove(scales_path)
+
+    num_edges = 0
+    with open(os.path.join(out_dir, EDGES_FILENAME), "w", encoding="utf-8") as edge_file:
+        for edge in edges:
+            record = {"source": edge["source"], "target": edge["target"], "type": edge["type"]}
+            edge_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            num_edges += 1
+
+    manifest = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "embedding_dim": dim or 0,
+        "embedding_dtype": embedding_dtype,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(dump_dir: str) -> dict[str, Any]:
+    """Read and validate the manifest of a columnar dump."""
+    with open(os.path.join(dump_dir, MANIFEST_FILENAME), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"Not a columnar graph dump: {dump_dir}")
+    if manifest.get("version", 0) > FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar dump version: {manifest['version']}")
+    return manifest
+
+
+def load_embedding_matrix(dump_dir: str) -> np.ndarray:
+    """Memory-map the embedding matrix of a columnar dump, in its stored dtype."""
+    return np.load(os.path.join(dump_dir, EMBEDDINGS_FILENAME), mmap_mode="r")
+
+
+def load_embedding_scales(dump_dir: str) -> np.ndarray | None:
+    """Per-row scales of an int8 embedding matrix, or None for float dumps."""
+    scales_path = os.path.join(dump_dir, EMBEDDING_SCALES_FILENAME)
+    if not os.path.exists(scales_path):
+        return None
+    return np.load(scales_path, mmap_mode="r")
+
+
+def iter_columnar_nodes(dump_dir: str, batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream nodes from a columnar dump in batches, with embeddings restored into metadata.
+
+    Args:
+        dump_dir: Dump directory.
+        batch_size: Number of nodes per yielded batch.
+
+    Yields:
+        Lists of node dicts in graph store format (`id`, `memory`, `metadata`).
+    """
+    read_manifest(dump_dir)
+    embeddings = load_embedding_matrix(dump_dir)
+    scales = load_embedding_scales(dump_dir)
+    with open(os.path.join(dump_dir, NODES_FILENAME), encoding="utf-8") as f:
+        records = (json.loads(line) for line in f if line.strip())
+        while batch := list(itertools.islice(records, batch_size)):
+            nodes = []
+            for record in batch:
+                metadata = record["metadata"]
+                row = record.get("embedding_row")
+                if row is not None:
+                    row_scale = None if scales is None else scales[row : row + 1]
+                    metadata["embedding"] = dequantize_embeddings(
+                        embeddings[row : row + 1], row_scale
+                    )[0].tolist()
+                nodes.append({"id": record["id"], "memory": record["memory"], "metadata": metadata})
+            yield nodes
+
+
+def iter_columnar_edges(dump_dir: str, batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
+    """Stream edges from a columnar dump in batches."""
+    with open(os.path.join(dump_dir, EDGES_FILENAME), encoding="utf-8") as f:
+        records = (json.loads(line) for line in f if line.strip())
+        while batch := list(itertools.islice(records, batch_size)):
+            yield batch
+
+
+def convert_json_dump(
+    json_file: str, out_dir: str, embedding_dtype: str = "float32"
+) -> dict[str, Any]:
+    """
+    Convert a JSON dump written by `TreeTextMemory.dump` into the columnar format.
+
+    Args:
+        json_file: Path of the JSON dump (`{"nodes": [...], "edges": [...]}`).
+        out_dir: Target directory of the columnar dump.
+        embedding_dtype: Storage dtype of the embedding matrix: float32, float16 or int8.
+
+    Returns:
+        The manifest of the new dump.
+    """
+    with open(json_file, encoding="utf-8") as f:
+        data = json.load(f)
+    manifest = write_columnar_dump(
+        out_dir, data.get("nodes", []), data.get("edges", []), embedding_dtype=embedding_dtype
+    )
+    logger.info(
+        f"Converted {manifest['num_nodes']} nodes and {manifest['num_edges']} edges "
+        f"from {json_file} to {out_dir}"
+    )
+    return manifest
+
+
+def _npy_header(shape: tuple[int, int], dtype: np.dtype) -> bytes:
+    buffer = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        buffer,
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": shape,
+        },
+    )
+    header = buffer.getvalue()
+    if len(header) != _NPY_HEADER_SIZE:
+        raise ValueError(f"Unexpected .npy header size {len(header)} for shape {shape}")
+    return header
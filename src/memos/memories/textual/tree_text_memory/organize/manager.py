@@ -1,8 +1,10 @@
+import threading
 import uuid
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+from memos import telemetry
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.log import get_logger
@@ -20,6 +22,9 @@ class MemoryManager:
         memory_size: dict | None = None,
         threshold: float | None = 0.80,
         merged_threshold: float | None = 0.92,
+        cache_working_memory: bool = True,
+        background_eviction: bool = False,
+        inline_dedup: bool = True,
     ):
         self.graph_store = graph_store
         self.embedder = embedder
@@ -37,11 +42,39 @@ class MemoryManager:
             }
         self._threshold = threshold
         self._merged_threshold = merged_threshold
+        # Without inline dedup, near-duplicates are merged later by the GraphReorganizer
+        self.inline_dedup = inline_dedup
+
+        # Node counts per memory type, counted once from the graph store and then
+        # tracked from the writes and evictions made through this manager
+        self._size_lock = threading.Lock()
+        self._size_synced = False
+        # Serializes evictions so that concurrent runs do not delete the same overflow
+        self._eviction_lock = threading.Lock()
+        self._eviction_pending = False
+        # Structure node registry: structure key -> node ID of the parent nodes that
+        # tagged memories are linked to
+        self._structure_lock = threading.Lock()
+        self._structure_nodes: dict[str, str] = {}
+        self._maintenance_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="memos-eviction")
+            if background_eviction
+            else None
+        )
+
+        # Working memory snapshot, valid while its version matches the current one.
+        # Every write path through this manager bumps the version.
+        self.cache_working_memory = cache_working_memory
+        self._working_memory_lock = threading.Lock()
+        self._working_memory_version = 0
+        self._working_memory_snapshot: tuple[int, list[TextualMemoryItem]] | None = None
 
+    @telemetry.traced("memory_manager.add")
     def add(self, memories: list[TextualMemoryItem]) -> None:
         """
         Add new memories in parallel to different memory types (WorkingMemory, LongTermMemory, UserMemory).
         """
+        self._sync_memory_size()
         with ThreadPoolExecutor(max_workers=8) as executor:
             futures = [executor.submit(self._process_memory, memory) for memory in memories]
             for future in as_completed(futures):
@@ -50,22 +83,17 @@ class MemoryManager:
                 except Exception as e:
                     logger.exception("Memory processing error: ", exc_info=e)
 
-        self.graph_store.remove_oldest_memory(
-            memory_type="WorkingMemory", keep_latest=self.memory_size["WorkingMemory"]
-        )
-        self.graph_store.remove_oldest_memory(
-            memory_type="LongTermMemory", keep_latest=self.memory_size["LongTermMemory"]
-        )
-        self.graph_store.remove_oldest_memory(
-            memory_type="UserMemory", keep_latest=self.memory_size["UserMemory"]
-        )
-
-        self._refresh_memory_size()
+        self.invalidate_working_memory()
+        if self._maintenance_executor is not None:
+            self._schedule_eviction()
+        else:
+            self.enforce_capacity()
 
     def replace_working_memory(self, memories: list[TextualMemoryItem]) -> None:
         """
         Replace WorkingMemory
         """
+        self._sync_memory_size()
         working_memory_top_k = memories[: self.memory_size["WorkingMemory"]]
         with ThreadPoolExecutor(max_workers=8) as executor:
             futures = [
@@ -78,24 +106,146 @@ class MemoryManager:
                 except Exception as e:
                     logger.exception("Memory processing error: ", exc_info=e)
 
-        self.graph_store.remove_oldest_memory(
-            memory_type="WorkingMemory", keep_latest=self.memory_size["WorkingMemory"]
+        self.invalidate_working_memory()
+        self.enforce_capacity(memory_types=["WorkingMemory"])
+
+    def get_working_memory(self) -> list[TextualMemoryItem]:
+        """
+        Return working memory items, most recently updated first.
+
+        Served from an in-process snapshot until the next write through this manager,
+        so repeated reads do not scan the graph store. The returned list is a fresh
+        list, but the items are shared with the snapshot and must not be mutated.
+        """
+        with self._working_memory_lock:
+            version = self._working_memory_version
+            snapshot = self._working_memory_snapshot
+        if self.cache_working_memory and snapshot is not None and snapshot[0] == version:
+            return list(snapshot[1])
+
+        records = self.graph_store.get_all_memory_items(scope="WorkingMemory")
+        items = sorted(
+            (TextualMemoryItem.from_dict(record) for record in records),
+            key=lambda x: x.metadata.updated_at or datetime.min,
+            reverse=True,
         )
-        self._refresh_memory_size()
+        with self._working_memory_lock:
+            # Skip storing if a write landed while the graph store was being read
+            if self.cache_working_memory and self._working_memory_version == version:
+                self._working_memory_snapshot = (version, items)
+        return list(items)
+
+    def invalidate_working_memory(self) -> None:
+        """Mark the working memory snapshot as stale; the next read reloads it."""
+        with self._working_memory_lock:
+            self._working_memory_version += 1
+            self._working_memory_snapshot = None
 
     def get_current_memory_size(self) -> dict[str, int]:
         """
         Return the cached memory type counts.
         """
-        return self.current_memory_size
+        with self._size_lock:
+            return dict(self.current_memory_size)
+
+    def invalidate_memory_size(self) -> None:
+        """
+        Forget the tracked memory type counts, e.g. after the graph store was cleared or
+        loaded directly. The next write recounts them from the graph store.
+        """
+        with self._size_lock:
+            self._size_synced = False
+
+    def invalidate_structure_nodes(self, memory_type: str | None = None) -> None:
+        """Forget the cached structure node IDs (of one memory type, or all)."""
+        with self._structure_lock:
+            if memory_type is None:
+                self._structure_nodes.clear()
+            else:
+                prefix = f"{memory_type}:"
+                for key in [key for key in self._structure_nodes if key.startswith(prefix)]:
+                    del self._structure_nodes[key]
+
+    def invalidate_caches(self) -> None:
+        """Drop all cached graph state, e.g. after the graph store was cleared or loaded."""
+        self.invalidate_working_memory()
+        self.invalidate_memory_size()
+        self.invalidate_structure_nodes()
+
+    def enforce_capacity(self, memory_types: list[str] | None = None) -> dict[str, int]:
+        """
+        Evict the least recently updated nodes of every memory type whose tracked count
+        exceeds its budget in `memory_size`. Only the overflow is deleted.
+
+        Args:
+            memory_types: Memory types to check; all budgeted types by default.
+
+        Returns:
+            Number of nodes deleted per memory type.
+        """
+        deleted_counts = {}
+        with self._eviction_lock:
+            for memory_type in memory_types or list(self.memory_size):
+                with self._size_lock:
+                    overflow = (
+                        self.current_memory_size.get(memory_type, 0) - self.memory_size[memory_type]
+                    )
+                if overflow <= 0:
+                    continue
+
+                deleted = self.graph_store.delete_oldest_memory(memory_type, overflow)
+                with self._size_lock:
+                    self.current_memory_size[memory_type] -= deleted
+                if memory_type == "WorkingMemory":
+                    self.invalidate_working_memory()
+                elif deleted:
+                    # Evicted nodes may include cached structure nodes
+                    self.invalidate_structure_nodes(memory_type)
+                deleted_counts[memory_type] = deleted
+
+        if deleted_counts:
+            logger.info(f"[MemoryManager] Evicted oldest memories: {deleted_counts}")
+        return deleted_counts
+
+    def _schedule_eviction(self) -> None:
+        """Run `enforce_capacity` on the maintenance thread, unless a run is already queued."""
+        with self._size_lock:
+            if self._eviction_pending:
+                return
+            self._eviction_pending = True
+        self._maintenance_executor.submit(self._run_scheduled_eviction)
+
+    def _run_scheduled_eviction(self) -> None:
+        with self._size_lock:
+            self._eviction_pending = False
+        try:
+            self.enforce_capacity()
+        except Exception as e:
+            logger.exception("Background eviction error: ", exc_info=e)
+
+    def _sync_memory_size(self) -> None:
+        with self._size_lock:
+            synced = self._size_synced
+        if not synced:
+            self._refresh_memory_size()
+
+    def _count_added(self, memory_type: str | None, count: int = 1) -> None:
+        with self._size_lock:
+            self.current_memory_size[memory_type] = (
+                self.current_memory_size.get(memory_type, 0) + count
+            )
 
     def _refresh_memory_size(self) -> None:
         """
         Query the latest counts from the graph store and update internal state.
         """
         results = self.graph_store.get_grouped_counts(group_fields=["memory_type"])
-        self.current_memory_size = {record["memory_type"]: record["count"] for record in results}
-        logger.info(f"[MemoryManager] Refreshed memory sizes: {self.current_memory_size}")
+        counts = dict.fromkeys(self.memory_size, 0)
+        counts.update({record["memory_type"]: record["count"] for record in results})
+        with self._size_lock:
+            self.current_memory_size = counts
+            self._size_synced = True
+        logger.info(f"[MemoryManager] Refreshed memory sizes: {counts}")
 
     def _process_memory(self, memory: TextualMemoryItem):
         """
@@ -124,6 +274,7 @@ class MemoryManager:
 
         # Insert node into graph
         self.graph_store.add_node(working_memory.id, working_memory.memory, metadata)
+        self._count_added(memory_type)
 
     def _add_to_graph_memory(self, memory: TextualMemoryItem, memory_type: str):
         """
@@ -136,16 +287,16 @@ class MemoryManager:
         - topic_summary_prefix: summary node id prefix if applicable
         - enable_summary_link: whether to auto-link to a summary node
         """
-        embedding = memory.metadata.embedding
-
         # Step 1: Find similar nodes for possible merging
-        similar_nodes = self.graph_store.search_by_embedding(
-            vector=embedding,
-            top_k=3,
-            scope=memory_type,
-            threshold=self._threshold,
-            status="activated",
-        )
+        similar_nodes = []
+        if self.inline_dedup:
+            similar_nodes = self.graph_store.search_by_embedding(
+                vector=memory.metadata.embedding,
+                top_k=3,
+                scope=memory_type,
+                threshold=self._threshold,
+                status="activated",
+            )
 
         if similar_nodes and similar_nodes[0]["score"] > self._merged_threshold:
             self._merge(memory, similar_nodes)
@@ -155,6 +306,7 @@ class MemoryManager:
             self.graph_store.add_node(
                 node_id, memory.memory, memory.metadata.model_dump(exclude_none=True)
             )
+            self._count_added(memory.metadata.memory_type)
 
             # Step 3: Optionally link to a summary node based on topic
             if memory.metadata.tags:
@@ -166,10 +318,12 @@ class MemoryManager:
 
     def _merge(self, source_node: TextualMemoryItem, similar_nodes: list[dict]) -> None:
         """
-        TODO: Add node traceability support by optionally preserving source nodes and linking them with MERGED_FROM edges.
+        Merge the source memory into the most similar existing node (only one).
 
-        Merge the source memory into the most similar existing node (only one),
-        and establish a MERGED_FROM edge in the graph.
+        The merged text is stored as a new node that the archived original and an
+        archived copy of the source point to with MERGED_TO edges; the original's
+        other edges move to the merged node. The graph writes happen in one
+        transaction.
 
         Parameters:
             source_node: The new memory item (not yet in the graph)
@@ -194,8 +348,6 @@ class MemoryManager:
         merged_confidence = float((original_meta.confidence + source_meta.confidence) / 2)
         merged_usage = list(set((original_meta.usage or []) + (source_meta.usage or [])))
 
-        # Create new merged node
-        merged_id = str(uuid.uuid4())
         merged_metadata = source_meta.model_copy(
             update={
                 "embedding": merged_embedding,
@@ -208,75 +360,51 @@ class MemoryManager:
                 "usage": merged_usage,
             }
         )
-
-        self.graph_store.add_node(
-            merged_id, merged_text, merged_metadata.model_dump(exclude_none=True)
+        source_metadata = source_meta.model_copy(update={"status": "archived"})
+
+        # One transaction: create the merged node and the archived source, link both and
+        # the archived original to it with MERGED_TO edges, move the original's other
+        # edges to it and relate it to the other similar nodes
+        self.graph_store.add_merged_node(
+            original_id,
+            merged_node={
+                "id": str(uuid.uuid4()),
+                "memory": merged_text,
+                "metadata": merged_metadata.model_dump(exclude_none=True),
+            },
+            archived_source={
+                "id": str(uuid.uuid4()),
+                "memory": source_node.memory,
+                "metadata": source_metadata.model_dump(exclude_none=True),
+            },
+            related_ids=[related_node["id"] for related_node in similar_nodes[1:]],
         )
-
-        # Add traceability edges: both original and new point to merged node
-        self.graph_store.add_edge(original_id, merged_id, type="MERGED_TO")
-        self.graph_store.update_node(original_id, {"status": "archived"})
-        source_id = str(uuid.uuid4())
-        source_metadata = source_node.metadata.model_copy(update={"status": "archived"})
-        self.graph_store.add_node(source_id, source_node.memory, source_metadata.model_dump())
-        self.graph_store.add_edge(source_id, merged_id, type="MERGED_TO")
-        # After creating merged node and tracing lineage
-        self._inherit_edges(original_id, merged_id)
-
-        # Relate other similar nodes to merged if needed
-        for related_node in similar_nodes[1:]:
-            if not self.graph_store.edge_exists(
-                merged_id, related_node["id"], type="ANY", direction="ANY"
-            ):
-                self.graph_store.add_edge(merged_id, related_node["id"], type="RELATE")
-
-    def _inherit_edges(self, from_id: str, to_id: str) -> None:
-        """
-        Migrate all non-lineage edges from `from_id` to `to_id`,
-        and remove them from `from_id` after copying.
-        """
-        edges = self.graph_store.get_edges(from_id, type="ANY", direction="ANY")
-
-        for edge in edges:
-            if edge["type"] == "MERGED_TO":
-                continue  # Keep lineage edges
-
-            new_from = to_id if edge["from"] == from_id else edge["from"]
-            new_to = to_id if edge["to"] == from_id else edge["to"]
-
-            if new_from == new_to:
-                continue
-
-            # Add edge to merged node if it doesn't already exist
-            if not self.graph_store.edge_exists(new_from, new_to, edge["type"], direction="ANY"):
-                self.graph_store.add_edge(new_from, new_to, edge["type"])
-
-            # Remove original edge if it involved the archived node
-            self.graph_store.delete_edge(edge["from"], edge["to"], edge["type"])
+        # The merged node and the archived source are both new nodes of the source's type
+        self._count_added(source_meta.memory_type, 2)
 
     def _ensure_structure_path(
         self, memory_type: str, metadata: TreeNodeTextualMemoryMetadata
-    ) -> str:
+    ) -> str | None:
         """
-        Ensure structural path exists (ROOT → ... → final node), return last node ID.
+        Ensure the structure node of `metadata.key` exists and return its ID.
 
-        Args:
-            path: like ["hobby", "photography"]
+        Structure nodes are unique per (memory type, key): IDs are cached in-process,
+        looked up by their indexed `structure_key` otherwise, and created with an
+        atomic get-or-create, so concurrent insertions share one node.
 
         Returns:
-            Final node ID of the structure path.
+            ID of the structure node, or None if the memory has no key.
         """
-        # Step 1: Try to find an existing memory node with content == tag
-        existing = self.graph_store.get_by_metadata(
-            [
-                {"field": "memory", "op": "=", "value": metadata.key},
-                {"field": "memory_type", "op": "=", "value": memory_type},
-            ]
-        )
-        if existing:
-            node_id = existing[0]  # Use the first match
-        else:
-            # Step 2: If not found, create a new structure node
+        if not metadata.key:
+            return None
+        structure_key = f"{memory_type}:{metadata.key}"
+        with self._structure_lock:
+            node_id = self._structure_nodes.get(structure_key)
+        if node_id is not None:
+            return node_id
+
+        node_id = self.graph_store.get_structure_node(structure_key)
+        if node_id is None:
             new_node = TextualMemoryItem(
                 memory=metadata.key,
                 metadata=TreeNodeTextualMemoryMetadata(
@@ -293,13 +421,15 @@ class MemoryManager:
                     background="",
                 ),
             )
-
-            self.graph_store.add_node(
+            node_id, created = self.graph_store.merge_structure_node(
+                structure_key,
                 id=new_node.id,
                 memory=new_node.memory,
                 metadata=new_node.metadata.model_dump(exclude_none=True),
             )
-            node_id = new_node.id
+            if created:
+                self._count_added(memory_type)
 
-        # Step 3: Return this structure node ID as the parent_id
+        with self._structure_lock:
+            self._structure_nodes[structure_key] = node_id
         return node_id
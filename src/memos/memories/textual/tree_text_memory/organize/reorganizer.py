@@ -0,0 +1,239 @@
+import heapq
+import json
+import threading
+import time
+
+from collections.abc import Callable, Iterator
+from string import Template
+
+import numpy as np
+
+from memos import telemetry
+from memos.configs.memory import ReorganizerConfig
+from memos.graph_dbs.neo4j import Neo4jGraphDB
+from memos.llms.factory import OllamaLLM, OpenAILLM
+from memos.log import get_logger
+from memos.memories.textual.tree_text_memory.organize.utils import CONFLICT_DETECT_PROMPT
+
+
+logger = get_logger(__name__)
+
+
+class GraphReorganizer:
+    """
+    Offline deduplication and conflict detection of the tree memory graph.
+
+    Each pass loads the activated nodes of every configured scope, finds similar
+    pairs with a blocked matrix product of their normalized embeddings, and merges
+    each node's near-duplicates into it (the most recently updated node of a group
+    is kept). Pairs that are similar but not duplicates can be checked for
+    contradictions by an LLM and linked with CONFLICT edges.
+    """
+
+    def __init__(
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: OpenAILLM | OllamaLLM | None = None,
+        config: ReorganizerConfig | None = None,
+        on_change: Callable[[], None] | None = None,
+    ):
+        self.graph_store = graph_store
+        self.llm = llm
+        self.config = config or ReorganizerConfig()
+        # Called after a pass that changed the graph, e.g. to invalidate caches
+        self.on_change = on_change
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Run a pass every `interval_seconds` on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run_periodically, name="memos-reorganizer", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Graph reorganizer started, interval {self.config.interval_seconds}s")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread, waiting up to `timeout` for a running pass."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run_periodically(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.exception("Graph reorganization error: ", exc_info=e)
+            self._stop_event.wait(self.config.interval_seconds)
+
+    @telemetry.traced("reorganizer.run")
+    def run_once(self) -> dict[str, int]:
+        """
+        Reorganize every configured scope once.
+
+        Returns:
+            Number of nodes scanned, nodes archived as duplicates and conflicts recorded.
+        """
+        stats = {"scanned": 0, "merged": 0, "conflicts": 0}
+        merge_budget = self.config.max_merges_per_run
+        conflict_budget = self.config.max_conflict_checks_per_run
+        for scope in self.config.scopes:
+            if self._stop_event.is_set():
+                break
+            scanned, merged, checked, conflicts = self._reorganize_scope(
+                scope, merge_budget, conflict_budget
+            )
+            merge_budget -= merged
+            conflict_budget -= checked
+            stats["scanned"] += scanned
+            stats["merged"] += merged
+            stats["conflicts"] += conflicts
+
+        if (stats["merged"] or stats["conflicts"]) and self.on_change is not None:
+            self.on_change()
+        logger.info(f"[GraphReorganizer] Pass finished: {stats}")
+        return stats
+
+    def _reorganize_scope(
+        self, scope: str, merge_budget: int, conflict_budget: int
+    ) -> tuple[int, int, int, int]:
+        ids, memories, matrix = self._load_scope(scope)
+        if len(ids) < 2:
+            return len(ids), 0, 0, 0
+
+        merge_threshold = self.config.merge_threshold
+        conflict_threshold = self.config.conflict_threshold
+        check_conflicts = (
+            self.llm is not None and conflict_threshold is not None and conflict_budget > 0
+        )
+        if merge_budget <= 0 and not check_conflicts:
+            return len(ids), 0, 0, 0
+        low = min(merge_threshold, conflict_threshold) if check_conflicts else merge_threshold
+
+        # Nodes are ordered most recent first, and a block yields every pair of its rows
+        # with the later rows, so each node of a block absorbs its not yet archived older
+        # duplicates as soon as the block is scanned. Only direct neighbors are merged,
+        # so similarity does not drift along chains.
+        archived: set[int] = set()
+        merged = 0
+        # Min-heap of the most similar conflict candidates, at most `conflict_budget`;
+        # candidates archived later in the pass are skipped when they are checked
+        candidates: list[tuple[float, int, int]] = []
+        for rows, cols, scores in self._similar_blocks(matrix, low):
+            duplicates: dict[int, list[int]] = {}
+            for i, j, score in zip(rows.tolist(), cols.tolist(), scores.tolist(), strict=True):
+                if score >= merge_threshold:
+                    if merged < merge_budget:
+                        duplicates.setdefault(i, []).append(j)
+                elif check_conflicts and i not in archived and j not in archived:
+                    if len(candidates) < conflict_budget:
+                        heapq.heappush(candidates, (score, i, j))
+                    elif score > candidates[0][0]:
+                        heapq.heapreplace(candidates, (score, i, j))
+
+            for keep, group in duplicates.items():
+                if keep in archived or merged >= merge_budget:
+                    continue
+                group = [d for d in group if d not in archived][: merge_budget - merged]
+                if not group:
+                    continue
+                try:
+                    self.graph_store.merge_node_group(ids[keep], [ids[d] for d in group])
+                except Exception as e:
+                    logger.exception(f"Merging duplicates into {ids[keep]} failed: ", exc_info=e)
+                    continue
+                archived.update(group)
+                merged += len(group)
+
+            if merged >= merge_budget and not check_conflicts:
+                break
+
+        checked = conflicts = 0
+        for _, i, j in sorted(candidates, reverse=True):
+            if checked >= conflict_budget or self._stop_event.is_set():
+                break
+            if i in archived or j in archived:
+                continue
+            if self.graph_store.edge_exists(ids[i], ids[j], "CONFLICT"):
+                continue
+            checked += 1
+            if self._is_conflict(memories[i], memories[j]):
+                self.graph_store.add_edge(ids[i], ids[j], "CONFLICT")
+                conflicts += 1
+
+        if merged:
+            logger.info(f"[GraphReorganizer] Archived {merged} duplicates in {scope}")
+        return len(ids), merged, checked, conflicts
+
+    def _load_scope(self, scope: str) -> tuple[list[str], list[str], np.ndarray]:
+        """
+        Activated, embedded, non-structure nodes of `scope` and their unit-norm
+        embeddings, ordered by `updated_at`, most recent first.
+        """
+        nodes = []
+        for record in self.graph_store.get_all_memory_items(scope=scope):
+            metadata = record["metadata"]
+            embedding = metadata.get("embedding")
+            if (
+                metadata.get("status", "activated") != "activated"
+                or metadata.get("structure_key")
+                or not embedding
+                or (nodes and len(embedding) != len(nodes[0][3]))
+            ):
+                continue
+            updated_at = str(metadata.get("updated_at") or "")
+            nodes.append((updated_at, record["id"], record["memory"], embedding))
+        if not nodes:
+            return [], [], np.empty((0, 0), dtype=np.float32)
+
+        nodes.sort(key=lambda node: node[0], reverse=True)
+        ids = [node[1] for node in nodes]
+        memories = [node[2] for node in nodes]
+        matrix = np.asarray([node[3] for node in nodes], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1.0, norms)
+        return ids, memories, matrix
+
+    def _similar_blocks(
+        self, matrix: np.ndarray, threshold: float
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Pairs (i, j) with i < j and cosine similarity at least `threshold`, computed
+        one block of rows at a time against the rows from the block start onwards.
+        Each block yields arrays of i, j and the similarity, ordered by i.
+        """
+        block_size = self.config.block_size
+        for start in range(0, len(matrix), block_size):
+            if self._stop_event.is_set():
+                return
+            began = time.thread_time()
+            scores = matrix[start : start + block_size] @ matrix[start:].T
+            rows, cols = np.nonzero(scores >= threshold)
+            upper = cols > rows  # columns are offset by `start`, like the rows
+            rows, cols = rows[upper], cols[upper]
+            values = scores[rows, cols]
+            self._throttle(time.thread_time() - began)
+            yield rows + start, cols + start, values
+
+    def _throttle(self, busy: float) -> None:
+        """Sleep so that `busy` seconds of CPU stay within the configured CPU budget."""
+        budget = self.config.cpu_budget
+        if budget < 1 and busy > 0:
+            self._stop_event.wait(busy * (1 / budget - 1))
+
+    def _is_conflict(self, memory_a: str, memory_b: str) -> bool:
+        prompt = Template(CONFLICT_DETECT_PROMPT).substitute(memory_a=memory_a, memory_b=memory_b)
+        try:
+            response = self.llm.generate([{"role": "user", "content": prompt}])
+            content = response.content if hasattr(response, "content") else response
+            start, end = content.find("{"), content.rfind("}")
+            return bool(json.loads(content[start : end + 1]).get("conflict", False))
+        except Exception as e:
+            logger.warning(f"Conflict check failed: {e}")
+            return False
@@ -0,0 +1,19 @@
+# Prompt for conflict detection between two similar memories
+CONFLICT_DETECT_PROMPT = """
+You are a memory consistency checker. Two memories from the same memory store are given below.
+Decide whether they contradict each other, i.e. whether they cannot both be true at the same time
+(for example, different values for the same fact). Memories that only overlap, complement each
+other or describe different things are not in conflict.
+
+Memory A:
+\"\"\"$memory_a\"\"\"
+
+Memory B:
+\"\"\"$memory_b\"\"\"
+
+Return strictly in this JSON format:
+{
+  "conflict": true | false,
+  "explanation": "..."
+}
+"""
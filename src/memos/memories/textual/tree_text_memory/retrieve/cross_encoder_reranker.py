@@ -0,0 +1,71 @@
+import time
+
+from sentence_transformers import CrossEncoder
+
+from memos.configs.reranker import CrossEncoderRerankerConfig
+from memos.log import get_logger
+from memos.memories.textual.item import TextualMemoryItem
+
+from .reranker import top_k_indices
+
+
+logger = get_logger(__name__)
+
+
+class CrossEncoderReranker:
+    """
+    Rerank search candidates with a local cross-encoder.
+
+    The model reads each (query, memory) pair jointly, which is more precise than
+    comparing embeddings and much cheaper than asking the dispatcher LLM. Only the
+    `top_n` best retrieval candidates are scored, in batches.
+    """
+
+    def __init__(self, config: CrossEncoderRerankerConfig):
+        self.config = config
+        self.model = CrossEncoder(
+            config.model_name_or_path,
+            device=config.device,
+            max_length=config.max_length,
+            trust_remote_code=config.trust_remote_code,
+            backend=config.model_backend,
+        )
+        logger.info(
+            f"Cross-encoder reranker loaded: {config.model_name_or_path} "
+            f"({config.model_backend}, {config.device})"
+        )
+
+    def rerank(
+        self,
+        query: str,
+        candidates: list[tuple[TextualMemoryItem, float]],
+        top_k: int,
+    ) -> list[tuple[TextualMemoryItem, float]]:
+        """
+        Rescore the best candidates with the cross-encoder.
+
+        Args:
+            query (str): Original task.
+            candidates (list(tuple)): (item, score) pairs sorted by retrieval score.
+            top_k (int): Number of top results to return.
+
+        Returns:
+            list(tuple): Top-k (item, cross-encoder score) pairs, best first.
+        """
+        pool = candidates[: max(self.config.top_n, top_k)]
+        if not pool:
+            return []
+
+        start = time.perf_counter()
+        scores = self.model.predict(
+            [(query, item.memory) for item, _ in pool],
+            batch_size=self.config.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        ranked = [(pool[i][0], float(scores[i])) for i in top_k_indices(scores, top_k)]
+        logger.debug(
+            f"Cross-encoder scored {len(pool)} candidates in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return ranked
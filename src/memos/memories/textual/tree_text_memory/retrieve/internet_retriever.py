@@ -1,20 +1,98 @@
 """Internet retrieval module for tree text memory."""
 
+import threading
+import time
 import uuid
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from memos.embedders.factory import OllamaEmbedder
+from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 
 
+logger = get_logger(__name__)
+
+# Google Custom Search serves at most the first 100 results of a query
+GOOGLE_MAX_START_INDEX = 100
+
+
+def create_session(pool_size: int = 4) -> requests.Session:
+    """HTTP session keeping up to `pool_size` connections per host alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SearchResultCache:
+    """
+    Thread-safe LRU cache of search results with a time to live.
+
+    Values are stored as given, so callers must not mutate what they put in or get
+    back. A `ttl_seconds` of 0 disables the cache.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Any) -> Any | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if time.monotonic() - created_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Any, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class GoogleCustomSearchAPI:
     """Google Custom Search API Client"""
 
     def __init__(
-        self, api_key: str, search_engine_id: str, max_results: int = 20, num_per_request: int = 10
+        self,
+        api_key: str,
+        search_engine_id: str,
+        max_results: int = 20,
+        num_per_request: int = 10,
+        timeout: float = 10.0,
+        max_workers: int = 4,
     ):
         """
         Initialize Google Custom Search API client
@@ -24,12 +102,17 @@ class GoogleCustomSearchAPI:
             search_engine_id: Search engine ID (cx parameter)
             max_results: Maximum number of results to retrieve
             num_per_request: Number of results per API request
+            timeout: Timeout in seconds of each request
+            max_workers: Number of result pages fetched concurrently
         """
         self.api_key = api_key
         self.search_engine_id = search_engine_id
         self.max_results = max_results
         self.num_per_request = min(num_per_request, 10)  # Google API limits to 10
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        self.session = create_session(self.max_workers)
 
     def search(self, query: str, num_results: int | None = None, start_index: int = 1) -> dict:
         """
@@ -55,11 +138,11 @@ class GoogleCustomSearchAPI:
         }
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Google search request failed: {e}")
+            logger.warning(f"Google search request failed: {e}")
             return {}
 
     def get_all_results(self, query: str, max_results: int | None = None) -> list[dict]:
@@ -73,16 +156,60 @@ class GoogleCustomSearchAPI:
         Returns:
             List of all search results
         """
-        if max_results is None:
-            max_results = self.max_results
+        return self.fetch_all_results(query, max_results)[0]
 
-        all_results = []
-        start_index = 1
+    def fetch_all_results(
+        self, query: str, max_results: int | None = None
+    ) -> tuple[list[dict], bool]:
+        """
+        Get all search results (with pagination) and whether every page request succeeded
 
-        while len(all_results) < max_results:
-            search_data = self.search(query, start_index=start_index)
+        The first page is requested alone; only if it comes back full are the remaining
+        pages (up to `max_results` and the reported total) requested concurrently, since
+        every request is a billed query. Results are returned in page order and stop at
+        the first empty, incomplete or failed page, as with sequential paging.
 
-            if not search_data or "items" not in search_data:
+        Args:
+            query: Search query
+            max_results: Maximum number of results (uses config default if None)
+
+        Returns:
+            Tuple of the search results and False if a page request failed, in which
+            case the results may be truncated
+        """
+        if max_results is None:
+            max_results = self.max_results
+        if max_results <= 0:
+            return [], True
+
+        first_page = self.search(query, start_index=1)
+        if not first_page:
+            return [], False
+        if "items" not in first_page:
+            return [], True
+        all_results = list(first_page["items"])
+        if len(all_results) < self.num_per_request:
+            return all_results[:max_results], True
+
+        last_start = min(max_results, GOOGLE_MAX_START_INDEX)
+        total_results = first_page.get("searchInformation", {}).get("totalResults")
+        if total_results is not None:
+            last_start = min(last_start, int(total_results))
+        start_indices = list(range(1 + self.num_per_request, last_start + 1, self.num_per_request))
+        pages = []
+        if start_indices:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(start_indices))
+            ) as executor:
+                pages = list(
+                    executor.map(lambda start: self.search(query, start_index=start), start_indices)
+                )
+
+        for search_data in pages:
+            # `search` returns an empty dict only when the request failed
+            if not search_data:
+                return all_results[:max_results], False
+            if "items" not in search_data:
                 break
 
             all_results.extend(search_data["items"])
@@ -91,13 +218,7 @@ class GoogleCustomSearchAPI:
             if len(search_data["items"]) < self.num_per_request:
                 break
 
-            start_index += self.num_per_request
-
-            # Avoid infinite loop
-            if start_index > 100:
-                break
-
-        return all_results[:max_results]
+        return all_results[:max_results], True
 
 
 class InternetGoogleRetriever:
@@ -110,6 +231,10 @@ class InternetGoogleRetriever:
         embedder: OllamaEmbedder,
         max_results: int = 20,
         num_per_request: int = 10,
+        timeout: float = 10.0,
+        max_workers: int = 4,
+        cache_ttl_seconds: float = 600.0,
+        cache_max_entries: int = 256,
     ):
         """
         Initialize internet retriever
@@ -120,11 +245,21 @@ class InternetGoogleRetriever:
             embedder: Embedder instance for generating embeddings
             max_results: Maximum number of results to retrieve
             num_per_request: Number of results per API request
+            timeout: Timeout in seconds of each search request
+            max_workers: Number of result pages fetched concurrently
+            cache_ttl_seconds: Seconds the results of a query are reused (0 disables caching)
+            cache_max_entries: Maximum number of cached queries
         """
         self.google_api = GoogleCustomSearchAPI(
-            api_key, search_engine_id, max_results=max_results, num_per_request=num_per_request
+            api_key,
+            search_engine_id,
+            max_results=max_results,
+            num_per_request=num_per_request,
+            timeout=timeout,
+            max_workers=max_workers,
         )
         self.embedder = embedder
+        self.cache = SearchResultCache(cache_ttl_seconds, cache_max_entries)
 
     def retrieve_from_internet(
         self, query: str, top_k: int = 10, parsed_goal=None
@@ -140,13 +275,23 @@ class InternetGoogleRetriever:
         Returns:
             List of TextualMemoryItem
         """
-        # Get search results
-        search_results = self.google_api.get_all_results(query, max_results=top_k)
+        cache_key = (query, top_k)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            search_results, embeddings = cached
+        else:
+            # Get search results
+            search_results, complete = self.google_api.fetch_all_results(query, max_results=top_k)
+            contents = [self._memory_content(result) for result in search_results]
+            embeddings = self.embedder.embed(contents) if contents else []
+            # Failed, partially failed or empty searches are not cached so that they are retried
+            if search_results and complete:
+                self.cache.put(cache_key, (search_results, embeddings))
 
         # Convert to TextualMemoryItem format
         memory_items = []
 
-        for _, result in enumerate(search_results):
+        for result, embedding in zip(search_results, embeddings, strict=True):
             # Extract basic information
             title = result.get("title", "")
             snippet = result.get("snippet", "")
@@ -154,7 +299,7 @@ class InternetGoogleRetriever:
             display_link = result.get("displayLink", "")
 
             # Combine memory content
-            memory_content = f"Title: {title}\nSummary: {snippet}\nSource: {link}"
+            memory_content = self._memory_content(result)
             # Create metadata
             metadata = TreeNodeTextualMemoryMetadata(
                 user_id=None,
@@ -170,7 +315,7 @@ class InternetGoogleRetriever:
                 memory_type="LongTermMemory",  # Internet search results as working memory
                 key=title,
                 sources=[link] if link else [],
-                embedding=self.embedder.embed([memory_content])[0],  # Can add embedding later
+                embedding=embedding,
                 created_at=datetime.now().isoformat(),
                 usage=[],
                 background=f"Internet search result from {display_link}",
@@ -185,6 +330,13 @@ class InternetGoogleRetriever:
 
         return memory_items
 
+    @staticmethod
+    def _memory_content(result: dict) -> str:
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        link = result.get("link", "")
+        return f"Title: {title}\nSummary: {snippet}\nSource: {link}"
+
     def _extract_entities(self, title: str, snippet: str) -> list[str]:
         """
         Extract entities from title and snippet
@@ -51,6 +51,10 @@ class InternetRetrieverFactory:
                 embedder=embedder,
                 max_results=config.max_results,
                 num_per_request=config.num_per_request,
+                timeout=config.timeout,
+                max_workers=config.max_workers,
+                cache_ttl_seconds=config.cache_ttl_seconds,
+                cache_max_entries=config.cache_max_entries,
             )
         elif backend == "bing":
             # TODO: Implement Bing retriever
@@ -60,6 +64,10 @@ class InternetRetrieverFactory:
                 embedder=embedder,
                 max_results=config.max_results,
                 num_per_request=config.num_per_request,
+                timeout=config.timeout,
+                max_workers=config.max_workers,
+                cache_ttl_seconds=config.cache_ttl_seconds,
+                cache_max_entries=config.cache_max_entries,
             )
         elif backend == "xinyu":
             return retriever_class(
@@ -67,6 +75,10 @@ class InternetRetrieverFactory:
                 search_engine_id=config.search_engine_id,
                 embedder=embedder,
                 max_results=config.max_results,
+                timeout=config.timeout,
+                max_workers=config.max_workers,
+                cache_ttl_seconds=config.cache_ttl_seconds,
+                cache_max_entries=config.cache_max_entries,
             )
         else:
             raise ValueError(f"Unsupported backend: {backend}")
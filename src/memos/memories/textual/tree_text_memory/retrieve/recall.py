@@ -1,19 +1,54 @@
 import concurrent.futures
 
+from collections.abc import Callable
+
+from memos import telemetry
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.neo4j import Neo4jGraphDB
+from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
 
 
+logger = get_logger(__name__)
+
+# Rank offset of reciprocal rank fusion; 60 is the value from the original RRF paper
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(ranked_lists: list[list[str]], k: int = RRF_K) -> list[str]:
+    """
+    Fuse several ranked id lists into one ranking.
+
+    Each id scores sum(1 / (k + rank)) over the lists it appears in, so ids found by
+    several retrievers, or ranked high by one, come first. Raw retriever scores are
+    ignored, which makes cosine similarities and BM25 scores comparable.
+    """
+    scores: dict[str, float] = {}
+    for ranked_ids in ranked_lists:
+        for rank, node_id in enumerate(dict.fromkeys(ranked_ids), start=1):
+            scores[node_id] = scores.get(node_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=scores.__getitem__, reverse=True)
+
+
 class GraphMemoryRetriever:
     """
-    Unified memory retriever that combines both graph-based and vector-based retrieval logic.
+    Unified memory retriever that combines graph-based, vector-based and full-text
+    retrieval logic.
     """
 
-    def __init__(self, graph_store: Neo4jGraphDB, embedder: OllamaEmbedder):
+    def __init__(
+        self,
+        graph_store: Neo4jGraphDB,
+        embedder: OllamaEmbedder,
+        enable_fulltext: bool = True,
+        working_memory_reader: Callable[[], list[TextualMemoryItem]] | None = None,
+    ):
         self.graph_store = graph_store
         self.embedder = embedder
+        self.enable_fulltext = enable_fulltext
+        # Cached working memory source (e.g. MemoryManager.get_working_memory)
+        self.working_memory_reader = working_memory_reader
 
     def retrieve(
         self,
@@ -22,11 +57,12 @@ class GraphMemoryRetriever:
         top_k: int,
         memory_scope: str,
         query_embedding: list[list[float]] | None = None,
+        seed_ids: list[str] | None = None,
     ) -> list[TextualMemoryItem]:
         """
         Perform hybrid memory retrieval:
         - Run graph-based lookup from dispatch plan.
-        - Run vector similarity search from embedded query.
+        - Run vector similarity and full-text search, fused by reciprocal rank.
         - Merge and return combined result set.
 
         Args:
@@ -35,6 +71,8 @@ class GraphMemoryRetriever:
             top_k (int): Number of candidates to return.
             memory_scope (str): One of ['working', 'long_term', 'user'].
             query_embedding(list of embedding): list of embedding of query
+            seed_ids (list[str], optional): Ids of nodes already known to match the
+                query (e.g. the fine-mode context hits); loaded with the vector results.
 
         Returns:
             list: Combined memory items.
@@ -44,14 +82,24 @@ class GraphMemoryRetriever:
 
         if memory_scope == "WorkingMemory":
             # For working memory, retrieve all entries (no filtering)
+            if self.working_memory_reader is not None:
+                return self.working_memory_reader()
             working_memories = self.graph_store.get_all_memory_items(scope="WorkingMemory")
             return [TextualMemoryItem.from_dict(record) for record in working_memories]
 
         # Step 1: Structured graph-based retrieval
-        graph_results = self._graph_recall(parsed_goal, memory_scope)
-
-        # Step 2: Vector similarity search
-        vector_results = self._vector_recall(query_embedding, memory_scope, top_k)
+        with telemetry.span("search.graph_recall", scope=memory_scope):
+            graph_results = self._graph_recall(parsed_goal, memory_scope)
+
+        # Step 2: Vector similarity search fused with full-text search
+        with telemetry.span("search.vector_recall", scope=memory_scope):
+            vector_results = self._vector_recall(
+                query_embedding,
+                memory_scope,
+                top_k,
+                seed_ids=seed_ids,
+                query=query if self.enable_fulltext else None,
+            )
 
         # Step 3: Merge and deduplicate results
         combined = {item.id: item for item in graph_results + vector_results}
@@ -62,8 +110,8 @@ class GraphMemoryRetriever:
         lost_ids = graph_ids - combined_ids
 
         if lost_ids:
-            print(
-                f"[DEBUG] The following nodes were in graph_results but missing in combined: {lost_ids}"
+            logger.debug(
+                "The following nodes were in graph_results but missing in combined: %s", lost_ids
             )
 
         return list(combined.values())
@@ -129,12 +177,15 @@ class GraphMemoryRetriever:
         memory_scope: str,
         top_k: int = 20,
         max_num: int = 5,
+        seed_ids: list[str] | None = None,
+        query: str | None = None,
     ) -> list[TextualMemoryItem]:
         """
         # TODO: tackle with post-filter and pre-filter(5.18+) better.
         Perform vector-based similarity retrieval using query embedding.
+        If `query` is given, a full-text search runs alongside and all ranked
+        lists are fused with reciprocal rank fusion; items come back in fused order.
         """
-        all_matches = []
 
         def search_single(vec):
             return (
@@ -144,15 +195,25 @@ class GraphMemoryRetriever:
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
             futures = [executor.submit(search_single, vec) for vec in query_embedding[:max_num]]
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                all_matches.extend(result)
-
-        if not all_matches:
+            if query:
+                futures.append(executor.submit(self._fulltext_recall, query, memory_scope, top_k))
+            ranked_lists = [[r["id"] for r in future.result()] for future in futures]
+
+        # Step 3: Fuse matched IDs and retrieve full nodes, seeds included
+        fused_ids = reciprocal_rank_fusion(ranked_lists)
+        ordered_ids = list(dict.fromkeys(fused_ids + list(seed_ids or [])))
+        if not ordered_ids:
             return []
 
-        # Step 3: Extract matched IDs and retrieve full nodes
-        unique_ids = set({r["id"] for r in all_matches})
-        node_dicts = self.graph_store.get_nodes(list(unique_ids))
-
+        position = {node_id: i for i, node_id in enumerate(ordered_ids)}
+        node_dicts = self.graph_store.get_nodes(ordered_ids)
+        node_dicts.sort(key=lambda record: position.get(record["id"], len(position)))
         return [TextualMemoryItem.from_dict(record) for record in node_dicts]
+
+    def _fulltext_recall(self, query: str, memory_scope: str, top_k: int) -> list[dict]:
+        """Lexical (BM25) search over memory text and keys; empty if it is unavailable."""
+        try:
+            return self.graph_store.search_by_fulltext(query, top_k=top_k, scope=memory_scope) or []
+        except Exception as e:
+            logger.warning(f"Full-text recall failed, using vector recall only: {e}")
+            return []
@@ -1,13 +1,35 @@
+import math
+import re
+import time
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
 import numpy as np
 
+from memos import telemetry
 from memos.embedders.factory import OllamaEmbedder
 from memos.llms.factory import OllamaLLM, OpenAILLM
+from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
 
 
+logger = get_logger(__name__)
+
+# Words, with each CJK character as its own token (as in Lucene's standard analyzer)
+_TOKEN_PATTERN = re.compile(r"[\u4e00-\u9fff]|[^\W\u4e00-\u9fff]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens of `text` for lexical scoring."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
 def batch_cosine_similarity(
-    query_vec: list[float], candidate_vecs: list[list[float]]
+    query_vec: list[float] | np.ndarray, candidate_vecs: list[list[float]] | np.ndarray
 ) -> list[float]:
     """
     Compute cosine similarity between a single query vector and multiple candidate vectors using NumPy.
@@ -19,31 +41,156 @@ def batch_cosine_similarity(
     Returns:
         list[float]: Cosine similarity scores for each candidate.
     """
-    query = np.array(query_vec)
-    candidates = np.array(candidate_vecs)
+    query = np.asarray(query_vec, dtype=np.float32)
+    candidates = np.asarray(candidate_vecs, dtype=np.float32)
+    return _cosine(query, candidates).tolist()
 
-    # Normalize query and candidates
+
+def _cosine(query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    # Avoid division by zero
+    eps = 1e-10
     query_norm = np.linalg.norm(query)
     candidates_norm = np.linalg.norm(candidates, axis=1)
+    return (candidates @ query) / (candidates_norm * query_norm + eps)
 
-    # Compute dot products
-    dot_products = np.dot(candidates, query)
 
-    # Avoid division by zero
-    eps = 1e-10
-    similarities = dot_products / (candidates_norm * query_norm + eps)
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the `top_k` highest scores, best first, without sorting all scores."""
+    if top_k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if top_k < scores.size:
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class RerankScorer(ABC):
+    """One relevance signal of the reranker."""
+
+    @abstractmethod
+    def score(
+        self,
+        query: str,
+        query_vector: np.ndarray,
+        items: list[TextualMemoryItem],
+        embeddings: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Score candidates.
+
+        Args:
+            query (str): Original task.
+            query_vector (np.ndarray): float32 query embedding of shape (dim,).
+            items (list[TextualMemoryItem]): Candidates, aligned with `embeddings` rows.
+            embeddings (np.ndarray): float32 candidate matrix of shape (len(items), dim).
+
+        Returns:
+            np.ndarray: One score per candidate.
+        """
+
+
+class CosineScorer(RerankScorer):
+    """Cosine similarity between the query and each candidate embedding."""
+
+    def score(self, query, query_vector, items, embeddings) -> np.ndarray:
+        return _cosine(query_vector, embeddings)
+
+
+class LexicalScorer(RerankScorer):
+    """
+    BM25 relevance of each candidate's memory text to the query, normalized to [0, 1].
+
+    Statistics come from the candidate pool itself, so no index is needed. This
+    keeps candidates found by exact terms (names, ids, rare words) competitive
+    with those found by embedding similarity.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score(self, query, query_vector, items, embeddings) -> np.ndarray:
+        scores = np.zeros(len(items), dtype=np.float32)
+        query_terms = set(tokenize(query))
+        if not query_terms or not items:
+            return scores
+
+        docs = [Counter(tokenize(item.memory)) for item in items]
+        lengths = np.fromiter((sum(doc.values()) for doc in docs), dtype=np.float32)
+        avg_length = max(float(lengths.mean()), 1.0)
+        for term in query_terms:
+            tf = np.fromiter((doc.get(term, 0) for doc in docs), dtype=np.float32)
+            df = int(np.count_nonzero(tf))
+            if df == 0:
+                continue
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+            scores += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        top = scores.max()
+        return scores / top if top > 0 else scores
+
+
+class RecencyScorer(RerankScorer):
+    """
+    Exponential decay on the age of a memory: 1.0 when just updated, 0.5 after
+    `half_life_days`. Memories without a timestamp score 0.
+    """
+
+    def __init__(self, half_life_days: float = 30.0):
+        self.half_life_days = half_life_days
+
+    def score(self, query, query_vector, items, embeddings) -> np.ndarray:
+        now = time.time()
+        ages = np.full(len(items), np.inf, dtype=np.float32)
+        for i, item in enumerate(items):
+            timestamp = getattr(item.metadata, "updated_at", None) or getattr(
+                item.metadata, "created_at", None
+            )
+            try:
+                ages[i] = max(now - datetime.fromisoformat(timestamp).timestamp(), 0.0) / 86400
+            except (TypeError, ValueError):
+                continue
+        return np.exp2(-ages / self.half_life_days)
 
-    return similarities.tolist()
+
+class CrossEncoderScorer(RerankScorer):
+    """
+    Query/memory relevance from a cross-encoder model.
+
+    `model` is anything with a `predict(pairs, batch_size=...)` method returning one
+    score per (query, memory) pair, e.g. `sentence_transformers.CrossEncoder`.
+    """
+
+    def __init__(self, model: Any, batch_size: int = 32):
+        self.model = model
+        self.batch_size = batch_size
+
+    def score(self, query, query_vector, items, embeddings) -> np.ndarray:
+        pairs = [(query, item.memory) for item in items]
+        return np.asarray(self.model.predict(pairs, batch_size=self.batch_size), dtype=np.float32)
 
 
 class MemoryReranker:
     """
     Rank retrieved memory cards by structural priority and contextual similarity.
+
+    The final score of a candidate is the weighted sum of its scorer outputs,
+    multiplied by the structural weight of its level. Candidate embeddings are
+    packed into one float32 matrix per call and the top-k is selected with
+    `argpartition`.
     """
 
-    def __init__(self, llm: OpenAILLM | OllamaLLM, embedder: OllamaEmbedder):
+    def __init__(
+        self,
+        llm: OpenAILLM | OllamaLLM,
+        embedder: OllamaEmbedder,
+        scorers: list[tuple[RerankScorer, float]] | None = None,
+    ):
         self.llm = llm
         self.embedder = embedder
+        self.scorers = scorers or [(CosineScorer(), 1.0)]
 
         # Structural priority weights
         self.level_weights = {
@@ -52,6 +199,10 @@ class MemoryReranker:
             "fact": 1.0,
         }
 
+        # Duration of the last scoring pass, in milliseconds
+        self.last_scoring_ms = 0.0
+
+    @telemetry.traced("search.rerank")
     def rerank(
         self,
         query: str,
@@ -72,40 +223,50 @@ class MemoryReranker:
 
         Returns:
             list(tuple): Ranked list of memory items with similarity score.
+            Items that could not be scored are appended with score -1.0 to fill up to top_k.
         """
-        # Step 1: Filter out items without embeddings
-        items_with_embeddings = [item for item in graph_results if item.metadata.embedding]
-        embeddings = [item.metadata.embedding for item in items_with_embeddings]
-
-        if not embeddings:
-            return graph_results[:top_k]
-
-        # Step 2: Compute cosine similarities
-        similarity_scores = batch_cosine_similarity(query_embedding, embeddings)
+        start = time.perf_counter()
 
-        # Step 3: Apply structural weight boost
-        def get_weight(item: TextualMemoryItem) -> float:
-            level = item.metadata.background
-            return self.level_weights.get(level, 1.0)
-
-        weighted_scores = [
-            sim * get_weight(item)
-            for sim, item in zip(similarity_scores, items_with_embeddings, strict=False)
+        # Step 1: Pack the embeddings of scorable items into a float32 matrix
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        dim = query_vector.shape[0]
+        positions = [
+            i
+            for i, item in enumerate(graph_results)
+            if item.metadata.embedding is not None and len(item.metadata.embedding) == dim
         ]
+        embeddings = np.empty((len(positions), dim), dtype=np.float32)
+        for row, i in enumerate(positions):
+            embeddings[row] = graph_results[i].metadata.embedding
+        items = [graph_results[i] for i in positions]
 
-        # Step 4: Sort by weighted score
-        sorted_items = sorted(
-            zip(items_with_embeddings, weighted_scores, strict=False),
-            key=lambda pair: pair[1],
-            reverse=True,
-        )
+        # Step 2: Combine scorer outputs and apply structural weight boost
+        scores = np.zeros(len(items), dtype=np.float32)
+        if items:
+            for scorer, weight in self.scorers:
+                scores += weight * scorer.score(query, query_vector, items, embeddings)
+            scores *= np.fromiter(
+                (self.level_weights.get(item.metadata.background, 1.0) for item in items),
+                dtype=np.float32,
+                count=len(items),
+            )
 
-        # Step 5: Return top-k items with fallback
-        top_items = sorted_items[:top_k]
+        # Step 3: Select top-k without sorting every candidate
+        selected = top_k_indices(scores, top_k)
+        top_items = [(items[row], float(scores[row])) for row in selected]
 
+        # Step 4: Fill up with unscored items, keeping retrieval order
         if len(top_items) < top_k:
-            selected_items = [item for item, _ in top_items]
-            remaining = [(item, -1.0) for item in graph_results if item not in selected_items]
-            top_items.extend(remaining[: top_k - len(top_items)])
+            scored = {positions[row] for row in selected}
+            for i, item in enumerate(graph_results):
+                if len(top_items) >= top_k:
+                    break
+                if i not in scored:
+                    top_items.append((item, -1.0))
 
+        self.last_scoring_ms = (time.perf_counter() - start) * 1000
+        logger.debug(
+            f"Reranked {len(items)}/{len(graph_results)} scorable candidates "
+            f"in {self.last_scoring_ms:.3f} ms"
+        )
         return top_items  # list of (item, score)
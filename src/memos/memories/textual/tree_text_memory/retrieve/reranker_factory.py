@@ -0,0 +1,24 @@
+"""Factory for creating search rerankers."""
+
+from typing import Any, ClassVar
+
+from memos.configs.reranker import RerankerConfigFactory
+from memos.memories.textual.tree_text_memory.retrieve.cross_encoder_reranker import (
+    CrossEncoderReranker,
+)
+
+
+class RerankerFactory:
+    """Factory class for creating reranker instances."""
+
+    backend_to_class: ClassVar[dict[str, Any]] = {
+        "cross_encoder": CrossEncoderReranker,
+    }
+
+    @classmethod
+    def from_config(cls, config_factory: RerankerConfigFactory) -> CrossEncoderReranker:
+        backend = config_factory.backend
+        if backend not in cls.backend_to_class:
+            raise ValueError(f"Invalid reranker backend: {backend}")
+        reranker_class = cls.backend_to_class[backend]
+        return reranker_class(config_factory.config)
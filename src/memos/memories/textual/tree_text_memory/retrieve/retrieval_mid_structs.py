@@ -11,3 +11,20 @@ class ParsedTaskGoal:
     keys: list[str] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
     goal_type: str | None = None  # e.g., 'default', 'explanation', etc.
+
+
+class SearchResult(list):
+    """
+    Searched memories, in ranked order.
+
+    `timed_out_paths` names the retrieval paths that missed their deadline; when any
+    did, the result is `partial` and holds only what the other paths found.
+    """
+
+    def __init__(self, items=(), timed_out_paths=()):
+        super().__init__(items)
+        self.timed_out_paths: list[str] = list(timed_out_paths)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.timed_out_paths)
@@ -1,20 +1,33 @@
 import concurrent.futures
 import json
+import time
 
+from collections.abc import Callable
 from datetime import datetime
 
+from memos import telemetry
+from memos.configs.memory import SearchDeadlineConfig
 from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.factory import Neo4jGraphDB
 from memos.llms.factory import OllamaLLM, OpenAILLM
+from memos.log import get_logger
 from memos.memories.textual.item import SearchedTreeNodeTextualMemoryMetadata, TextualMemoryItem
 
+from .cross_encoder_reranker import CrossEncoderReranker
 from .internet_retriever_factory import InternetRetrieverFactory
 from .reasoner import MemoryReasoner
 from .recall import GraphMemoryRetriever
-from .reranker import MemoryReranker
+from .reranker import CosineScorer, LexicalScorer, MemoryReranker
+from .retrieval_mid_structs import SearchResult
 from .task_goal_parser import TaskGoalParser
 
 
+logger = get_logger(__name__)
+
+# Weight of BM25 relevance next to cosine similarity when ranking retrieved memories
+LEXICAL_SCORE_WEIGHT = 0.2
+
+
 class Searcher:
     def __init__(
         self,
@@ -22,18 +35,31 @@ class Searcher:
         graph_store: Neo4jGraphDB,
         embedder: OllamaEmbedder,
         internet_retriever: InternetRetrieverFactory | None = None,
+        cross_encoder_reranker: CrossEncoderReranker | None = None,
+        working_memory_reader: Callable[[], list[TextualMemoryItem]] | None = None,
+        deadlines: SearchDeadlineConfig | None = None,
     ):
         self.graph_store = graph_store
         self.embedder = embedder
 
         self.task_goal_parser = TaskGoalParser(dispatcher_llm)
-        self.graph_retriever = GraphMemoryRetriever(self.graph_store, self.embedder)
-        self.reranker = MemoryReranker(dispatcher_llm, self.embedder)
+        self.graph_retriever = GraphMemoryRetriever(
+            self.graph_store, self.embedder, working_memory_reader=working_memory_reader
+        )
+        self.reranker = MemoryReranker(
+            dispatcher_llm,
+            self.embedder,
+            scorers=[(CosineScorer(), 1.0), (LexicalScorer(), LEXICAL_SCORE_WEIGHT)],
+        )
         self.reasoner = MemoryReasoner(dispatcher_llm)
 
         # Create internet retriever from config if provided
         self.internet_retriever = internet_retriever
+        # Local reranking stage of the 'balanced' mode
+        self.cross_encoder_reranker = cross_encoder_reranker
+        self.deadlines = deadlines or SearchDeadlineConfig()
 
+    @telemetry.traced("search")
     def search(
         self, query: str, top_k: int, info=None, mode: str = "fast", memory_type: str = "All"
     ) -> list[TextualMemoryItem]:
@@ -47,30 +73,58 @@ class Searcher:
             info (dict): Leave a record of memory consumption.
             mode (str, optional): The mode of the search.
             - 'fast': Uses a faster search process, sacrificing some precision for speed.
+            - 'balanced': Fast search followed by a local cross-encoder reranking stage.
+              Falls back to 'fast' when no reranker is configured.
             - 'fine': Uses a more detailed search process, invoking large models for higher precision, but slower performance.
             memory_type (str): Type restriction for search.
             ['All', 'WorkingMemory', 'LongTermMemory', 'UserMemory']
         Returns:
-            list[TextualMemoryItem]: List of matching memories.
+            SearchResult: List of matching memories. It is marked `partial` when a
+            retrieval path missed its configured deadline.
         """
+        started = time.monotonic()
+
+        if mode == "balanced" and self.cross_encoder_reranker is None:
+            logger.warning("No reranker configured, 'balanced' search falls back to 'fast'")
 
         # Step 1: Parse task structure into topic, concept, and fact levels
         context = []
+        query_vector = None
+        seed_ids: dict[str, list[str]] = {}
         if mode == "fine":
-            query_embedding = self.embedder.embed([query])[0]
-            related_node_ids = self.graph_store.search_by_embedding(query_embedding, top_k=top_k)
-            related_nodes = [
-                self.graph_store.get_node(related_node["id"]) for related_node in related_node_ids
-            ]
+            # Fetch only the memory text of the nearest nodes, in one query. The hits
+            # are kept as recall seeds and the query vector is reused below.
+            with telemetry.span("search.context"):
+                query_vector = self.embedder.embed([query])[0]
+                related_node_ids = [
+                    related_node["id"]
+                    for related_node in self.graph_store.search_by_embedding(
+                        query_vector, top_k=top_k
+                    )
+                ]
+                related_nodes = self.graph_store.get_node_fields(
+                    related_node_ids, fields=("memory", "memory_type")
+                )
 
-            context = [related_node["memory"] for related_node in related_nodes]
-            context = list(set(context))
+            context = list(dict.fromkeys(related_node["memory"] for related_node in related_nodes))
+            for related_node in related_nodes:
+                seed_ids.setdefault(related_node["memory_type"], []).append(related_node["id"])
 
         # Step 1a: Parse task structure into topic, concept, and fact levels
-        parsed_goal = self.task_goal_parser.parse(query, "\n".join(context))
+        with telemetry.span("search.goal_parse", mode=mode):
+            parsed_goal = self.task_goal_parser.parse(query, "\n".join(context))
 
-        if parsed_goal.memories:
-            query_embedding = self.embedder.embed(list({query, *parsed_goal.memories}))
+        # The original query always comes first; the reranker scores against it
+        rephrasings = [
+            memory for memory in dict.fromkeys(parsed_goal.memories or []) if memory != query
+        ]
+        with telemetry.span("search.embed_query", num_queries=len(rephrasings) + 1):
+            if query_vector is None:
+                query_embedding = self.embedder.embed([query, *rephrasings])
+            else:
+                query_embedding = [query_vector]
+                if rephrasings:
+                    query_embedding += self.embedder.embed(rephrasings)
 
         # Step 2a: Working memory retrieval (Path A)
         def retrieve_from_working_memory():
@@ -105,6 +159,7 @@ class Searcher:
                     parsed_goal=parsed_goal,
                     top_k=top_k * 2,
                     memory_scope="LongTermMemory",
+                    seed_ids=seed_ids.get("LongTermMemory"),
                 )
                 if memory_type in ["All", "LongTermMemory"]
                 else []
@@ -116,6 +171,7 @@ class Searcher:
                     parsed_goal=parsed_goal,
                     top_k=top_k * 2,
                     memory_scope="UserMemory",
+                    seed_ids=seed_ids.get("UserMemory"),
                 )
                 if memory_type in ["All", "UserMemory"]
                 else []
@@ -154,16 +210,15 @@ class Searcher:
             )
             return ranked_memories
 
-        # Step 3: Parallel execution of all paths
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            future_working = executor.submit(retrieve_from_working_memory)
-            future_hybrid = executor.submit(retrieve_ranked_long_term_and_user)
-            future_internet = executor.submit(retrieve_from_internet)
-
-            working_results = future_working.result()
-            hybrid_results = future_hybrid.result()
-            internet_results = future_internet.result()
-            searched_res = working_results + hybrid_results + internet_results
+        # Step 3: Parallel execution of all paths, each bounded by its deadline
+        searched_res, timed_out_paths = self._run_paths(
+            {
+                "working_memory": retrieve_from_working_memory,
+                "long_term": retrieve_ranked_long_term_and_user,
+                "internet": retrieve_from_internet,
+            },
+            started,
+        )
 
         # Deduplicate by item.memory, keep higher score
         deduped_result = {}
@@ -172,10 +227,13 @@ class Searcher:
             if mem_key not in deduped_result or score > deduped_result[mem_key][1]:
                 deduped_result[mem_key] = (item, score)
 
+        ranked_res = sorted(deduped_result.values(), key=lambda pair: pair[1], reverse=True)
+        if mode == "balanced" and self.cross_encoder_reranker is not None:
+            with telemetry.span("search.cross_encoder", candidates=len(ranked_res)):
+                ranked_res = self.cross_encoder_reranker.rerank(query, ranked_res, top_k)
+
         searched_res = []
-        for item, score in sorted(deduped_result.values(), key=lambda pair: pair[1], reverse=True)[
-            :top_k
-        ]:
+        for item, score in ranked_res[:top_k]:
             new_meta = SearchedTreeNodeTextualMemoryMetadata(
                 **item.metadata.model_dump(), relativity=score
             )
@@ -185,11 +243,12 @@ class Searcher:
 
         # Step 4: Reasoning over all retrieved and ranked memory
         if mode == "fine":
-            searched_res = self.reasoner.reason(
-                query=query,
-                ranked_memories=searched_res,
-                parsed_goal=parsed_goal,
-            )
+            with telemetry.span("search.reason", candidates=len(searched_res)):
+                searched_res = self.reasoner.reason(
+                    query=query,
+                    ranked_memories=searched_res,
+                    parsed_goal=parsed_goal,
+                )
 
         # Step 5: Update usage history with current timestamp
         now_time = datetime.now().isoformat()
@@ -197,12 +256,63 @@ class Searcher:
             {"time": now_time, "info": info}
         )  # `info` should be a serializable dict or string
 
-        for item in searched_res:
-            if (
-                hasattr(item, "id")
-                and hasattr(item, "metadata")
-                and hasattr(item.metadata, "usage")
-            ):
-                item.metadata.usage.append(usage_record)
-                self.graph_store.update_node(item.id, {"usage": item.metadata.usage})
-        return searched_res
+        with telemetry.span("search.usage_writeback", items=len(searched_res)):
+            for item in searched_res:
+                if (
+                    hasattr(item, "id")
+                    and hasattr(item, "metadata")
+                    and hasattr(item.metadata, "usage")
+                ):
+                    item.metadata.usage.append(usage_record)
+                    self.graph_store.update_node(item.id, {"usage": item.metadata.usage})
+        return SearchResult(searched_res, timed_out_paths)
+
+    def _run_paths(
+        self, paths: dict[str, Callable[[], list]], started: float
+    ) -> tuple[list, list[str]]:
+        """
+        Run the retrieval paths in parallel and collect the results of those that finish
+        within their deadline.
+
+        Each path's deadline is its configured timeout from submission, capped by the
+        total budget from `started`. Paths that miss it are left running in the
+        background (their results are discarded) so that they do not hold up the search.
+
+        Returns:
+            The concatenated (item, score) results and the names of the timed out paths.
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(paths))
+        submitted = time.monotonic()
+        futures = {
+            name: executor.submit(telemetry.in_current_context(path))
+            for name, path in paths.items()
+        }
+
+        results, timed_out = [], []
+        try:
+            for name, future in futures.items():
+                deadline = self._path_deadline(name, started, submitted)
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    results.extend(future.result(timeout=timeout))
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    timed_out.append(name)
+                    telemetry.record_search_timeout(name)
+        finally:
+            executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+        if timed_out:
+            logger.warning(
+                f"Search returned partial results; paths past their deadline: {timed_out}"
+            )
+        return results, timed_out
+
+    def _path_deadline(self, name: str, started: float, submitted: float) -> float | None:
+        path_timeout = getattr(self.deadlines, name)
+        deadlines = [
+            start + timeout
+            for start, timeout in ((submitted, path_timeout), (started, self.deadlines.total))
+            if timeout is not None
+        ]
+        return min(deadlines) if deadlines else None
@@ -5,11 +5,13 @@ import uuid
 
 from datetime import datetime
 
-import requests
-
 from memos.embedders.factory import OllamaEmbedder
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.retrieve.internet_retriever import (
+    SearchResultCache,
+    create_session,
+)
 
 
 logger = get_logger(__name__)
@@ -18,16 +20,27 @@ logger = get_logger(__name__)
 class XinyuSearchAPI:
     """Xinyu Search API Client"""
 
-    def __init__(self, access_key: str, search_engine_id: str, max_results: int = 20):
+    def __init__(
+        self,
+        access_key: str,
+        search_engine_id: str,
+        max_results: int = 20,
+        timeout: float = 10.0,
+        max_workers: int = 4,
+    ):
         """
         Initialize Xinyu Search API client
 
         Args:
             access_key: Xinyu API access key
             max_results: Maximum number of results to retrieve
+            timeout: Timeout in seconds of each request
+            max_workers: Number of pooled connections kept alive
         """
         self.access_key = access_key
         self.max_results = max_results
+        self.timeout = timeout
+        self.session = create_session(max_workers)
 
         # API configuration
         self.config = {"url": search_engine_id}
@@ -50,14 +63,19 @@ class XinyuSearchAPI:
             detail: Whether to get detailed results
 
         Returns:
-            List of search results
+            List of search results, empty if the request failed
         """
-        res = []
+        return self._query_detail_checked(body, detail)[0]
+
+    def _query_detail_checked(
+        self, body: dict | None = None, detail: bool = True
+    ) -> tuple[list[dict], bool]:
+        """Like `query_detail`, also returning False if the request failed."""
         try:
             url = self.config["url"]
 
             params = json.dumps(body)
-            resp = requests.request("POST", url, headers=self.headers, data=params)
+            resp = self.session.post(url, headers=self.headers, data=params, timeout=self.timeout)
             res = json.loads(resp.text)["results"]
 
             # If detail interface, return online part
@@ -72,7 +90,9 @@ class XinyuSearchAPI:
             import traceback
 
             logger.error(f"xinyu search error: {traceback.format_exc()}")
-        return res
+            # Whatever was parsed before the failure is not a valid result list
+            return [], False
+        return res, True
 
     def search(self, query: str, max_results: int | None = None) -> list[dict]:
         """
@@ -85,6 +105,19 @@ class XinyuSearchAPI:
         Returns:
             List of search results
         """
+        return self.fetch_results(query, max_results)[0]
+
+    def fetch_results(self, query: str, max_results: int | None = None) -> tuple[list[dict], bool]:
+        """
+        Execute search request and report whether it succeeded
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            Tuple of the search results and False if the request failed
+        """
         if max_results is None:
             max_results = self.max_results
 
@@ -101,7 +134,7 @@ class XinyuSearchAPI:
             "queries": query,
         }
 
-        return self.query_detail(body)
+        return self._query_detail_checked(body)
 
 
 class XinyuSearchRetriever:
@@ -113,6 +146,10 @@ class XinyuSearchRetriever:
         search_engine_id: str,
         embedder: OllamaEmbedder,
         max_results: int = 20,
+        timeout: float = 10.0,
+        max_workers: int = 4,
+        cache_ttl_seconds: float = 600.0,
+        cache_max_entries: int = 256,
     ):
         """
         Initialize Xinyu search retriever
@@ -121,9 +158,20 @@ class XinyuSearchRetriever:
             access_key: Xinyu API access key
             embedder: Embedder instance for generating embeddings
             max_results: Maximum number of results to retrieve
+            timeout: Timeout in seconds of each search request
+            max_workers: Number of pooled connections kept alive
+            cache_ttl_seconds: Seconds the results of a query are reused (0 disables caching)
+            cache_max_entries: Maximum number of cached queries
         """
-        self.xinyu_api = XinyuSearchAPI(access_key, search_engine_id, max_results=max_results)
+        self.xinyu_api = XinyuSearchAPI(
+            access_key,
+            search_engine_id,
+            max_results=max_results,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
         self.embedder = embedder
+        self.cache = SearchResultCache(cache_ttl_seconds, cache_max_entries)
 
     def retrieve_from_internet(
         self, query: str, top_k: int = 10, parsed_goal=None
@@ -139,13 +187,23 @@ class XinyuSearchRetriever:
         Returns:
             List of TextualMemoryItem
         """
-        # Get search results
-        search_results = self.xinyu_api.search(query, max_results=top_k)
+        cache_key = (query, top_k)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            search_results, embeddings = cached
+        else:
+            # Get search results
+            search_results, complete = self.xinyu_api.fetch_results(query, max_results=top_k)
+            contents = [self._memory_content(result) for result in search_results]
+            embeddings = self.embedder.embed(contents) if contents else []
+            # Failed or empty searches are not cached so that they are retried
+            if search_results and complete:
+                self.cache.put(cache_key, (search_results, embeddings))
 
         # Convert to TextualMemoryItem format
         memory_items = []
 
-        for _, result in enumerate(search_results):
+        for result, embedding in zip(search_results, embeddings, strict=True):
             # Extract basic information from Xinyu response format
             title = result.get("title", "")
             content = result.get("content", "")
@@ -168,9 +226,7 @@ class XinyuSearchRetriever:
                 site = site.split("|")[0]
 
             # Combine memory content
-            memory_content = (
-                f"Title: {title}\nSummary: {summary}\nContent: {content[:200]}...\nSource: {url}"
-            )
+            memory_content = self._memory_content(result)
 
             # Create metadata
             metadata = TreeNodeTextualMemoryMetadata(
@@ -187,7 +243,7 @@ class XinyuSearchRetriever:
                 memory_type="LongTermMemory",  # Search results as working memory
                 key=title,
                 sources=[url] if url else [],
-                embedding=self.embedder.embed([memory_content])[0],
+                embedding=embedding,
                 created_at=datetime.now().isoformat(),
                 usage=[],
                 background=f"Xinyu search result from {site or source}",
@@ -201,6 +257,14 @@ class XinyuSearchRetriever:
 
         return memory_items
 
+    @staticmethod
+    def _memory_content(result: dict) -> str:
+        title = result.get("title", "")
+        summary = result.get("summary", "")
+        content = result.get("content", "")
+        url = result.get("url", "")
+        return f"Title: {title}\nSummary: {summary}\nContent: {content[:200]}...\nSource: {url}"
+
     def _extract_entities(self, title: str, content: str, summary: str) -> list[str]:
         """
         Extract entities from title, content and summary
@@ -4,5 +4,8 @@ from pathlib import Path
 MEMOS_DIR = Path.cwd() / ".memos"
 DEBUG = False
 
+# Longest LLM/memory payload written to the log (payloads are logged at DEBUG)
+LOG_PAYLOAD_MAX_CHARS = 2000
+
 # "memos" or "memos.submodules" ... to filter logs from specific packages
 LOG_FILTER_TREE_PREFIX = ""
@@ -0,0 +1,284 @@
+"""
+Lightweight tracing and metrics for the MemOS pipeline stages.
+
+Instrumentation is off by default and then costs one flag check per stage.
+`configure(metrics=True)` records stage durations, errors and LLM token usage
+in an in-process registry that renders in the Prometheus text format, and
+`configure(tracing=True)` additionally opens an OpenTelemetry span per stage
+(requires the `opentelemetry-api` package and an SDK set up by the application).
+
+Usage:
+    with telemetry.span("search.rerank", mode=mode):
+        ...
+
+    @telemetry.traced("mem_reader.get_memory")
+    def get_memory(...): ...
+"""
+
+import bisect
+import contextvars
+import functools
+import threading
+import time
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from typing import Any
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+# Latency buckets in seconds: from cache hits to slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_metrics_enabled = False
+_tracer = None
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (count per bucket with +Inf last, sum)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            counts, _ = self._values.get(key, ([0], 0.0))
+            return sum(counts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    bucket_labels = _format_labels((*self.labelnames, "le"), (*key, le))
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {total:g}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    escaped = (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values
+    )
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, escaped, strict=True)) + "}"
+
+
+STAGE_DURATION = Histogram(
+    "memos_stage_duration_seconds", "Duration of MemOS pipeline stages.", ("stage",)
+)
+STAGE_ERRORS = Counter(
+    "memos_stage_errors_total", "Pipeline stages that raised an exception.", ("stage",)
+)
+LLM_TOKENS = Counter(
+    "memos_llm_tokens_total",
+    "Tokens processed by LLM backends.",
+    ("backend", "model", "kind"),
+)
+EMBEDDED_TEXTS = Counter(
+    "memos_embedded_texts_total", "Texts embedded by embedder backends.", ("backend",)
+)
+SEARCH_PATH_TIMEOUTS = Counter(
+    "memos_search_path_timeouts_total",
+    "Search retrieval paths that missed their deadline.",
+    ("path",),
+)
+
+METRICS = [STAGE_DURATION, STAGE_ERRORS, LLM_TOKENS, EMBEDDED_TEXTS, SEARCH_PATH_TIMEOUTS]
+
+
+def configure(metrics: bool = True, tracing: bool = False) -> None:
+    """
+    Turn instrumentation on or off for the whole process.
+
+    Args:
+        metrics: Record stage durations, errors and token usage in `METRICS`.
+        tracing: Open an OpenTelemetry span for every stage.
+    """
+    global _metrics_enabled, _tracer
+    _metrics_enabled = metrics
+    _tracer = None
+    if tracing:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "Tracing requires the OpenTelemetry API: pip install opentelemetry-api"
+            ) from e
+        _tracer = trace.get_tracer("memos")
+    logger.info(f"Telemetry configured: metrics={metrics}, tracing={tracing}")
+
+
+def enabled() -> bool:
+    return _metrics_enabled or _tracer is not None
+
+
+class _NoOpSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class _Span:
+    """Stage handle; attributes are forwarded to the OpenTelemetry span if any."""
+
+    def __init__(self, otel_span=None):
+        self._otel_span = otel_span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self._otel_span is not None:
+            self._otel_span.set_attribute(key, value)
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+@contextmanager
+def _stage(name: str, attributes: dict[str, Any]) -> Iterator[_Span]:
+    tracer = _tracer
+    start = time.perf_counter()
+    try:
+        if tracer is not None:
+            with tracer.start_as_current_span(f"memos.{name}", attributes=attributes) as otel:
+                yield _Span(otel)
+        else:
+            yield _Span()
+    except BaseException:
+        if _metrics_enabled:
+            STAGE_ERRORS.inc(stage=name)
+        raise
+    finally:
+        if _metrics_enabled:
+            STAGE_DURATION.observe(time.perf_counter() - start, stage=name)
+
+
+def span(name: str, **attributes: Any):
+    """Context manager timing the pipeline stage `name`; a no-op unless configured."""
+    if not enabled():
+        return nullcontext(_NOOP_SPAN)
+    return _stage(name, attributes)
+
+
+def traced(name: str) -> Callable:
+    """Decorator running the function inside `span(name)`."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def in_current_context(func: Callable) -> Callable:
+    """
+    Bind `func` to a copy of the current context, so that spans opened by it in a
+    worker thread nest under the span active at submission time.
+    """
+    if _tracer is None:
+        return func
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+def record_llm_usage(
+    backend: str, model: str, prompt_tokens: int | None, completion_tokens: int | None
+) -> None:
+    if not _metrics_enabled:
+        return
+    # Backends report None (or nothing) when the server does not return usage
+    if isinstance(prompt_tokens, int) and prompt_tokens > 0:
+        LLM_TOKENS.inc(prompt_tokens, backend=backend, model=model, kind="prompt")
+    if isinstance(completion_tokens, int) and completion_tokens > 0:
+        LLM_TOKENS.inc(completion_tokens, backend=backend, model=model, kind="completion")
+
+
+def record_embedding(backend: str, num_texts: int) -> None:
+    if _metrics_enabled:
+        EMBEDDED_TEXTS.inc(num_texts, backend=backend)
+
+
+def record_search_timeout(path: str) -> None:
+    if _metrics_enabled:
+        SEARCH_PATH_TIMEOUTS.inc(path=path)
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Clear all recorded values."""
+    for metric in METRICS:
+        metric.clear()
@@ -51,6 +51,25 @@ class BaseVecDB(ABC):
             List of search results with distance scores and payloads.
         """
 
+    @abstractmethod
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for several query vectors in one round trip.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return for each vector
+            filter: payload filters applied to every query
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+
     @abstractmethod
     def get_by_id(self, id: str) -> VecDBItem | None:
         """Get an item from the vector database."""
@@ -1,17 +1,24 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import (
+    DatetimeRange,
     Distance,
     FieldCondition,
     Filter,
+    MatchAny,
+    MatchExcept,
     MatchValue,
     PointStruct,
+    Range,
     VectorParams,
 )
 
 from memos.configs.vec_db import QdrantVecDBConfig
+from memos.filters import MetadataFilter, normalize_filter
 from memos.log import get_logger
 from memos.vec_dbs.base import BaseVecDB
 from memos.vec_dbs.item import VecDBItem
@@ -28,7 +35,7 @@ class QdrantVecDB(BaseVecDB):
         self.config = config
 
         # If both host and port are None, we are running in local mode
-        if self.config.host is None and self.config.port is None:
+        if self._is_local_mode():
             logger.warning(
                 "Qdrant is running in local mode (host and port are both None). "
                 "In local mode, there may be race conditions during concurrent reads/writes. "
@@ -37,7 +44,11 @@ class QdrantVecDB(BaseVecDB):
             )
 
         self.client = QdrantClient(
-            host=self.config.host, port=self.config.port, path=self.config.path
+            host=self.config.host,
+            port=self.config.port,
+            path=self.config.path,
+            prefer_grpc=self.config.prefer_grpc,
+            grpc_port=self.config.grpc_port,
         )
         self.create_collection()
 
@@ -59,18 +70,67 @@ class QdrantVecDB(BaseVecDB):
             "dot": Distance.DOT,
         }
 
+        vector_params = VectorParams(
+            size=self.config.vector_dimension,
+            distance=distance_map[self.config.distance_metric],
+        )
+        if self.config.vector_datatype != "float32":
+            vector_params.datatype = models.Datatype(self.config.vector_datatype)
+
         self.client.create_collection(
             collection_name=self.config.collection_name,
-            vectors_config=VectorParams(
-                size=self.config.vector_dimension,
-                distance=distance_map[self.config.distance_metric],
-            ),
+            vectors_config=vector_params,
+            quantization_config=self._quantization_config(),
         )
 
         logger.info(
             f"Collection '{self.config.collection_name}' created with {self.config.vector_dimension} dimensions."
         )
 
+        self._create_payload_indexes()
+
+    def _quantization_config(
+        self,
+    ) -> models.ScalarQuantization | models.BinaryQuantization | None:
+        """Build the native quantization config from `config.quantization`."""
+        if self.config.quantization == "int8":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.config.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def _search_params(self) -> models.SearchParams | None:
+        """Search params that rescore quantized candidates with the original vectors."""
+        if self.config.quantization is None:
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True, oversampling=self.config.quantization_oversampling
+            )
+        )
+
+    def _create_payload_indexes(self) -> None:
+        """Create the payload indexes listed in `config.payload_indexes`."""
+        if self._is_local_mode():
+            # Local mode has no payload indexes, filtering is always a scan there
+            return
+
+        for field_name, field_schema in self.config.payload_indexes.items():
+            try:
+                self.client.create_payload_index(
+                    collection_name=self.config.collection_name,
+                    field_name=field_name,
+                    field_schema=models.PayloadSchemaType(field_schema),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create payload index on '{field_name}': {e}")
+
     def list_collections(self) -> list[str]:
         """List all collections."""
         collections = self.client.get_collections()
@@ -89,7 +149,12 @@ class QdrantVecDB(BaseVecDB):
             return False
 
     def search(
-        self, query_vector: list[float], top_k: int, filter: dict[str, Any] | None = None
+        self,
+        query_vector: list[float],
+        top_k: int,
+        filter: MetadataFilter | None = None,
+        with_vectors: bool = False,
+        payload_fields: list[str] | None = None,
     ) -> list[VecDBItem]:
         """
         Search for similar items in the database.
@@ -98,6 +163,9 @@ class QdrantVecDB(BaseVecDB):
             query_vector: Single vector to search
             top_k: Number of results to return
             filter: Payload filters
+            with_vectors: Whether to return the stored vectors. Off by default since
+                callers usually only need the payload and the vectors dominate the response size.
+            payload_fields: Only return these payload fields (all fields if None)
 
         Returns:
             List of search results with distance scores and payloads.
@@ -108,84 +176,165 @@ class QdrantVecDB(BaseVecDB):
             query_vector=query_vector,
             limit=top_k,
             query_filter=qdrant_filter,
-            with_vectors=True,
-            with_payload=True,
+            search_params=self._search_params(),
+            with_vectors=with_vectors,
+            with_payload=self._payload_selector(payload_fields),
         )
         logger.info(f"Qdrant search completed with {len(response)} results.")
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
-                score=point.score,
-            )
-            for point in response
-        ]
+        return [self._point_to_item(point) for point in response]
+
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: MetadataFilter | None = None,
+        with_vectors: bool = False,
+        payload_fields: list[str] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for several query vectors in a single request.
+
+        Args:
+            query_vectors: Vectors to search, one result list is returned per vector
+            top_k: Number of results to return for each vector
+            filter: Payload filters applied to every query
+            with_vectors: Whether to return the stored vectors
+            payload_fields: Only return these payload fields (all fields if None)
 
-    def _dict_to_filter(self, filter_dict: dict[str, Any]) -> Filter:
-        """Convert a dictionary filter to a Qdrant Filter object."""
-        conditions = []
+        Returns:
+            List of result lists, in the same order as `query_vectors`.
+        """
+        if not query_vectors:
+            return []
 
-        for field, value in filter_dict.items():
-            # Simple exact match for now
-            # TODO: Extend this to support more complex conditions
-            conditions.append(FieldCondition(key=field, match=MatchValue(value=value)))
+        qdrant_filter = self._dict_to_filter(filter) if filter else None
+        with_payload = self._payload_selector(payload_fields)
+        search_params = self._search_params()
+        requests = [
+            models.SearchRequest(
+                vector=query_vector,
+                limit=top_k,
+                filter=qdrant_filter,
+                params=search_params,
+                with_vector=with_vectors,
+                with_payload=with_payload,
+            )
+            for query_vector in query_vectors
+        ]
+        responses = self.client.search_batch(
+            collection_name=self.config.collection_name, requests=requests
+        )
+        logger.info(f"Qdrant batch search completed for {len(requests)} queries.")
+        return [[self._point_to_item(point) for point in response] for response in responses]
 
-        return Filter(must=conditions)
+    def _dict_to_filter(self, filter_dict: MetadataFilter) -> Filter | None:
+        """
+        Convert a metadata filter (see `memos.filters`) to a Qdrant Filter object.
 
-    def get_by_id(self, id: str) -> VecDBItem | None:
+        A plain mapping keeps its historical meaning of exact matches joined with AND.
+        """
+        node = normalize_filter(filter_dict)
+        if node is None:
+            return None
+        compiled = self._compile_filter(node)
+        return compiled if isinstance(compiled, Filter) else Filter(must=[compiled])
+
+    def _compile_filter(self, node: dict[str, Any]) -> Filter | FieldCondition:
+        """Recursively compile a normalized filter tree."""
+        if "and" in node:
+            return Filter(must=[self._compile_filter(child) for child in node["and"]])
+        if "or" in node:
+            return Filter(should=[self._compile_filter(child) for child in node["or"]])
+        if "not" in node:
+            return Filter(must_not=[self._compile_filter(node["not"])])
+
+        field, op, value = node["field"], node["op"], node["value"]
+        if op == "=":
+            return FieldCondition(key=field, match=MatchValue(value=value))
+        if op == "!=":
+            return Filter(must_not=[FieldCondition(key=field, match=MatchValue(value=value))])
+        if op in ("in", "contains"):
+            # For array payloads Qdrant matches when any element is in the list
+            return FieldCondition(key=field, match=MatchAny(any=value))
+        if op == "not_in":
+            return FieldCondition(key=field, match=MatchExcept(**{"except": value}))
+        if op in (">", ">=", "<", "<="):
+            bound = {">": "gt", ">=": "gte", "<": "lt", "<=": "lte"}[op]
+            if isinstance(value, str):
+                # ISO 8601 strings such as `updated_at` are compared as datetimes
+                return FieldCondition(key=field, range=DatetimeRange(**{bound: value}))
+            return FieldCondition(key=field, range=Range(**{bound: value}))
+        raise ValueError(f"Operator '{op}' is not supported by Qdrant filters")
+
+    def get_by_id(self, id: str, with_vectors: bool = True) -> VecDBItem | None:
         """Get a single item by ID."""
         response = self.client.retrieve(
             collection_name=self.config.collection_name,
             ids=[id],
             with_payload=True,
-            with_vectors=True,
+            with_vectors=with_vectors,
         )
 
         if not response:
             return None
 
-        point = response[0]
-        return VecDBItem(
-            id=point.id,
-            vector=point.vector,
-            payload=point.payload,
-        )
+        return self._point_to_item(response[0])
 
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
+    def get_by_ids(self, ids: list[str], with_vectors: bool = True) -> list[VecDBItem]:
         """Get multiple items by their IDs."""
         response = self.client.retrieve(
             collection_name=self.config.collection_name,
             ids=ids,
             with_payload=True,
-            with_vectors=True,
+            with_vectors=with_vectors,
         )
 
         if not response:
             return []
 
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
-            )
-            for point in response
-        ]
+        return [self._point_to_item(point) for point in response]
 
-    def get_by_filter(self, filter: dict[str, Any], scroll_limit: int = 100) -> list[VecDBItem]:
+    def get_by_filter(
+        self, filter: MetadataFilter, scroll_limit: int = 100, with_vectors: bool = True
+    ) -> list[VecDBItem]:
         """
         Retrieve all items that match the given filter criteria.
 
         Args:
             filter: Payload filters to match against stored items
             scroll_limit: Maximum number of items to retrieve per scroll request
+            with_vectors: Whether to return the stored vectors
 
         Returns:
             List of items including vectors and payload that match the filter
         """
+        all_items = []
+        for page in self.iter_by_filter(
+            filter, scroll_limit=scroll_limit, with_vectors=with_vectors
+        ):
+            all_items.extend(page)
+
+        logger.info(f"Qdrant retrieve by filter completed with {len(all_items)} results.")
+        return all_items
+
+    def iter_by_filter(
+        self, filter: MetadataFilter | None, scroll_limit: int = 100, with_vectors: bool = True
+    ) -> Iterator[list[VecDBItem]]:
+        """
+        Stream the items matching a filter one scroll page at a time.
+
+        Unlike `get_by_filter`, only a single page of points is resident at once,
+        which makes it suitable for exporting large collections.
+
+        Args:
+            filter: Payload filters to match against stored items (None for all items)
+            scroll_limit: Maximum number of items to retrieve per scroll request
+            with_vectors: Whether to return the stored vectors
+
+        Yields:
+            Lists of at most `scroll_limit` items.
+        """
         qdrant_filter = self._dict_to_filter(filter) if filter else None
-        all_points = []
         offset = None
 
         # Use scroll to paginate through all matching points
@@ -195,34 +344,24 @@ class QdrantVecDB(BaseVecDB):
                 limit=scroll_limit,
                 scroll_filter=qdrant_filter,
                 offset=offset,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
             )
 
             if not points:
                 break
 
-            all_points.extend(points)
+            yield [self._point_to_item(point) for point in points]
 
             # Update offset for next iteration
             if offset is None:
                 break
 
-        logger.info(f"Qdrant retrieve by filter completed with {len(all_points)} results.")
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
-            )
-            for point in all_points
-        ]
-
     def get_all(self, scroll_limit=100) -> list[VecDBItem]:
         """Retrieve all items in the vector database."""
         return self.get_by_filter({}, scroll_limit=scroll_limit)
 
-    def count(self, filter: dict[str, Any] | None = None) -> int:
+    def count(self, filter: MetadataFilter | None = None) -> int:
         """Count items in the database, optionally with filter."""
         qdrant_filter = None
         if filter:
@@ -234,18 +373,54 @@ class QdrantVecDB(BaseVecDB):
 
         return response.count
 
-    def add(self, data: list[VecDBItem | dict[str, Any]]) -> None:
+    def add(
+        self,
+        data: list[VecDBItem | dict[str, Any]],
+        batch_size: int | None = None,
+        workers: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
         """
         Add data to the vector database.
 
+        Large inputs are split into batches of `batch_size` points which are upserted
+        concurrently by up to `workers` threads (always sequentially in local mode).
+
         Args:
             data: List of VecDBItem objects or dictionaries containing:
                 - 'id': unique identifier
                 - 'vector': embedding vector
                 - 'payload': additional fields for filtering/retrieval
+            batch_size: Points per upsert request (defaults to `config.upload_batch_size`)
+            workers: Concurrent upsert requests (defaults to `config.upload_workers`)
+            progress_callback: Called as `progress_callback(done, total)` after each batch
         """
+        batch_size = batch_size or self.config.upload_batch_size
+        workers = 1 if self._is_local_mode() else (workers or self.config.upload_workers)
+        total = len(data)
+        batches = [data[i : i + batch_size] for i in range(0, total, batch_size)]
+
+        done = 0
+        if workers <= 1 or len(batches) <= 1:
+            for batch in batches:
+                done += self._upsert_batch(batch)
+                if progress_callback:
+                    progress_callback(done, total)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._upsert_batch, batch) for batch in batches]
+                for future in as_completed(futures):
+                    done += future.result()
+                    if progress_callback:
+                        progress_callback(done, total)
+
+        if len(batches) > 1:
+            logger.info(f"Qdrant upserted {total} points in {len(batches)} batches.")
+
+    def _upsert_batch(self, batch: list[VecDBItem | dict[str, Any]]) -> int:
+        """Upsert one batch of items and return the number of points written."""
         points = []
-        for item in data:
+        for item in batch:
             if isinstance(item, dict):
                 item = item.copy()
                 item = VecDBItem.from_dict(item)
@@ -253,6 +428,8 @@ class QdrantVecDB(BaseVecDB):
             points.append(point)
 
         self.client.upsert(collection_name=self.config.collection_name, points=points)
+        logger.debug(f"Qdrant upserted batch of {len(points)} points.")
+        return len(points)
 
     def update(self, id: str, data: VecDBItem | dict[str, Any]) -> None:
         """Update an item in the vector database."""
@@ -290,3 +467,22 @@ class QdrantVecDB(BaseVecDB):
             collection_name=self.config.collection_name,
             points_selector=models.PointIdsList(points=point_ids),
         )
+
+    def _is_local_mode(self) -> bool:
+        """Whether the client runs embedded (no Qdrant server)."""
+        return self.config.host is None and self.config.port is None
+
+    @staticmethod
+    def _payload_selector(payload_fields: list[str] | None) -> bool | list[str]:
+        """Translate a payload field selection into Qdrant's `with_payload` argument."""
+        return payload_fields if payload_fields is not None else True
+
+    @staticmethod
+    def _point_to_item(point: Any) -> VecDBItem:
+        """Convert a Qdrant point (scored or not) into a VecDBItem."""
+        return VecDBItem(
+            id=point.id,
+            vector=point.vector,
+            payload=point.payload,
+            score=getattr(point, "score", None),
+        )
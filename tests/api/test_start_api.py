@@ -455,3 +455,11 @@ def test_home_redirect():
     response = client.get("/", follow_redirects=False)
     assert response.status_code == 307
     assert response.headers["location"] == "/docs"
+
+
+def test_metrics_endpoint():
+    """Test the Prometheus metrics endpoint."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE memos_stage_duration_seconds histogram" in response.text
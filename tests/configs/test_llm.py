@@ -1,6 +1,7 @@
 from memos.configs.llm import (
     BaseLLMConfig,
     HFLLMConfig,
+    LLMCacheConfig,
     LLMConfigFactory,
     OllamaLLMConfig,
     OpenAILLMConfig,
@@ -148,4 +149,27 @@ def test_llm_config_factory():
         },
     )
 
+    check_config_instantiation_valid(
+        LLMConfigFactory,
+        {
+            "backend": "ollama",
+            "config": {"model_name_or_path": "test-model", "temperature": 0.0},
+            "cache": {"max_entries": 128, "ttl_seconds": None},
+        },
+    )
+
     check_config_instantiation_invalid(LLMConfigFactory)
+
+
+def test_llm_cache_config():
+    check_config_base_class(
+        LLMCacheConfig,
+        optional_fields=["max_entries", "ttl_seconds", "sqlite_path", "cache_sampled_calls"],
+    )
+
+    check_config_instantiation_valid(
+        LLMCacheConfig,
+        {"max_entries": 16, "ttl_seconds": 60.0, "sqlite_path": "cache.sqlite"},
+    )
+
+    check_config_instantiation_invalid(LLMCacheConfig, {"max_entries": "many"})
@@ -0,0 +1,70 @@
+from memos.configs.reranker import (
+    BaseRerankerConfig,
+    CrossEncoderRerankerConfig,
+    RerankerConfigFactory,
+)
+from tests.utils import (
+    check_config_base_class,
+    check_config_factory_class,
+    check_config_instantiation_invalid,
+    check_config_instantiation_valid,
+)
+
+
+def test_base_reranker_config():
+    check_config_base_class(
+        BaseRerankerConfig,
+        required_fields=[],
+        optional_fields=["top_n"],
+    )
+
+    check_config_instantiation_valid(
+        BaseRerankerConfig,
+        {"top_n": 10},
+    )
+
+    check_config_instantiation_invalid(BaseRerankerConfig)
+
+
+def test_cross_encoder_reranker_config():
+    check_config_base_class(
+        CrossEncoderRerankerConfig,
+        required_fields=[],
+        optional_fields=[
+            "top_n",
+            "model_name_or_path",
+            "device",
+            "model_backend",
+            "batch_size",
+            "max_length",
+            "trust_remote_code",
+        ],
+    )
+
+    check_config_instantiation_valid(
+        CrossEncoderRerankerConfig,
+        {
+            "model_name_or_path": "cross-encoder/ms-marco-MiniLM-L-6-v2",
+            "model_backend": "onnx",
+            "batch_size": 16,
+        },
+    )
+
+    check_config_instantiation_invalid(CrossEncoderRerankerConfig)
+
+
+def test_reranker_config_factory():
+    check_config_factory_class(
+        RerankerConfigFactory,
+        expected_backends=["cross_encoder"],
+    )
+
+    check_config_instantiation_valid(
+        RerankerConfigFactory,
+        {
+            "backend": "cross_encoder",
+            "config": {"top_n": 30},
+        },
+    )
+
+    check_config_instantiation_invalid(RerankerConfigFactory)
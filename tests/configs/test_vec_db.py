@@ -1,3 +1,7 @@
+import pytest
+
+from pydantic import ValidationError
+
 from memos.configs.vec_db import (
     BaseVecDBConfig,
     QdrantVecDBConfig,
@@ -40,7 +44,21 @@ def test_qdrant_vec_db_config():
         required_fields=[
             "collection_name",
         ],
-        optional_fields=["vector_dimension", "distance_metric", "host", "port", "path"],
+        optional_fields=[
+            "vector_dimension",
+            "distance_metric",
+            "host",
+            "port",
+            "path",
+            "prefer_grpc",
+            "grpc_port",
+            "upload_batch_size",
+            "upload_workers",
+            "vector_datatype",
+            "quantization",
+            "quantization_oversampling",
+        ],
+        factory_fields=["payload_indexes"],
     )
 
     check_config_instantiation_valid(
@@ -55,6 +73,10 @@ def test_qdrant_vec_db_config():
 
     check_config_instantiation_invalid(QdrantVecDBConfig)
 
+    # Integer storage would truncate float embeddings; 8-bit goes through quantization
+    with pytest.raises(ValidationError):
+        QdrantVecDBConfig(collection_name="test_collection", path="/p", vector_datatype="uint8")
+
 
 def test_vector_db_config_factory():
     check_config_base_class(
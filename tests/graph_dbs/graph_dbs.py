@@ -1,7 +1,7 @@
 import uuid
 
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -100,8 +100,288 @@ def test_remove_oldest_memory(graph_db):
     assert "ORDER BY n.updated_at DESC" in query
 
 
+def test_delete_oldest_memory_limits_to_overflow(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value.single.return_value = {"deleted": 3}
+
+    assert graph_db.delete_oldest_memory("LongTermMemory", 3) == 3
+
+    query = session_mock.run.call_args.args[0]
+    assert "ORDER BY n.updated_at ASC" in query
+    assert "LIMIT $count" in query
+    assert session_mock.run.call_args.kwargs == {"memory_type": "LongTermMemory", "count": 3}
+
+    session_mock.run.reset_mock()
+    assert graph_db.delete_oldest_memory("LongTermMemory", 0) == 0
+    session_mock.run.assert_not_called()
+
+
+def test_add_merged_node_writes_in_one_transaction(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+
+    graph_db.add_merged_node(
+        "original",
+        merged_node={"id": "merged", "memory": "a\nb", "metadata": {"memory_type": "UserMemory"}},
+        archived_source={"id": "source", "memory": "b", "metadata": {"status": "archived"}},
+        related_ids=["related"],
+    )
+
+    session_mock.execute_write.assert_called_once()
+    session_mock.run.assert_not_called()
+
+    tx = MagicMock()
+    tx.run.side_effect = [[{"type": "PARENT"}, {"type": "RELATE"}], MagicMock()]
+    work = session_mock.execute_write.call_args.args[0]
+    work(tx)
+
+    assert tx.run.call_count == 2
+    query, params = tx.run.call_args.args
+    assert "CREATE (o)-[:MERGED_TO]->(m), (s)-[:MERGED_TO]->(m)" in query
+    assert "MATCH (o)-[r:PARENT]->(x:Memory)" in query
+    assert "MATCH (o)<-[r:RELATE]-(x:Memory)" in query
+    assert "CREATE (m)-[:RELATE]->(x)" in query
+    assert params["merged"]["id"] == "merged"
+    assert params["merged"]["metadata"] == {"memory_type": "UserMemory"}
+    assert "created_at" in params["source"]
+    assert params["related_ids"] == ["related"]
+
+
+def test_merge_node_group_archives_duplicates_in_one_transaction(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+
+    graph_db.merge_node_group("keep", ["keep", "dup1", "dup2"])
+
+    tx = MagicMock()
+    tx.run.side_effect = [[{"type": "RELATE"}], MagicMock()]
+    session_mock.execute_write.call_args.args[0](tx)
+
+    assert tx.run.call_args_list[0].kwargs["ids"] == ["dup1", "dup2"]
+    query = tx.run.call_args.args[0]
+    params = tx.run.call_args.kwargs
+    assert "SET o.status = 'archived'" in query
+    assert "CREATE (o)-[:MERGED_TO]->(m)" in query
+    assert "MATCH (o)-[r:RELATE]->(x:Memory)" in query
+    assert "m.tags = reduce(" in query
+    assert params == {"keep_id": "keep", "duplicate_ids": ["dup1", "dup2"]}
+
+
+def test_merge_nodes_keeps_first_node(graph_db):
+    graph_db.merge_node_group = MagicMock()
+
+    assert graph_db.merge_nodes("a", "b") == "a"
+    graph_db.merge_node_group.assert_called_once_with("a", ["b"])
+
+
+def test_deduplicate_nodes_merges_identical_memories(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value = [{"ids": ["newest", "old1", "old2"]}]
+    graph_db.merge_node_group = MagicMock()
+
+    graph_db.deduplicate_nodes()
+
+    graph_db.merge_node_group.assert_called_once_with("newest", ["old1", "old2"])
+
+
+def test_get_path_returns_node_ids(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value.single.return_value = {"ids": ["a", "b", "c"]}
+
+    assert graph_db.get_path("a", "c", max_depth=4) == ["a", "b", "c"]
+    assert "shortestPath((a)-[*..4]-(b))" in session_mock.run.call_args.args[0]
+
+    session_mock.run.return_value.single.return_value = None
+    assert graph_db.get_path("a", "z") == []
+
+    session_mock.run.reset_mock()
+    assert graph_db.get_path("a", "a") == ["a"]
+    session_mock.run.assert_not_called()
+
+
+def test_get_context_chain_is_bounded_and_validates_type(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+    successors = {"a": "b", "b": "c", "c": "a"}
+    session_mock.run.side_effect = lambda query, id: MagicMock(
+        single=MagicMock(return_value={"next": successors[id]})
+    )
+
+    # Walked hop by hop, stopping on the cycle back to "a"
+    assert graph_db.get_context_chain("a") == ["a", "b", "c"]
+    assert session_mock.run.call_count == 3
+    assert "-[:FOLLOWS]->" in session_mock.run.call_args.args[0]
+    assert graph_db.get_context_chain("a", max_depth=1) == ["a", "b"]
+
+    session_mock.run.reset_mock()
+    with pytest.raises(ValueError):
+        graph_db.get_context_chain("a", type="FOLLOWS]->() DETACH DELETE a //")
+    session_mock.run.assert_not_called()
+
+    session_mock.run.side_effect = None
+    session_mock.run.return_value.single.return_value = None
+    assert graph_db.get_context_chain("missing") == []
+
+
 def test_get_memory_count(graph_db):
     session_mock = graph_db.driver.session.return_value.__enter__.return_value
     session_mock.run.return_value.single.return_value = {"count": 42}
     count = graph_db.get_memory_count("WorkingMemory")
     assert count == 42
+
+
+def test_get_by_metadata_filter_language(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value = [{"id": "a"}]
+    ids = graph_db.get_by_metadata(
+        [
+            {"field": "memory_type", "op": "=", "value": "LongTermMemory"},
+            {
+                "or": [
+                    {"field": "tags", "op": "contains", "value": "AI"},
+                    {"field": "updated_at", "op": ">=", "value": "2025-01-01T00:00:00"},
+                ]
+            },
+        ]
+    )
+    query, params = session_mock.run.call_args[0]
+    assert ids == ["a"]
+    assert "n.memory_type = $val0" in query
+    assert "ANY(x IN $val1 WHERE x IN n.tags) OR n.updated_at >= datetime($val2)" in query
+    assert params["val1"] == ["AI"]
+
+
+def test_import_graph_uses_batched_unwind(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    nodes = [{"id": str(i), "memory": f"m{i}", "metadata": {}} for i in range(3)]
+    edges = [
+        {"source": "0", "target": "1", "type": "PARENT"},
+        {"source": "1", "target": "2", "type": "RELATE_TO"},
+    ]
+    graph_db.import_graph({"nodes": nodes, "edges": edges}, batch_size=2)
+
+    queries = [call.args[0] for call in session_mock.run.call_args_list]
+    node_queries = [q for q in queries if "MERGE (n:Memory" in q]
+    edge_queries = [q for q in queries if "MERGE (a)-[" in q]
+    assert len(node_queries) == 2
+    assert all("UNWIND $rows" in q for q in node_queries)
+    assert len(edge_queries) == 2
+
+
+def test_search_by_embeddings_single_round_trip(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+    session_mock.run.return_value = [
+        {"index": 0, "id": "a", "score": 0.9},
+        {"index": 1, "id": "b", "score": 0.8},
+        {"index": 1, "id": "c", "score": 0.2},
+    ]
+
+    results = graph_db.search_by_embeddings(
+        [[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], top_k=2, scope="LongTermMemory", threshold=0.5
+    )
+
+    assert results == [[{"id": "a", "score": 0.9}], [{"id": "b", "score": 0.8}]]
+    session_mock.run.assert_called_once()
+    query, params = session_mock.run.call_args.args
+    assert "UNWIND $queries AS q" in query
+    assert "node.memory_type = $scope" in query
+    assert [q["index"] for q in params["queries"]] == [0, 1]
+    assert params["scope"] == "LongTermMemory"
+
+
+def test_get_node_fields_projects_in_one_query(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+    session_mock.run.return_value = [
+        {"id": "b", "memory": "second"},
+        {"id": "a", "memory": "first"},
+    ]
+
+    results = graph_db.get_node_fields(["a", "b", "missing"])
+
+    assert results == [{"id": "a", "memory": "first"}, {"id": "b", "memory": "second"}]
+    session_mock.run.assert_called_once()
+    query, params = session_mock.run.call_args.args
+    assert "RETURN n.id AS id, n.memory AS memory" in query
+    assert "embedding" not in query
+    assert params == {"ids": ["a", "b", "missing"]}
+
+    with pytest.raises(ValueError):
+        graph_db.get_node_fields(["a"], fields=("memory) DETACH DELETE n //",))
+
+
+def test_create_index_ensures_fulltext_index(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+
+    graph_db.create_index(dimensions=3)
+
+    queries = [call.args[0] for call in session_mock.run.call_args_list]
+    assert any(
+        "CREATE FULLTEXT INDEX memory_fulltext_index" in q and "[n.memory, n.key]" in q
+        for q in queries
+    )
+
+
+def test_search_by_fulltext_tokenizes_query(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+    session_mock.run.return_value = [{"id": "a", "score": 3.2}]
+
+    results = graph_db.search_by_fulltext('Zephyr AND "launch"~', top_k=4, scope="UserMemory")
+
+    assert results == [{"id": "a", "score": 3.2}]
+    query, params = session_mock.run.call_args.args
+    assert "db.index.fulltext.queryNodes('memory_fulltext_index', $text)" in query
+    assert "node.memory_type = $scope" in query
+    assert params["text"] == '"Zephyr" "AND" "launch"'
+    assert params["k"] == 4
+
+    # Operators in user text are searched as words, never parsed (a trailing NOT would fail)
+    graph_db.search_by_fulltext("cats AND dogs NOT")
+    assert session_mock.run.call_args.args[1]["text"] == '"cats" "AND" "dogs" "NOT"'
+
+    session_mock.run.reset_mock()
+    assert graph_db.search_by_fulltext("?!") == []
+    session_mock.run.assert_not_called()
+
+
+def test_create_index_ensures_structure_key_constraint(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+
+    graph_db.create_index(dimensions=3)
+
+    queries = [call.args[0] for call in session_mock.run.call_args_list]
+    assert any("REQUIRE n.structure_key IS UNIQUE" in q for q in queries)
+    # Legacy structure nodes are keyed once here, not on every structure node lookup
+    assert any("SET legacy.structure_key = structure_key" in q for q in queries)
+
+
+def test_merge_structure_node_is_atomic_get_or_create(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.reset_mock()
+    session_mock.run.return_value.single.return_value = {"id": "new", "created": True}
+
+    node_id, created = graph_db.merge_structure_node(
+        "UserMemory:hobby", id="new", memory="hobby", metadata={"memory_type": "UserMemory"}
+    )
+
+    assert (node_id, created) == ("new", True)
+    session_mock.run.assert_called_once()
+    query = session_mock.run.call_args.args[0]
+    params = session_mock.run.call_args.kwargs
+    assert "MERGE (n:Memory {structure_key: $structure_key})" in query
+    assert "legacy" not in query
+    assert "ON CREATE SET n.id = $node.id" in query
+    assert params["structure_key"] == "UserMemory:hobby"
+    assert params["node"]["metadata"] == {"memory_type": "UserMemory"}
+
+
+def test_get_structure_node_uses_key_lookup(graph_db):
+    session_mock = graph_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value.single.return_value = None
+
+    assert graph_db.get_structure_node("UserMemory:hobby") is None
+    query = session_mock.run.call_args.args[0]
+    assert "{structure_key: $structure_key}" in query
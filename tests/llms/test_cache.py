@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from memos.configs.llm import LLMCacheConfig, LLMConfigFactory, OllamaLLMConfig
+from memos.llms.cache import CachedLLM
+from memos.llms.factory import LLMFactory
+
+
+def _make_llm(temperature: float = 0.0) -> MagicMock:
+    llm = MagicMock()
+    llm.config = OllamaLLMConfig(model_name_or_path="test-model", temperature=temperature)
+    llm.generate.side_effect = lambda messages, **kwargs: f"answer-{llm.generate.call_count}"
+    return llm
+
+
+class TestCachedLLM(unittest.TestCase):
+    def test_deterministic_calls_are_cached(self):
+        llm = _make_llm(temperature=0.0)
+        cached = CachedLLM(llm, LLMCacheConfig())
+        messages = [{"role": "user", "content": "What is MemOS?"}]
+
+        first = cached.generate(messages)
+        # Whitespace-only differences map to the same entry
+        second = cached.generate([{"role": "user", "content": "  What is MemOS?\n"}])
+
+        self.assertEqual(first, second)
+        self.assertEqual(llm.generate.call_count, 1)
+        stats = cached.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_sampled_calls_bypass_unless_requested(self):
+        llm = _make_llm(temperature=0.8)
+        cached = CachedLLM(llm, LLMCacheConfig())
+        messages = [{"role": "user", "content": "Tell me a story"}]
+
+        cached.generate(messages)
+        cached.generate(messages)
+        self.assertEqual(llm.generate.call_count, 2)
+        self.assertEqual(cached.stats()["bypassed"], 2)
+
+        cached.generate(messages, cache=True)
+        cached.generate(messages, cache=True)
+        self.assertEqual(llm.generate.call_count, 3)
+
+    def test_extra_kwargs_bypass_cache(self):
+        llm = _make_llm()
+        cached = CachedLLM(llm, LLMCacheConfig())
+        messages = [{"role": "user", "content": "hi"}]
+
+        cached.generate(messages, past_key_values="kv")
+        cached.generate(messages, past_key_values="kv")
+        self.assertEqual(llm.generate.call_count, 2)
+        llm.generate.assert_called_with(messages, past_key_values="kv")
+
+    def test_lru_eviction_and_ttl(self):
+        llm = _make_llm()
+        cached = CachedLLM(llm, LLMCacheConfig(max_entries=2, ttl_seconds=10.0))
+        first = [{"role": "user", "content": "one"}]
+
+        with patch("memos.llms.cache.time.time", return_value=1000.0):
+            cached.generate(first)
+            cached.generate([{"role": "user", "content": "two"}])
+            cached.generate(first)  # refresh "one"
+            cached.generate([{"role": "user", "content": "three"}])  # evicts "two"
+        self.assertEqual(cached.stats()["evictions"], 1)
+        self.assertEqual(cached.stats()["size"], 2)
+
+        with patch("memos.llms.cache.time.time", return_value=1005.0):
+            cached.generate(first)
+        self.assertEqual(llm.generate.call_count, 3)
+
+        with patch("memos.llms.cache.time.time", return_value=1011.0):
+            cached.generate(first)
+        self.assertEqual(llm.generate.call_count, 4)
+
+    def test_sqlite_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "llm_cache.sqlite")
+            messages = [{"role": "user", "content": "persist me"}]
+
+            llm = _make_llm()
+            CachedLLM(llm, LLMCacheConfig(sqlite_path=path)).generate(messages)
+
+            other_llm = _make_llm()
+            response = CachedLLM(other_llm, LLMCacheConfig(sqlite_path=path)).generate(messages)
+
+            self.assertEqual(response, "answer-1")
+            other_llm.generate.assert_not_called()
+
+    def test_attributes_are_forwarded(self):
+        llm = _make_llm()
+        cached = CachedLLM(llm, LLMCacheConfig())
+        self.assertIs(cached.config, llm.config)
+        self.assertIs(cached.build_kv_cache, llm.build_kv_cache)
+
+    def test_factory_wraps_when_cache_configured(self):
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {
+                    "model_name_or_path": "gpt-4.1-nano",
+                    "temperature": 0.0,
+                    "api_key": "sk-xxxx",
+                },
+                "cache": {"max_entries": 16},
+            }
+        )
+        llm = LLMFactory.from_config(config)
+        self.assertIsInstance(llm, CachedLLM)
+        self.assertEqual(llm.cache_config.max_entries, 16)
+
+        config.cache = None
+        self.assertNotIsInstance(LLMFactory.from_config(config), CachedLLM)
@@ -0,0 +1,324 @@
+import asyncio
+import threading
+import time
+
+from unittest.mock import MagicMock
+
+from redis.exceptions import ResponseError
+
+from memos.configs.mem_scheduler import RedisStreamQueueConfig, SchedulerConfigFactory
+from memos.mem_cube.general import GeneralMemCube
+from memos.mem_scheduler.modules.redis_stream_queue import RedisStreamQueue
+from memos.mem_scheduler.modules.schemas import QUERY_LABEL, ScheduleMessageItem
+from memos.mem_scheduler.scheduler_factory import SchedulerFactory
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self
+
+    async def execute(self):
+        return [await self.client.xadd(*args, **kwargs) for args, kwargs in self.calls]
+
+
+class FakeStreamRedis:
+    """In-memory stand-in for the redis.asyncio stream commands used by the queue."""
+
+    def __init__(self):
+        self.entries: list[tuple[int, str, dict]] = []
+        self.other_streams: dict[str, list[dict]] = {}
+        self.groups: dict[str, dict] = {}
+        self.seq = 0
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        if groupname in self.groups:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.groups[groupname] = {"last": 0, "pending": {}}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        if name != "memos:scheduler:messages":
+            self.other_streams.setdefault(name, []).append(dict(fields))
+            return "0-1"
+        self.seq += 1
+        entry_id = f"{self.seq}-0"
+        self.entries.append((self.seq, entry_id, dict(fields)))
+        return entry_id
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        group = self.groups[groupname]
+        new = [entry for entry in self.entries if entry[0] > group["last"]][:count]
+        if not new:
+            await asyncio.sleep((block or 0) / 1000)
+            return []
+        group["last"] = new[-1][0]
+        for _, entry_id, _ in new:
+            group["pending"][entry_id] = [consumername, time.monotonic(), 1]
+        stream = next(iter(streams))
+        return [[stream, [(entry_id, fields) for _, entry_id, fields in new]]]
+
+    async def xack(self, name, groupname, *ids):
+        pending = self.groups[groupname]["pending"]
+        return sum(pending.pop(entry_id, None) is not None for entry_id in ids)
+
+    async def xautoclaim(
+        self, name, groupname, consumername, min_idle_time, start_id="0-0", count=None
+    ):
+        now = time.monotonic()
+        fields_by_id = {entry_id: fields for _, entry_id, fields in self.entries}
+        claimed = []
+        for entry_id, pending in self.groups[groupname]["pending"].items():
+            if (now - pending[1]) * 1000 >= min_idle_time:
+                pending[:] = [consumername, now, pending[2] + 1]
+                claimed.append((entry_id, fields_by_id[entry_id]))
+        return ["0-0", claimed[:count], []]
+
+    async def xpending_range(self, name, groupname, min, max, count, consumername=None):
+        pending = self.groups[groupname]["pending"].get(min)
+        if pending is None:
+            return []
+        return [
+            {
+                "message_id": min,
+                "consumer": pending[0],
+                "time_since_delivered": 0,
+                "times_delivered": pending[2],
+            }
+        ]
+
+    async def aclose(self):
+        pass
+
+
+def _message(content: str, mem_cube_id: str = "cube_1") -> ScheduleMessageItem:
+    return ScheduleMessageItem(
+        user_id="user_1",
+        mem_cube_id=mem_cube_id,
+        label=QUERY_LABEL,
+        mem_cube="Not Applicable",
+        content=content,
+    )
+
+
+def _queue(client, **overrides) -> RedisStreamQueue:
+    config = RedisStreamQueueConfig(block_ms=10, consumer_name="consumer_a", **overrides)
+    return RedisStreamQueue(config, client=client)
+
+
+def test_schedule_message_item_stream_round_trip():
+    message = _message("hello")
+    restored = ScheduleMessageItem.from_dict(message.to_dict())
+    assert restored.item_id == message.item_id
+    assert restored.mem_cube_id == "cube_1"
+    assert restored.content == "hello"
+    assert restored.timestamp == message.timestamp
+
+
+async def test_add_read_ack_in_batches():
+    client = FakeStreamRedis()
+    queue = _queue(client, batch_size=2)
+
+    await queue.add([_message("q1"), _message("q2"), _message("q3")])
+    first = await queue.read()
+    second = await queue.read()
+
+    assert [message.content for _, message in first] == ["q1", "q2"]
+    assert [message.content for _, message in second] == ["q3"]
+    assert len(client.groups["memos-scheduler"]["pending"]) == 3
+
+    await queue.ack([entry_id for entry_id, _ in first + second])
+    assert client.groups["memos-scheduler"]["pending"] == {}
+
+
+async def test_consumers_in_group_share_messages():
+    client = FakeStreamRedis()
+    queue_a = _queue(client, batch_size=1)
+    queue_b = RedisStreamQueue(
+        RedisStreamQueueConfig(block_ms=10, batch_size=1, consumer_name="consumer_b"),
+        client=client,
+    )
+
+    await queue_a.add([_message("q1"), _message("q2")])
+    read_a = await queue_a.read()
+    read_b = await queue_b.read()
+
+    assert [m.content for _, m in read_a] == ["q1"]
+    assert [m.content for _, m in read_b] == ["q2"]
+
+
+async def test_unacked_messages_are_reclaimed():
+    client = FakeStreamRedis()
+    crashed = _queue(client, claim_idle_ms=1)
+    survivor = RedisStreamQueue(
+        RedisStreamQueueConfig(block_ms=10, claim_idle_ms=1, consumer_name="consumer_b"),
+        client=client,
+    )
+
+    await crashed.add([_message("q1")])
+    await crashed.read()  # delivered but never acknowledged
+    await asyncio.sleep(0.01)
+
+    reclaimed = await survivor.reclaim()
+    assert [m.content for _, m in reclaimed] == ["q1"]
+    assert client.groups["memos-scheduler"]["pending"]["1-0"][0] == "consumer_b"
+
+
+async def test_messages_over_delivery_cap_are_dead_lettered():
+    client = FakeStreamRedis()
+    queue = _queue(client, claim_idle_ms=1, max_deliveries=2)
+
+    await queue.add([_message("q1")])
+    await queue.read()
+    await asyncio.sleep(0.01)
+    assert [m.content for _, m in await queue.reclaim()] == ["q1"]  # second delivery
+    await asyncio.sleep(0.01)
+
+    assert await queue.reclaim() == []
+    assert client.groups["memos-scheduler"]["pending"] == {}
+    (dead,) = client.other_streams["memos:scheduler:dead-letter"]
+    assert dead["original_id"] == "1-0"
+    assert dead["times_delivered"] == 3
+    assert ScheduleMessageItem.from_dict(dead).content == "q1"
+
+
+async def test_malformed_messages_are_dropped():
+    client = FakeStreamRedis()
+    queue = _queue(client)
+    await queue.ensure_group()
+    await client.xadd("memos:scheduler:messages", {"label": "query"})
+
+    assert await queue.read() == []
+    assert client.groups["memos-scheduler"]["pending"] == {}
+
+
+def test_background_consumer_acks_after_handler():
+    client = FakeStreamRedis()
+    queue = _queue(client)
+    handled = []
+    done = threading.Event()
+
+    def handler(messages):
+        handled.extend(message.content for message in messages)
+        if len(handled) == 2:
+            done.set()
+
+    queue.start(handler)
+    try:
+        queue.submit([_message("q1"), _message("q2")])
+        assert done.wait(5)
+    finally:
+        queue.stop()
+
+    assert handled == ["q1", "q2"]
+    assert client.groups["memos-scheduler"]["pending"] == {}
+
+
+def test_background_consumer_leaves_failed_messages_pending():
+    client = FakeStreamRedis()
+    queue = _queue(client)
+    done = threading.Event()
+
+    def handler(messages):
+        done.set()
+        return [message for message in messages if message.content == "q2"]
+
+    queue.start(handler)
+    try:
+        queue.submit([_message("q1"), _message("q2")])
+        assert done.wait(5)
+    finally:
+        queue.stop()
+
+    assert list(client.groups["memos-scheduler"]["pending"]) == ["2-0"]
+
+
+def test_scheduler_consumes_from_redis_stream():
+    config = SchedulerConfigFactory.model_validate(
+        {
+            "backend": "general_scheduler",
+            "config": {
+                "enable_parallel_dispatch": True,
+                "redis_stream": {"block_ms": 10, "consumer_name": "scheduler_a"},
+            },
+        }
+    )
+    scheduler = SchedulerFactory.from_config(config)
+    scheduler._stream_queue._client = FakeStreamRedis()
+    scheduler.initialize_modules(MagicMock())
+    mem_cube = MagicMock(spec=GeneralMemCube)
+    seen = []
+    done = threading.Event()
+
+    def process_session_turn(query, top_k, top_n):
+        seen.append((scheduler.mem_cube, query))
+        done.set()
+
+    scheduler.process_session_turn = process_session_turn
+    scheduler.start()
+    try:
+        message = _message("q1")
+        message.mem_cube = mem_cube
+        scheduler.submit_messages(message)
+        assert done.wait(5)
+    finally:
+        scheduler.stop()
+
+    # The cube object does not travel through Redis; it is resolved by id on consumption
+    assert seen == [(mem_cube, "q1")]
+
+
+def _stream_scheduler(parallel: bool):
+    config = SchedulerConfigFactory.model_validate(
+        {
+            "backend": "general_scheduler",
+            "config": {
+                "enable_parallel_dispatch": parallel,
+                "redis_stream": {"block_ms": 10, "consumer_name": "scheduler_b"},
+            },
+        }
+    )
+    scheduler = SchedulerFactory.from_config(config)
+    scheduler.initialize_modules(MagicMock())
+    return scheduler
+
+
+def test_scheduler_resolves_cubes_of_other_processes_with_loader():
+    scheduler = _stream_scheduler(parallel=False)
+    mem_cube = MagicMock(spec=GeneralMemCube)
+    scheduler.mem_cube_loader = {"cube_1": mem_cube}.get
+    seen = []
+    scheduler.process_session_turn = lambda query, top_k, top_n: seen.append(scheduler.mem_cube)
+
+    # Consumed from the stream: the message carries only the cube id
+    assert scheduler._dispatch_and_wait([_message("q1")]) == []
+    assert seen == [mem_cube]
+    assert scheduler.mem_cubes["cube_1"] is mem_cube
+
+
+def test_scheduler_reports_failed_partitions_for_retry():
+    for parallel in (False, True):
+        scheduler = _stream_scheduler(parallel=parallel)
+        scheduler.register_mem_cube("cube_1", MagicMock(spec=GeneralMemCube))
+        handled = []
+        scheduler.process_session_turn = lambda query, top_k, top_n, handled=handled: (
+            handled.append(query)
+        )
+        unknown = _message("q2", mem_cube_id="unknown_cube")
+
+        failed = scheduler._dispatch_and_wait([_message("q1"), unknown])
+
+        assert failed == [unknown]
+        assert handled == ["q1"]
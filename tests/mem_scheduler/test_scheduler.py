@@ -1,13 +1,16 @@
 import json
 import sys
+import threading
 import unittest
 
+from collections import deque
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 from memos.configs.mem_scheduler import SchedulerConfigFactory
 from memos.llms.base import BaseLLM
 from memos.mem_cube.general import GeneralMemCube
+from memos.mem_scheduler.modules.dispatcher import SchedulerDispatcher
 from memos.mem_scheduler.modules.monitor import SchedulerMonitor
 from memos.mem_scheduler.modules.retriever import SchedulerRetriever
 from memos.mem_scheduler.modules.schemas import (
@@ -19,6 +22,7 @@ from memos.mem_scheduler.modules.schemas import (
     TextMemory_SEARCH_METHOD,
 )
 from memos.mem_scheduler.scheduler_factory import SchedulerFactory
+from memos.memories.textual.item import TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree import TextualMemoryItem, TreeTextMemory
 
 
@@ -48,8 +52,8 @@ class TestGeneralScheduler(unittest.TestCase):
         self.scheduler.mem_cube = self.mem_cube
 
         # 设置当前用户和内存立方体ID
-        self.scheduler._current_user_id = "test_user"
-        self.scheduler._current_mem_cube_id = "test_cube"
+        self.scheduler.current_context.user_id = "test_user"
+        self.scheduler.current_context.mem_cube_id = "test_cube"
 
     def test_initialization(self):
         # 测试初始化参数
@@ -60,8 +64,9 @@ class TestGeneralScheduler(unittest.TestCase):
         self.assertEqual(self.scheduler.activation_mem_size, 5)
         self.assertEqual(self.scheduler.act_mem_dump_path, DEFAULT_ACT_MEM_DUMP_PATH)
         self.assertEqual(self.scheduler.search_method, TextMemory_SEARCH_METHOD)
-        self.assertEqual(self.scheduler._last_activation_mem_update_time, 0.0)
+        self.assertEqual(self.scheduler.current_context.last_activation_mem_update_time, 0.0)
         self.assertEqual(self.scheduler.query_list, [])
+        self.assertEqual(self.scheduler.current_context.query_list.maxlen, 1000)
 
         # 测试处理程序注册
         self.assertTrue(QUERY_LABEL in self.scheduler.dispatcher.handlers)
@@ -126,15 +131,16 @@ class TestGeneralScheduler(unittest.TestCase):
 
         # Mock methods
         with (
-            patch.object(self.scheduler, "search") as mock_search,
+            patch.object(self.scheduler, "search_evidence") as mock_search,
             patch.object(self.scheduler, "replace_working_memory") as mock_replace,
             patch.object(self.scheduler.monitor, "detect_intent") as mock_detect,
         ):
             mock_detect.return_value = intent_result
-            mock_search.side_effect = [
-                [TextualMemoryItem(memory="Result 1")],
-                [TextualMemoryItem(memory="Result 2")],
+            new_candidates = [
+                TextualMemoryItem(memory="Result 1"),
+                TextualMemoryItem(memory="Result 2"),
             ]
+            mock_search.return_value = new_candidates
 
             # Test session turn processing
             self.scheduler.process_session_turn(query="Test query")
@@ -143,14 +149,254 @@ class TestGeneralScheduler(unittest.TestCase):
             mock_detect.assert_called_once_with(
                 q_list=["Test query"], text_working_memory=["Memory 1", "Memory 2"]
             )
-            mock_search.assert_has_calls(
-                [
-                    call(query="Evidence 1", top_k=5, method=TextMemory_SEARCH_METHOD),
-                    call(query="Evidence 2", top_k=5, method=TextMemory_SEARCH_METHOD),
-                ]
+            mock_search.assert_called_once_with(evidence=["Evidence 1", "Evidence 2"], top_k=5)
+            mock_replace.assert_called_once_with(
+                original_memory=working_memory, new_memory=new_candidates, top_k=10, top_n=5
             )
+
+    def test_search_evidence_batches_embeddings_and_recalls(self):
+        """Evidence is embedded once and recalled with one multi-vector query per scope."""
+        result_1 = TextualMemoryItem(memory="Result 1")
+        result_2 = TextualMemoryItem(memory="Result 2")
+        result_3 = TextualMemoryItem(memory="Result 3")
+        self.tree_text_memory.embedder = MagicMock()
+        self.tree_text_memory.embedder.embed.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        graph_store = MagicMock()
+        self.tree_text_memory.graph_store = graph_store
+
+        def search_by_embeddings(vectors, top_k, scope):
+            if scope == "LongTermMemory":
+                return [[{"id": result_1.id, "score": 0.9}], [{"id": result_2.id, "score": 0.8}]]
+            return [[{"id": result_3.id, "score": 0.7}], [{"id": result_1.id, "score": 0.6}]]
+
+        graph_store.search_by_embeddings.side_effect = search_by_embeddings
+        graph_store.get_nodes.return_value = [
+            item.model_dump() for item in (result_3, result_2, result_1)
+        ]
+
+        results = self.scheduler.search_evidence(evidence=["Evidence 1", "Evidence 2"], top_k=3)
+
+        self.tree_text_memory.embedder.embed.assert_called_once_with(["Evidence 1", "Evidence 2"])
+        graph_store.search_by_embeddings.assert_has_calls(
+            [
+                call([[1.0, 0.0], [0.0, 1.0]], 3, "LongTermMemory"),
+                call([[1.0, 0.0], [0.0, 1.0]], 3, "UserMemory"),
+            ],
+            any_order=True,
+        )
+        graph_store.get_nodes.assert_called_once_with([result_1.id, result_3.id, result_2.id])
+        self.assertEqual([r.memory for r in results], ["Result 1", "Result 3", "Result 2"])
+
+    def test_search_evidence_skips_scopes_past_deadline(self):
+        """A scope that misses the deadline is left out instead of blocking the turn."""
+        result = TextualMemoryItem(memory="Result 1")
+        self.tree_text_memory.embedder = MagicMock()
+        self.tree_text_memory.embedder.embed.return_value = [[1.0, 0.0]]
+        graph_store = MagicMock()
+        self.tree_text_memory.graph_store = graph_store
+        release = threading.Event()
+
+        def search_by_embeddings(vectors, top_k, scope):
+            if scope == "UserMemory":
+                release.wait(5)
+                return [[]]
+            return [[{"id": result.id, "score": 0.9}]]
+
+        graph_store.search_by_embeddings.side_effect = search_by_embeddings
+        graph_store.get_nodes.return_value = [result.model_dump()]
+        self.scheduler.evidence_search_timeout = 0.2
+
+        try:
+            results = self.scheduler.search_evidence(evidence=["Evidence 1"], top_k=3)
+        finally:
+            release.set()
+
+        self.assertEqual([r.memory for r in results], ["Result 1"])
+
+    def _working_memory_with_embeddings(self):
+        return [
+            TextualMemoryItem(
+                memory="Memory 1",
+                metadata=TreeNodeTextualMemoryMetadata(embedding=[1.0, 0.0, 0.0]),
+            ),
+            TextualMemoryItem(
+                memory="Memory 2",
+                metadata=TreeNodeTextualMemoryMetadata(embedding=[0.0, 1.0, 0.0]),
+            ),
+        ]
+
+    def test_intent_precheck_skips_llm_on_high_coverage(self):
+        """Well-covered queries skip both intent detection and retrieval."""
+        self.tree_text_memory.get_working_memory.return_value = (
+            self._working_memory_with_embeddings()
+        )
+        self.tree_text_memory.embedder = MagicMock()
+        self.tree_text_memory.embedder.embed.return_value = [[0.95, 0.05, 0.0]]
+
+        with (
+            patch.object(self.scheduler.monitor, "detect_intent") as mock_detect,
+            patch.object(self.scheduler, "search_evidence") as mock_search,
+        ):
+            self.scheduler.process_session_turn(query="Test query")
+
+            mock_detect.assert_not_called()
+            mock_search.assert_not_called()
+        self.assertEqual(self.scheduler.monitor.intent_precheck_stats["skipped"], 1)
+
+    def test_intent_precheck_triggers_retrieval_on_low_coverage(self):
+        """Uncovered queries trigger retrieval for the query itself without the LLM."""
+        self.tree_text_memory.get_working_memory.return_value = (
+            self._working_memory_with_embeddings()
+        )
+        self.tree_text_memory.memory_manager = MagicMock(
+            memory_size={"LongTermMemory": 1000, "UserMemory": 500, "WorkingMemory": 100}
+        )
+        self.tree_text_memory.embedder = MagicMock()
+        self.tree_text_memory.embedder.embed.return_value = [[0.0, 0.0, 1.0]]
+
+        with (
+            patch.object(self.scheduler.monitor, "detect_intent") as mock_detect,
+            patch.object(self.scheduler, "search_evidence", return_value=[]) as mock_search,
+            patch.object(self.scheduler, "replace_working_memory") as mock_replace,
+        ):
+            self.scheduler.process_session_turn(query="Test query")
+
+            mock_detect.assert_not_called()
+            mock_search.assert_called_once_with(evidence=["Test query"], top_k=10)
             mock_replace.assert_called_once()
 
+    def test_intent_precheck_escalates_ambiguous_coverage(self):
+        """Ambiguous coverage falls back to LLM intent detection."""
+        self.tree_text_memory.get_working_memory.return_value = (
+            self._working_memory_with_embeddings()
+        )
+        self.tree_text_memory.embedder = MagicMock()
+        self.tree_text_memory.embedder.embed.return_value = [[0.6, 0.0, 0.8]]
+
+        with patch.object(self.scheduler.monitor, "detect_intent") as mock_detect:
+            mock_detect.return_value = {"trigger_retrieval": False, "missing_evidence": []}
+            self.scheduler.process_session_turn(query="Test query")
+
+            mock_detect.assert_called_once_with(
+                q_list=["Test query"], text_working_memory=["Memory 1", "Memory 2"]
+            )
+        self.assertEqual(self.scheduler.monitor.intent_precheck_stats["escalated"], 1)
+
+    def test_intent_precheck_stats_are_thread_safe(self):
+        monitor = self.scheduler.monitor
+
+        def work():
+            for _ in range(1000):
+                monitor.precheck_intent(query="q", query_embedding=None, working_memory=[])
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(monitor.intent_precheck_stats["triggered"], 4000)
+
+    def test_mem_cube_setter_does_not_touch_shared_retriever(self):
+        retriever = self.scheduler.retriever
+        with self.scheduler._bind_context(self.scheduler.get_context("user_b", "cube_b")):
+            self.scheduler.mem_cube = MagicMock(spec=GeneralMemCube)
+        self.assertIsNone(retriever.mem_cube)
+        self.assertIs(self.scheduler.mem_cube, self.mem_cube)
+
+    def test_compute_coverage(self):
+        coverage = SchedulerMonitor.compute_coverage([1.0, 1.0], [[1.0, 0.0], [2.0, 2.0]])
+        self.assertAlmostEqual(coverage, 1.0, places=5)
+        self.assertEqual(SchedulerMonitor.compute_coverage([1.0, 0.0], []), 0.0)
+
+    def test_query_messages_use_per_cube_context(self):
+        """Each (user, cube) pair gets its own context and query history."""
+        other_cube = MagicMock(spec=GeneralMemCube)
+        seen = []
+
+        def record_turn(query, top_k, top_n):
+            context = self.scheduler.current_context
+            seen.append((context.user_id, context.mem_cube_id, self.scheduler.mem_cube, query))
+            context.query_list.append(query)
+
+        messages = [
+            ScheduleMessageItem(
+                user_id="user_a",
+                mem_cube_id="cube_a",
+                mem_cube=self.mem_cube,
+                label=QUERY_LABEL,
+                content="Query A",
+            ),
+            ScheduleMessageItem(
+                user_id="user_b",
+                mem_cube_id="cube_b",
+                mem_cube=other_cube,
+                label=QUERY_LABEL,
+                content="Query B",
+            ),
+        ]
+        with patch.object(self.scheduler, "process_session_turn", side_effect=record_turn):
+            self.scheduler._query_message_consume(messages)
+
+        self.assertEqual(
+            seen,
+            [
+                ("user_a", "cube_a", self.mem_cube, "Query A"),
+                ("user_b", "cube_b", other_cube, "Query B"),
+            ],
+        )
+        self.assertEqual(
+            list(self.scheduler.get_context("user_a", "cube_a").query_list), ["Query A"]
+        )
+        self.assertEqual(
+            list(self.scheduler.get_context("user_b", "cube_b").query_list), ["Query B"]
+        )
+        # Outside of a handler the default context is untouched
+        self.assertIs(self.scheduler.mem_cube, self.mem_cube)
+        self.assertEqual(self.scheduler.query_list, [])
+
+    def test_query_list_is_bounded(self):
+        context = self.scheduler.get_context("test_user", "test_cube")
+        context.query_list = deque(maxlen=2)
+        for query in ["q1", "q2", "q3"]:
+            context.query_list.append(query)
+        self.assertEqual(list(context.query_list), ["q2", "q3"])
+
+    def test_parallel_dispatch_orders_within_cube(self):
+        """Messages of one cube run in order; different cubes run concurrently."""
+        dispatcher = SchedulerDispatcher(max_workers=4, enable_parallel_dispatch=True)
+        cube_b_started = threading.Event()
+        processed = []
+
+        def handler(messages):
+            for message in messages:
+                if message.mem_cube_id == "cube_a" and message.content == "a1":
+                    # Blocks until cube_b is running, which requires cross-cube parallelism
+                    self.assertTrue(cube_b_started.wait(5))
+                if message.mem_cube_id == "cube_b":
+                    cube_b_started.set()
+                processed.append((message.mem_cube_id, message.content))
+
+        dispatcher.register_handlers({QUERY_LABEL: handler, ANSWER_LABEL: handler})
+
+        def make(cube_id, label, content):
+            return ScheduleMessageItem(
+                user_id="test_user",
+                mem_cube_id=cube_id,
+                mem_cube="Not Applicable",
+                label=label,
+                content=content,
+            )
+
+        dispatcher.dispatch([make("cube_a", QUERY_LABEL, "a1"), make("cube_b", QUERY_LABEL, "b1")])
+        dispatcher.dispatch([make("cube_a", ANSWER_LABEL, "a2"), make("cube_a", QUERY_LABEL, "a3")])
+        dispatcher.dispatcher_executor.shutdown(wait=True)
+
+        self.assertEqual(
+            [content for cube_id, content in processed if cube_id == "cube_a"], ["a1", "a2", "a3"]
+        )
+        self.assertIn(("cube_b", "b1"), processed)
+
     def test_submit_web_logs(self):
         """Test submission of web logs."""
         # Create log message with all required fields
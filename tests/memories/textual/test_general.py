@@ -1,6 +1,7 @@
 # TODO: Overcomplex. Use pytest fixtures instead of setUp/tearDown.
 import json
 import os
+import tempfile
 import unittest
 import uuid
 
@@ -294,7 +295,7 @@ class TestGeneralTextMemory(unittest.TestCase):
 
         retrieved_memory = self.memory.get(memory_id)
 
-        self.mock_vector_db.get_by_id.assert_called_once_with(memory_id)
+        self.mock_vector_db.get_by_id.assert_called_once_with(memory_id, with_vectors=False)
         self.assertEqual(retrieved_memory.id, expected_payload["id"])
         self.assertEqual(retrieved_memory.memory, expected_payload["memory"])
 
@@ -322,7 +323,7 @@ class TestGeneralTextMemory(unittest.TestCase):
 
         retrieved_memories = self.memory.get_by_ids(memory_ids)
 
-        self.mock_vector_db.get_by_ids.assert_called_once_with(memory_ids)
+        self.mock_vector_db.get_by_ids.assert_called_once_with(memory_ids, with_vectors=False)
         self.assertEqual(len(retrieved_memories), len(expected_payloads))
         for i, expected in enumerate(expected_payloads):
             self.assertEqual(retrieved_memories[i].id, expected["id"])
@@ -530,6 +531,37 @@ class TestGeneralTextMemory(unittest.TestCase):
                 "An error occurred while dumping memories", mock_logger_error.call_args[0][0]
             )
 
+    def test_dump_and_load_jsonl(self):
+        """Test streaming JSON Lines dump/load for GeneralTextMemory."""
+        self.config.memory_filename = "textual_memory.jsonl"
+        items = []
+        for i in range(3):
+            item_id = str(uuid.uuid4())
+            items.append(
+                VecDBItem(
+                    id=item_id,
+                    vector=[0.1 * i, 0.2, 0.3],
+                    payload={"id": item_id, "memory": f"Memory {i}", "metadata": {}},
+                )
+            )
+        self.mock_vector_db.iter_by_filter.return_value = iter([items[:2], items[2:]])
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            self.memory.dump(test_dir)
+            memory_file = os.path.join(test_dir, "textual_memory.jsonl")
+            with open(memory_file, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(json.loads(lines[2])["id"], items[2].id)
+            self.mock_vector_db.get_all.assert_not_called()
+
+            with patch("memos.memories.textual.general.LOAD_CHUNK_SIZE", 2):
+                self.memory.load(test_dir)
+
+        self.assertEqual(self.mock_vector_db.add.call_count, 2)
+        loaded = [item for call in self.mock_vector_db.add.call_args_list for item in call.args[0]]
+        self.assertEqual([item.id for item in loaded], [item.id for item in items])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ import pytest
 from memos.configs.memory import TreeTextMemoryConfig
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree import TreeTextMemory
+from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager
 
 
 @pytest.fixture
@@ -118,6 +119,23 @@ def test_load_file_not_exists(mock_tree_text_memory, tmp_path):
     # Should log a warning but not raise
 
 
+def test_load_drops_caches_filled_during_import(tmp_path, mock_tree_text_memory):
+    graph_store = mock_tree_text_memory.graph_store
+    manager = MemoryManager(graph_store, MagicMock())
+    mock_tree_text_memory.memory_manager = manager
+    mock_tree_text_memory.config.memory_filename = "memory.json"
+    (tmp_path / "memory.json").write_text('{"nodes": [], "edges": []}')
+    graph_store.get_all_memory_items.return_value = []
+    # A concurrent reader caches the working memory while the import runs
+    graph_store.import_graph.side_effect = lambda data: manager.get_working_memory()
+
+    mock_tree_text_memory.load(str(tmp_path))
+
+    graph_store.get_all_memory_items.reset_mock()
+    manager.get_working_memory()
+    graph_store.get_all_memory_items.assert_called_once()
+
+
 def test_dump_and_load_success(tmp_path, mock_tree_text_memory):
     mock_tree_text_memory.graph_store.export_graph = MagicMock(
         return_value={"nodes": [{"id": "1"}]}
@@ -138,3 +156,54 @@ def test_drop_creates_backup_and_cleans(mock_tree_text_memory):
     mock_tree_text_memory.dump.assert_called_once()
     mock_tree_text_memory._cleanup_old_backups.assert_called_once()
     mock_tree_text_memory.graph_store.drop_database.assert_called_once()
+
+
+def test_dump_and_load_columnar(tmp_path, mock_tree_text_memory):
+    node_id = str(uuid.uuid4())
+    mock_tree_text_memory.config.dump_format = "columnar"
+    mock_tree_text_memory.graph_store.iter_nodes = MagicMock(
+        return_value=iter(
+            [{"id": node_id, "memory": "m", "metadata": {"embedding": [0.1, 0.2, 0.3]}}]
+        )
+    )
+    mock_tree_text_memory.graph_store.iter_edges = MagicMock(return_value=iter([]))
+    mock_tree_text_memory.dump(str(tmp_path))
+
+    assert (tmp_path / "memory.columnar" / "embeddings.npy").exists()
+    mock_tree_text_memory.graph_store.export_graph.assert_not_called()
+
+    mock_tree_text_memory.graph_store.import_nodes = MagicMock()
+    mock_tree_text_memory.graph_store.import_graph = MagicMock()
+    mock_tree_text_memory.load(str(tmp_path))
+    imported = mock_tree_text_memory.graph_store.import_nodes.call_args[0][0]
+    assert imported[0]["id"] == node_id
+    assert imported[0]["metadata"]["embedding"] == pytest.approx([0.1, 0.2, 0.3])
+    mock_tree_text_memory.graph_store.import_graph.assert_not_called()
+
+
+def test_load_restores_latest_dump_format(tmp_path, mock_tree_text_memory):
+    graph_store = mock_tree_text_memory.graph_store
+    mock_tree_text_memory.config.dump_format = "columnar"
+    graph_store.iter_nodes = MagicMock(
+        return_value=iter([{"id": "old", "memory": "m", "metadata": {"embedding": [0.1]}}])
+    )
+    graph_store.iter_edges = MagicMock(return_value=iter([]))
+    mock_tree_text_memory.dump(str(tmp_path))
+
+    new_graph = {"nodes": [{"id": "new", "memory": "m", "metadata": {}}], "edges": []}
+    mock_tree_text_memory.config.dump_format = "json"
+    graph_store.export_graph.return_value = new_graph
+    mock_tree_text_memory.dump(str(tmp_path))
+    assert not (tmp_path / "memory.columnar").exists()
+
+    graph_store.import_nodes = MagicMock()
+    mock_tree_text_memory.load(str(tmp_path))
+    graph_store.import_graph.assert_called_once_with(new_graph)
+    graph_store.import_nodes.assert_not_called()
+
+    mock_tree_text_memory.config.dump_format = "columnar"
+    graph_store.iter_nodes.return_value = iter(
+        [{"id": "newest", "memory": "m", "metadata": {"embedding": [0.1]}}]
+    )
+    mock_tree_text_memory.dump(str(tmp_path))
+    assert not (tmp_path / "memory.json").exists()
@@ -0,0 +1,100 @@
+import json
+import uuid
+
+import numpy as np
+import pytest
+
+from memos.memories.textual.tree_text_memory import columnar_dump
+
+
+def _make_graph(num_nodes=3, dim=4):
+    nodes = []
+    for i in range(num_nodes):
+        metadata = {"memory_type": "LongTermMemory", "tags": [f"t{i}"]}
+        if i != 1:  # node 1 has no embedding
+            metadata["embedding"] = [float(i + j) / 10 for j in range(dim)]
+        nodes.append({"id": str(uuid.uuid4()), "memory": f"memory {i}", "metadata": metadata})
+    edges = [{"source": nodes[0]["id"], "target": nodes[2]["id"], "type": "PARENT"}]
+    return nodes, edges
+
+
+def test_round_trip(tmp_path):
+    nodes, edges = _make_graph()
+    out_dir = str(tmp_path / "cube.columnar")
+
+    manifest = columnar_dump.write_columnar_dump(out_dir, iter(nodes), iter(edges))
+    assert manifest["num_nodes"] == 3
+    assert manifest["num_edges"] == 1
+    assert manifest["embedding_dim"] == 4
+    assert columnar_dump.is_columnar_dump(out_dir)
+
+    matrix = columnar_dump.load_embedding_matrix(out_dir)
+    assert isinstance(matrix, np.memmap)
+    assert matrix.shape == (2, 4)
+    assert matrix.dtype == np.float32
+
+    loaded = [
+        n for batch in columnar_dump.iter_columnar_nodes(out_dir, batch_size=2) for n in batch
+    ]
+    assert [n["id"] for n in loaded] == [n["id"] for n in nodes]
+    assert "embedding" not in loaded[1]["metadata"]
+    np.testing.assert_allclose(
+        loaded[2]["metadata"]["embedding"], nodes[2]["metadata"]["embedding"]
+    )
+    assert loaded[0]["metadata"]["tags"] == ["t0"]
+
+    loaded_edges = [e for batch in columnar_dump.iter_columnar_edges(out_dir) for e in batch]
+    assert loaded_edges == edges
+
+
+def test_inconsistent_dimension_rejected(tmp_path):
+    nodes, _ = _make_graph()
+    nodes[2]["metadata"]["embedding"] = [0.1, 0.2]
+    with pytest.raises(ValueError):
+        columnar_dump.write_columnar_dump(str(tmp_path / "bad"), nodes, [])
+    assert not columnar_dump.is_columnar_dump(str(tmp_path / "bad"))
+
+
+def test_convert_json_dump(tmp_path):
+    nodes, edges = _make_graph()
+    json_file = tmp_path / "textual_memory.json"
+    json_file.write_text(json.dumps({"nodes": nodes, "edges": edges}))
+
+    out_dir = str(tmp_path / "textual_memory.columnar")
+    manifest = columnar_dump.convert_json_dump(str(json_file), out_dir)
+    assert manifest["num_nodes"] == 3
+    assert columnar_dump.load_embedding_matrix(out_dir).shape == (2, 4)
+
+
+@pytest.mark.parametrize(("dtype", "atol"), [("float16", 1e-3), ("int8", 1e-2)])
+def test_quantized_round_trip(tmp_path, dtype, atol):
+    nodes, edges = _make_graph(num_nodes=4, dim=8)
+    out_dir = str(tmp_path / dtype)
+    manifest = columnar_dump.write_columnar_dump(out_dir, nodes, edges, embedding_dtype=dtype)
+    assert manifest["embedding_dtype"] == dtype
+
+    matrix = columnar_dump.load_embedding_matrix(out_dir)
+    assert matrix.dtype == np.dtype(columnar_dump._EMBEDDING_DTYPES[dtype])
+    scales = columnar_dump.load_embedding_scales(out_dir)
+    assert (scales is not None) == (dtype == "int8")
+
+    loaded = [n for batch in columnar_dump.iter_columnar_nodes(out_dir) for n in batch]
+    for original, restored in zip(nodes, loaded, strict=True):
+        if "embedding" in original["metadata"]:
+            np.testing.assert_allclose(
+                restored["metadata"]["embedding"], original["metadata"]["embedding"], atol=atol
+            )
+
+
+def test_int8_quantization_keeps_ranking():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(200, 64)).astype(np.float32)
+    query = rng.normal(size=64).astype(np.float32)
+    stored, scales = zip(
+        *(columnar_dump.quantize_embedding(row, "int8") for row in matrix), strict=True
+    )
+    restored = columnar_dump.dequantize_embeddings(np.stack(stored), np.asarray(scales))
+
+    exact_top = set(np.argsort(matrix @ query)[-10:])
+    approx_top = set(np.argsort(restored @ query)[-10:])
+    assert len(exact_top & approx_top) >= 9
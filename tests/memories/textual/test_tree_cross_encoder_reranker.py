@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from memos.configs.reranker import CrossEncoderRerankerConfig, RerankerConfigFactory
+from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.retrieve.cross_encoder_reranker import (
+    CrossEncoderReranker,
+)
+from memos.memories.textual.tree_text_memory.retrieve.reranker_factory import RerankerFactory
+
+
+@pytest.fixture
+def mock_cross_encoder():
+    with patch(
+        "memos.memories.textual.tree_text_memory.retrieve.cross_encoder_reranker.CrossEncoder"
+    ) as cross_encoder_cls:
+        yield cross_encoder_cls
+
+
+def make_candidates(n: int) -> list[tuple[TextualMemoryItem, float]]:
+    return [(TextualMemoryItem(memory=f"memory {i}"), 1.0 - i / n) for i in range(n)]
+
+
+def test_factory_loads_model_with_onnx_backend(mock_cross_encoder):
+    config = RerankerConfigFactory(
+        backend="cross_encoder",
+        config={"model_name_or_path": "tiny-ce", "model_backend": "onnx", "max_length": 256},
+    )
+
+    reranker = RerankerFactory.from_config(config)
+
+    assert isinstance(reranker, CrossEncoderReranker)
+    mock_cross_encoder.assert_called_once_with(
+        "tiny-ce", device="cpu", max_length=256, trust_remote_code=False, backend="onnx"
+    )
+
+
+def test_rerank_scores_only_top_n_in_batches(mock_cross_encoder):
+    model = mock_cross_encoder.return_value
+    model.predict.return_value = np.array([0.1, 0.9, 0.5], dtype=np.float32)
+    reranker = CrossEncoderReranker(CrossEncoderRerankerConfig(top_n=3, batch_size=2))
+    candidates = make_candidates(10)
+
+    result = reranker.rerank("query", candidates, top_k=2)
+
+    pairs = model.predict.call_args.args[0]
+    assert pairs == [("query", "memory 0"), ("query", "memory 1"), ("query", "memory 2")]
+    assert model.predict.call_args.kwargs["batch_size"] == 2
+    assert [item.memory for item, _ in result] == ["memory 1", "memory 2"]
+    assert [score for _, score in result] == pytest.approx([0.9, 0.5])
+
+
+def test_rerank_pool_covers_top_k(mock_cross_encoder):
+    model = mock_cross_encoder.return_value
+    model.predict.side_effect = lambda pairs, **kwargs: np.zeros(len(pairs), dtype=np.float32)
+    reranker = CrossEncoderReranker(CrossEncoderRerankerConfig(top_n=2))
+
+    assert len(reranker.rerank("query", make_candidates(10), top_k=5)) == 5
+    assert reranker.rerank("query", [], top_k=5) == []
@@ -0,0 +1,212 @@
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from memos.configs.internet_retriever import InternetRetrieverConfigFactory
+from memos.memories.textual.tree_text_memory.retrieve.internet_retriever import (
+    InternetGoogleRetriever,
+    SearchResultCache,
+)
+from memos.memories.textual.tree_text_memory.retrieve.internet_retriever_factory import (
+    InternetRetrieverFactory,
+)
+from memos.memories.textual.tree_text_memory.retrieve.xinyusearch import XinyuSearchRetriever
+
+
+def _page(start, count):
+    return {
+        "items": [
+            {"title": f"t{i}", "snippet": f"s{i}", "link": f"https://example.com/{i}"}
+            for i in range(start, start + count)
+        ]
+    }
+
+
+def _response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def embedder():
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda texts: [[float(i)] for i in range(len(texts))]
+    return embedder
+
+
+@pytest.fixture
+def google(embedder):
+    retriever = InternetGoogleRetriever(
+        "key", "cx", embedder, max_results=30, num_per_request=10, timeout=3.0
+    )
+    retriever.google_api.session = MagicMock()
+    return retriever
+
+
+def test_google_pages_fetched_concurrently_in_order(google):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get(url, params, timeout):
+        # The pages after the first wait for each other, so this only passes if they overlap
+        if params["start"] > 1:
+            barrier.wait()
+        assert timeout == 3.0
+        return _response(_page(params["start"], 10))
+
+    google.google_api.session.get.side_effect = get
+
+    results = google.google_api.get_all_results("query", max_results=30)
+
+    assert [r["title"] for r in results] == [f"t{i}" for i in range(1, 31)]
+    assert google.google_api.session.get.call_count == 3
+
+
+def test_google_results_stop_at_incomplete_page(google):
+    pages = {1: _page(1, 10), 11: _page(11, 4), 21: _page(21, 10)}
+    google.google_api.session.get.side_effect = lambda url, params, timeout: _response(
+        pages[params["start"]]
+    )
+
+    results = google.google_api.get_all_results("query", max_results=30)
+
+    assert len(results) == 14
+
+
+def test_google_incomplete_first_page_sends_no_more_requests(google):
+    google.google_api.session.get.return_value = _response(_page(1, 7))
+
+    results = google.google_api.get_all_results("query", max_results=30)
+
+    assert len(results) == 7
+    assert google.google_api.session.get.call_count == 1
+
+
+def test_google_pages_bounded_by_reported_total(google):
+    first = {**_page(1, 10), "searchInformation": {"totalResults": "15"}}
+    pages = {1: first, 11: _page(11, 5)}
+    google.google_api.session.get.side_effect = lambda url, params, timeout: _response(
+        pages[params["start"]]
+    )
+
+    assert len(google.google_api.get_all_results("query", max_results=30)) == 15
+    assert google.google_api.session.get.call_count == 2
+
+
+def test_retrieve_embeds_results_in_one_batch(google, embedder):
+    google.google_api.session.get.side_effect = lambda url, params, timeout: _response(
+        _page(params["start"], 10)
+    )
+
+    items = google.retrieve_from_internet("query", top_k=20)
+
+    assert len(items) == 20
+    embedder.embed.assert_called_once()
+    assert len(embedder.embed.call_args[0][0]) == 20
+    assert items[3].metadata.embedding == [3.0]
+    assert items[3].memory == "Title: t4\nSummary: s4\nSource: https://example.com/4"
+
+
+def test_retrieve_serves_repeated_query_from_cache(google, embedder):
+    google.google_api.session.get.return_value = _response(_page(1, 5))
+
+    first = google.retrieve_from_internet("query", top_k=5)
+    second = google.retrieve_from_internet("query", top_k=5)
+
+    assert google.google_api.session.get.call_count == 1
+    assert embedder.embed.call_count == 1
+    assert [i.memory for i in first] == [i.memory for i in second]
+    assert first[0].id != second[0].id
+
+
+def test_retrieve_does_not_cache_failed_search(google):
+    google.google_api.session.get.return_value = _response({})
+
+    assert google.retrieve_from_internet("query", top_k=5) == []
+    assert google.retrieve_from_internet("query", top_k=5) == []
+    assert google.google_api.session.get.call_count == 2
+
+
+def test_search_result_cache_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "memos.memories.textual.tree_text_memory.retrieve.internet_retriever.time.monotonic",
+        lambda: now[0],
+    )
+    cache = SearchResultCache(ttl_seconds=10, max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    now[0] += 11
+    assert cache.get("b") is None
+    assert SearchResultCache(ttl_seconds=0).enabled is False
+
+
+def test_xinyu_uses_pooled_session_and_batch_embedding(embedder):
+    retriever = XinyuSearchRetriever("token", "https://xinyu.example.com", embedder, timeout=2.0)
+    retriever.xinyu_api.session = MagicMock()
+    results = [{"title": f"t{i}", "content": "c", "summary": "s", "url": "u"} for i in range(3)]
+    retriever.xinyu_api.session.post.return_value.text = (
+        '{"results": {"online": ' + str(results).replace("'", '"') + "}}"
+    )
+
+    items = retriever.retrieve_from_internet("query", top_k=3)
+    retriever.retrieve_from_internet("query", top_k=3)
+
+    assert len(items) == 3
+    assert retriever.xinyu_api.session.post.call_count == 1
+    assert retriever.xinyu_api.session.post.call_args.kwargs["timeout"] == 2.0
+    embedder.embed.assert_called_once()
+
+
+def test_factory_passes_http_and_cache_settings(embedder):
+    config = InternetRetrieverConfigFactory(
+        backend="google",
+        config={
+            "api_key": "key",
+            "search_engine_id": "cx",
+            "timeout": 5.0,
+            "max_workers": 2,
+            "cache_ttl_seconds": 0,
+        },
+    )
+
+    retriever = InternetRetrieverFactory.from_config(config, embedder)
+
+    assert retriever.google_api.timeout == 5.0
+    assert retriever.google_api.max_workers == 2
+    assert retriever.cache.enabled is False
+
+
+def test_retrieve_does_not_cache_partially_failed_search(google):
+    def get(url, params, timeout):
+        if params["start"] > 1:
+            raise requests.exceptions.ConnectionError("page failed")
+        return _response(_page(1, 10))
+
+    google.google_api.session.get.side_effect = get
+
+    results, complete = google.google_api.fetch_all_results("query", max_results=30)
+    assert len(results) == 10
+    assert complete is False
+
+    assert len(google.retrieve_from_internet("query", top_k=30)) == 10
+    assert len(google.retrieve_from_internet("query", top_k=30)) == 10
+    assert google.google_api.session.get.call_count == 9
+
+
+def test_xinyu_does_not_cache_failed_search(embedder):
+    retriever = XinyuSearchRetriever("token", "https://xinyu.example.com", embedder)
+    retriever.xinyu_api.session = MagicMock()
+    # The results are parsed, but the online part is missing
+    retriever.xinyu_api.session.post.return_value.text = '{"results": {"offline": []}}'
+
+    assert retriever.retrieve_from_internet("query", top_k=3) == []
+    assert retriever.retrieve_from_internet("query", top_k=3) == []
+    assert retriever.xinyu_api.session.post.call_count == 2
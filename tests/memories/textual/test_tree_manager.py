@@ -67,8 +67,20 @@ def test_add_to_graph_memory_merges(memory_manager, mock_graph_store):
         ),
     )
     memory_manager._add_to_graph_memory(memory, "UserMemory")
+    assert mock_graph_store.add_merged_node.called
+    mock_graph_store.add_node.assert_not_called()
+
+
+def test_add_to_graph_memory_skips_dedup_when_disabled(mock_graph_store, mock_embedder):
+    manager = MemoryManager(mock_graph_store, mock_embedder, inline_dedup=False)
+    memory = TextualMemoryItem(
+        memory="near duplicate",
+        metadata=TreeNodeTextualMemoryMetadata(embedding=[0.1] * 5, memory_type="UserMemory"),
+    )
+    manager._add_to_graph_memory(memory, "UserMemory")
+    mock_graph_store.search_by_embedding.assert_not_called()
+    mock_graph_store.add_merged_node.assert_not_called()
     assert mock_graph_store.add_node.called
-    assert mock_graph_store.add_edge.called
 
 
 def test_add_to_graph_memory_creates_new_node(memory_manager, mock_graph_store):
@@ -93,25 +105,35 @@ def test_merge(memory_manager, mock_graph_store):
             embedding=[0.1] * 5, confidence=50, background="src bg"
         ),
     )
-    similar_nodes = [{"id": str(uuid.uuid4()), "score": 0.95}]
+    similar_nodes = [
+        {"id": str(uuid.uuid4()), "score": 0.95},
+        {"id": "related_id", "score": 0.9},
+    ]
     memory_manager._merge(source, similar_nodes)
-    assert mock_graph_store.add_node.called
-    assert mock_graph_store.add_edge.called
 
+    # All graph writes of the merge go through a single call
+    mock_graph_store.add_merged_node.assert_called_once()
+    mock_graph_store.add_node.assert_not_called()
+    mock_graph_store.add_edge.assert_not_called()
+    mock_graph_store.update_node.assert_not_called()
+    mock_graph_store.get_edges.assert_not_called()
 
-def test_inherit_edges(memory_manager, mock_graph_store):
-    from_id = "from_id"
-    to_id = "to_id"
-    mock_graph_store.get_edges.return_value = [
-        {"from": from_id, "to": "node_b", "type": "RELATE"},
-        {"from": "node_c", "to": from_id, "type": "RELATE"},
-    ]
-    memory_manager._inherit_edges(from_id, to_id)
-    assert mock_graph_store.add_edge.call_count > 0
+    original_id = mock_graph_store.add_merged_node.call_args.args[0]
+    kwargs = mock_graph_store.add_merged_node.call_args.kwargs
+    assert original_id == similar_nodes[0]["id"]
+    assert kwargs["merged_node"]["memory"] == "old text\n⟵MERGED⟶\nsource text"
+    assert kwargs["merged_node"]["metadata"]["confidence"] == 70.0
+    assert kwargs["archived_source"]["memory"] == "source text"
+    assert kwargs["archived_source"]["metadata"]["status"] == "archived"
+    assert kwargs["related_ids"] == ["related_id"]
 
 
 def test_ensure_structure_path_creates_new(memory_manager, mock_graph_store):
-    mock_graph_store.get_by_metadata.return_value = []
+    mock_graph_store.get_structure_node.return_value = None
+    mock_graph_store.merge_structure_node.side_effect = lambda key, id, memory, metadata: (
+        id,
+        True,
+    )
     meta = TreeNodeTextualMemoryMetadata(
         key="hobby",
         embedding=[0.1] * 5,
@@ -120,11 +142,164 @@ def test_ensure_structure_path_creates_new(memory_manager, mock_graph_store):
     )
     node_id = memory_manager._ensure_structure_path("UserMemory", meta)
     assert isinstance(node_id, str)
-    assert mock_graph_store.add_node.called
+
+    structure_key, *_ = mock_graph_store.merge_structure_node.call_args.args
+    kwargs = mock_graph_store.merge_structure_node.call_args.kwargs
+    assert structure_key == "UserMemory:hobby"
+    assert kwargs["memory"] == "hobby"
+    assert kwargs["metadata"]["memory_type"] == "UserMemory"
+    mock_graph_store.get_by_metadata.assert_not_called()
+    assert memory_manager.get_current_memory_size()["UserMemory"] == 1
 
 
 def test_ensure_structure_path_reuses_existing(memory_manager, mock_graph_store):
-    mock_graph_store.get_by_metadata.return_value = ["existing_node_id"]
+    mock_graph_store.get_structure_node.return_value = "existing_node_id"
     meta = TreeNodeTextualMemoryMetadata(key="hobby")
     node_id = memory_manager._ensure_structure_path("UserMemory", meta)
     assert node_id == "existing_node_id"
+    mock_graph_store.merge_structure_node.assert_not_called()
+    memory_manager.embedder.embed.assert_not_called()
+
+
+def test_ensure_structure_path_is_cached(memory_manager, mock_graph_store):
+    mock_graph_store.get_structure_node.return_value = "existing_node_id"
+    meta = TreeNodeTextualMemoryMetadata(key="hobby")
+
+    memory_manager._ensure_structure_path("UserMemory", meta)
+    memory_manager._ensure_structure_path("UserMemory", meta)
+    assert mock_graph_store.get_structure_node.call_count == 1
+
+    # Eviction of the type may have removed the structure node
+    memory_manager.invalidate_structure_nodes("UserMemory")
+    memory_manager._ensure_structure_path("UserMemory", meta)
+    assert mock_graph_store.get_structure_node.call_count == 2
+
+
+def test_ensure_structure_path_adopts_concurrently_created_node(memory_manager, mock_graph_store):
+    mock_graph_store.get_structure_node.return_value = None
+    mock_graph_store.merge_structure_node.return_value = ("other_thread_node_id", False)
+    meta = TreeNodeTextualMemoryMetadata(key="hobby")
+
+    node_id = memory_manager._ensure_structure_path("LongTermMemory", meta)
+
+    assert node_id == "other_thread_node_id"
+    assert memory_manager.get_current_memory_size()["LongTermMemory"] == 0
+
+
+def _working_memory_record(text: str, updated_at: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "memory": text,
+        "metadata": {"memory_type": "WorkingMemory", "updated_at": updated_at},
+    }
+
+
+def test_working_memory_snapshot_is_reused_until_write(memory_manager, mock_graph_store):
+    mock_graph_store.get_all_memory_items.return_value = [
+        _working_memory_record("older", "2025-01-01T00:00:00"),
+        _working_memory_record("newer", "2025-01-02T00:00:00"),
+    ]
+
+    first = memory_manager.get_working_memory()
+    second = memory_manager.get_working_memory()
+
+    assert [item.memory for item in first] == ["newer", "older"]
+    assert second == first and second is not first
+    mock_graph_store.get_all_memory_items.assert_called_once_with(scope="WorkingMemory")
+
+    memory_manager.replace_working_memory([])
+    memory_manager.get_working_memory()
+    assert mock_graph_store.get_all_memory_items.call_count == 2
+
+
+def test_working_memory_snapshot_dropped_when_write_races_read(memory_manager, mock_graph_store):
+    def scan_while_writing(scope):
+        memory_manager.invalidate_working_memory()
+        return [_working_memory_record("stale", "2025-01-01T00:00:00")]
+
+    mock_graph_store.get_all_memory_items.side_effect = scan_while_writing
+
+    memory_manager.get_working_memory()
+    memory_manager.get_working_memory()
+
+    # A snapshot read during a write is never reused
+    assert mock_graph_store.get_all_memory_items.call_count == 2
+
+
+def test_working_memory_cache_can_be_disabled(mock_graph_store, mock_embedder):
+    manager = MemoryManager(mock_graph_store, mock_embedder, cache_working_memory=False)
+    mock_graph_store.get_all_memory_items.return_value = []
+
+    manager.get_working_memory()
+    manager.get_working_memory()
+
+    assert mock_graph_store.get_all_memory_items.call_count == 2
+
+
+def _working_memory_item(text: str) -> TextualMemoryItem:
+    return TextualMemoryItem(
+        memory=text,
+        metadata=TreeNodeTextualMemoryMetadata(embedding=[0.1] * 5, memory_type="WorkingMemory"),
+    )
+
+
+def test_add_tracks_memory_size_without_rescanning(memory_manager, mock_graph_store):
+    mock_graph_store.get_grouped_counts.return_value = [
+        {"memory_type": "WorkingMemory", "count": 3}
+    ]
+
+    memory_manager.add([_working_memory_item("a")])
+    memory_manager.add([_working_memory_item("b"), _working_memory_item("c")])
+
+    mock_graph_store.get_grouped_counts.assert_called_once()
+    mock_graph_store.remove_oldest_memory.assert_not_called()
+    mock_graph_store.delete_oldest_memory.assert_not_called()
+    assert memory_manager.get_current_memory_size() == {
+        "WorkingMemory": 6,
+        "LongTermMemory": 0,
+        "UserMemory": 0,
+    }
+
+
+def test_add_evicts_only_the_overflow(mock_graph_store, mock_embedder):
+    manager = MemoryManager(
+        mock_graph_store,
+        mock_embedder,
+        memory_size={"WorkingMemory": 2, "LongTermMemory": 10, "UserMemory": 10},
+    )
+    mock_graph_store.get_grouped_counts.return_value = [
+        {"memory_type": "WorkingMemory", "count": 2}
+    ]
+    mock_graph_store.delete_oldest_memory.side_effect = lambda memory_type, count: count
+
+    manager.add([_working_memory_item("a")])
+
+    mock_graph_store.delete_oldest_memory.assert_called_once_with("WorkingMemory", 1)
+    assert manager.get_current_memory_size()["WorkingMemory"] == 2
+
+
+def test_background_eviction_runs_off_the_add_path(mock_graph_store, mock_embedder):
+    manager = MemoryManager(
+        mock_graph_store,
+        mock_embedder,
+        memory_size={"WorkingMemory": 1, "LongTermMemory": 10, "UserMemory": 10},
+        background_eviction=True,
+    )
+    mock_graph_store.get_grouped_counts.return_value = []
+    mock_graph_store.delete_oldest_memory.side_effect = lambda memory_type, count: count
+
+    manager.add([_working_memory_item("a"), _working_memory_item("b")])
+    manager._maintenance_executor.shutdown(wait=True)
+
+    mock_graph_store.delete_oldest_memory.assert_called_once_with("WorkingMemory", 1)
+    assert manager.get_current_memory_size()["WorkingMemory"] == 1
+
+
+def test_invalidate_memory_size_recounts_on_next_add(memory_manager, mock_graph_store):
+    mock_graph_store.get_grouped_counts.return_value = []
+
+    memory_manager.add([_working_memory_item("a")])
+    memory_manager.invalidate_memory_size()
+    memory_manager.add([_working_memory_item("b")])
+
+    assert mock_graph_store.get_grouped_counts.call_count == 2
@@ -0,0 +1,128 @@
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.configs.memory import ReorganizerConfig
+from memos.memories.textual.tree_text_memory.organize.reorganizer import GraphReorganizer
+
+
+def _record(node_id, embedding, updated_at, **metadata):
+    return {
+        "id": node_id,
+        "memory": f"memory {node_id}",
+        "metadata": {
+            "embedding": embedding,
+            "updated_at": updated_at,
+            "status": "activated",
+            **metadata,
+        },
+    }
+
+
+@pytest.fixture
+def graph_store():
+    store = MagicMock()
+    store.edge_exists.return_value = False
+    store.get_all_memory_items.side_effect = lambda scope: {
+        "LongTermMemory": [
+            _record("a", [1.0, 0.0, 0.0], "2025-01-01T00:00:00"),
+            _record("b", [0.99, 0.01, 0.0], "2025-01-03T00:00:00"),
+            _record("c", [2.0, 0.0, 0.01], "2025-01-02T00:00:00"),
+            _record("d", [0.0, 1.0, 0.0], "2025-01-04T00:00:00"),
+            _record("e", [0.8, 0.6, 0.0], "2025-01-05T00:00:00"),
+        ]
+    }.get(scope, [])
+    return store
+
+
+def test_run_once_merges_duplicates_into_most_recent(graph_store):
+    reorganizer = GraphReorganizer(graph_store, config=ReorganizerConfig(block_size=2))
+
+    stats = reorganizer.run_once()
+
+    graph_store.merge_node_group.assert_called_once()
+    keep_id, duplicate_ids = graph_store.merge_node_group.call_args.args
+    assert keep_id == "b"
+    assert sorted(duplicate_ids) == ["a", "c"]
+    assert stats == {"scanned": 5, "merged": 2, "conflicts": 0}
+
+
+def test_run_once_skips_archived_and_structure_nodes(graph_store):
+    graph_store.get_all_memory_items.side_effect = lambda scope: [
+        _record("a", [1.0, 0.0], "2025-01-01T00:00:00"),
+        _record("b", [1.0, 0.0], "2025-01-02T00:00:00", status="archived"),
+        _record("c", [1.0, 0.0], "2025-01-03T00:00:00", structure_key="LongTermMemory:topic"),
+        _record("d", None, "2025-01-04T00:00:00"),
+    ]
+    reorganizer = GraphReorganizer(graph_store)
+
+    assert reorganizer.run_once()["merged"] == 0
+    graph_store.merge_node_group.assert_not_called()
+
+
+def test_run_once_respects_merge_budget(graph_store):
+    reorganizer = GraphReorganizer(graph_store, config=ReorganizerConfig(max_merges_per_run=1))
+
+    assert reorganizer.run_once()["merged"] == 1
+    assert len(graph_store.merge_node_group.call_args.args[1]) == 1
+
+
+def test_conflicts_checked_only_below_merge_threshold(graph_store):
+    llm = MagicMock()
+    llm.generate.return_value = '{"conflict": true, "explanation": "different values"}'
+    config = ReorganizerConfig(conflict_threshold=0.75, max_conflict_checks_per_run=5)
+    reorganizer = GraphReorganizer(graph_store, llm, config)
+
+    stats = reorganizer.run_once()
+
+    # "e" is similar to the surviving "b" (and to the archived "a" and "c") but not a duplicate
+    assert llm.generate.call_count == 1
+    graph_store.add_edge.assert_called_once_with("e", "b", "CONFLICT")
+    assert stats["conflicts"] == 1
+
+
+def test_on_change_called_after_changes(graph_store):
+    on_change = MagicMock()
+    GraphReorganizer(graph_store, on_change=on_change).run_once()
+    on_change.assert_called_once()
+
+
+def test_start_and_stop_background_thread(graph_store):
+    passes = threading.Event()
+    graph_store.merge_node_group.side_effect = lambda *args: passes.set()
+    reorganizer = GraphReorganizer(graph_store, config=ReorganizerConfig(interval_seconds=60))
+
+    reorganizer.start()
+    assert passes.wait(5)
+    reorganizer.stop(timeout=5)
+
+    assert reorganizer._thread is None
+
+
+def test_scan_stops_once_merge_budget_is_used(graph_store):
+    config = ReorganizerConfig(block_size=1, max_merges_per_run=1)
+    reorganizer = GraphReorganizer(graph_store, config=config)
+    reorganizer._throttle = MagicMock()
+
+    assert reorganizer.run_once()["merged"] == 1
+    # Blocks of "e", "d" and "b" (newest first); "b" uses up the budget
+    assert reorganizer._throttle.call_count == 3
+
+
+def test_conflict_checks_take_most_similar_candidates(graph_store):
+    graph_store.get_all_memory_items.side_effect = lambda scope: [
+        _record("x", [1.0, 0.0], "2025-01-03T00:00:00"),
+        _record("y", [0.85, 0.5268], "2025-01-02T00:00:00"),
+        _record("z", [0.8, -0.6], "2025-01-01T00:00:00"),
+    ]
+    llm = MagicMock()
+    llm.generate.return_value = '{"conflict": true, "explanation": "different values"}'
+    config = ReorganizerConfig(conflict_threshold=0.75, max_conflict_checks_per_run=1)
+
+    stats = GraphReorganizer(graph_store, llm, config).run_once()
+
+    assert llm.generate.call_count == 1
+    graph_store.add_edge.assert_called_once_with("x", "y", "CONFLICT")
+    assert stats["conflicts"] == 1
@@ -1,5 +1,6 @@
 import uuid
 
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -7,8 +8,14 @@ import pytest
 
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree_text_memory.retrieve.reranker import (
+    CosineScorer,
+    CrossEncoderScorer,
+    LexicalScorer,
     MemoryReranker,
+    RecencyScorer,
     batch_cosine_similarity,
+    tokenize,
+    top_k_indices,
 )
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
 
@@ -108,3 +115,94 @@ def test_rerank_with_fallback(mock_reranker):
     # One must have valid score, one fallback with -1
     scores = [score for _, score in result]
     assert any(s == -1.0 for s in scores)
+
+
+def test_top_k_indices_orders_best_first():
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3], dtype=np.float32)
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 4, 0]
+    assert top_k_indices(scores, 0).tolist() == []
+
+
+def test_rerank_many_candidates_matches_full_sort(mock_reranker):
+    rng = np.random.default_rng(0)
+    items = [make_item(rng.normal(size=8).tolist(), "fact") for _ in range(300)]
+    query_emb = rng.normal(size=8).tolist()
+
+    result = mock_reranker.rerank(
+        query="test",
+        query_embedding=query_emb,
+        graph_results=items,
+        top_k=10,
+        parsed_goal=ParsedTaskGoal(keys=[], tags=[]),
+    )
+
+    expected = np.argsort(
+        -np.array(batch_cosine_similarity(query_emb, [i.metadata.embedding for i in items]))
+    )
+    assert [item.id for item, _ in result] == [items[i].id for i in expected[:10]]
+    assert mock_reranker.last_scoring_ms > 0
+
+
+def test_rerank_fallback_keeps_duplicate_items(mock_reranker):
+    # Fallback selection is positional, not by item equality
+    no_emb = make_item(None, "fact")
+    result = mock_reranker.rerank(
+        query="test",
+        query_embedding=[1, 0],
+        graph_results=[make_item([1, 0], "fact"), no_emb, no_emb],
+        top_k=3,
+        parsed_goal=ParsedTaskGoal(keys=[], tags=[]),
+    )
+    assert [score for _, score in result] == [pytest.approx(1.0), -1.0, -1.0]
+
+
+def test_rerank_combines_pluggable_scorers():
+    now = datetime.now()
+    fresh = make_item([1, 0], "fact")
+    fresh.metadata.updated_at = now.isoformat()
+    stale = make_item([1, 0], "fact")
+    stale.metadata.updated_at = (now - timedelta(days=30)).isoformat()
+
+    cross_encoder = MagicMock()
+    cross_encoder.predict.return_value = [0.0, 2.0]
+
+    reranker = MemoryReranker(
+        MagicMock(),
+        MagicMock(),
+        scorers=[
+            (CosineScorer(), 1.0),
+            (RecencyScorer(half_life_days=30), 1.0),
+            (CrossEncoderScorer(cross_encoder, batch_size=8), 0.5),
+        ],
+    )
+    result = reranker.rerank(
+        query="q",
+        query_embedding=[1, 0],
+        graph_results=[fresh, stale],
+        top_k=2,
+        parsed_goal=ParsedTaskGoal(keys=[], tags=[]),
+    )
+
+    scores = {item.id: score for item, score in result}
+    assert scores[fresh.id] == pytest.approx(1.0 + 1.0 + 0.0, abs=1e-3)
+    assert scores[stale.id] == pytest.approx(1.0 + 0.5 + 1.0, abs=1e-3)
+    assert result[0][0] is stale
+    cross_encoder.predict.assert_called_once_with([("q", "test"), ("q", "test")], batch_size=8)
+
+
+def test_tokenize_splits_cjk_characters():
+    assert tokenize("Zephyr-2 发布 Plan") == ["zephyr", "2", "发", "布", "plan"]
+
+
+def test_lexical_scorer_ranks_rare_term_matches():
+    items = [
+        TextualMemoryItem(memory="The weather was nice today"),
+        TextualMemoryItem(memory="Project Zephyr ships on Friday"),
+        TextualMemoryItem(memory="Nothing relevant here"),
+    ]
+    scores = LexicalScorer().score("When does Zephyr ship?", None, items, None)
+
+    assert scores.argmax() == 1
+    assert scores[1] == pytest.approx(1.0)
+    assert scores[0] == 0.0 and scores[2] == 0.0
@@ -5,7 +5,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
-from memos.memories.textual.tree_text_memory.retrieve.recall import GraphMemoryRetriever
+from memos.memories.textual.tree_text_memory.retrieve.recall import (
+    GraphMemoryRetriever,
+    reciprocal_rank_fusion,
+)
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
 
 
@@ -107,3 +110,70 @@ def test_retrieve_merges_graph_and_vector(retriever, mock_graph_store):
     assert len(results) == 2
     ids = [r.id for r in results]
     assert g1_id in ids and v1_id in ids
+
+
+def test_vector_recall_loads_seeds_with_matches(retriever, mock_graph_store):
+    match_id = str(uuid.uuid4())
+    seed_id = str(uuid.uuid4())
+
+    mock_graph_store.search_by_embedding.return_value = [{"id": match_id}]
+    mock_graph_store.get_nodes.return_value = [
+        {"id": match_id, "memory": "m1", "metadata": {}},
+        {"id": seed_id, "memory": "m2", "metadata": {}},
+    ]
+
+    results = retriever._vector_recall([[0.1] * 5], "LongTermMemory", top_k=5, seed_ids=[seed_id])
+
+    assert {r.id for r in results} == {match_id, seed_id}
+    mock_graph_store.get_nodes.assert_called_once()
+    assert set(mock_graph_store.get_nodes.call_args.args[0]) == {match_id, seed_id}
+
+
+def test_reciprocal_rank_fusion_prefers_consensus():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"], ["c", "a"]])
+    assert fused[0] == "c"
+    assert fused[1] == "a"
+    assert set(fused) == {"a", "b", "c", "d"}
+
+
+def test_vector_recall_fuses_fulltext_hits(retriever, mock_graph_store):
+    vector_id, both_id, lexical_id = (str(uuid.uuid4()) for _ in range(3))
+    mock_graph_store.search_by_embedding.return_value = [{"id": vector_id}, {"id": both_id}]
+    mock_graph_store.search_by_fulltext.return_value = [{"id": both_id}, {"id": lexical_id}]
+    mock_graph_store.get_nodes.side_effect = lambda ids: [
+        {"id": node_id, "memory": "m", "metadata": {}} for node_id in sorted(ids)
+    ]
+
+    results = retriever._vector_recall(
+        [[0.1] * 5], "LongTermMemory", top_k=5, query="Project Zephyr deadline"
+    )
+
+    mock_graph_store.search_by_fulltext.assert_called_once_with(
+        "Project Zephyr deadline", top_k=5, scope="LongTermMemory"
+    )
+    assert [r.id for r in results] == [both_id, vector_id, lexical_id]
+
+
+def test_fulltext_failure_falls_back_to_vector(retriever, mock_graph_store):
+    vector_id = str(uuid.uuid4())
+    mock_graph_store.search_by_embedding.return_value = [{"id": vector_id}]
+    mock_graph_store.search_by_fulltext.side_effect = RuntimeError("no such index")
+    mock_graph_store.get_nodes.return_value = [{"id": vector_id, "memory": "m", "metadata": {}}]
+
+    results = retriever._vector_recall([[0.1] * 5], "UserMemory", top_k=5, query="q")
+
+    assert [r.id for r in results] == [vector_id]
+
+
+def test_retrieve_working_memory_uses_reader(mock_graph_store, mock_embedder):
+    cached = [TextualMemoryItem(memory="cached", metadata=TreeNodeTextualMemoryMetadata())]
+    retriever = GraphMemoryRetriever(
+        mock_graph_store, mock_embedder, working_memory_reader=lambda: cached
+    )
+
+    result = retriever.retrieve(
+        query="", parsed_goal=ParsedTaskGoal(), top_k=5, memory_scope="WorkingMemory"
+    )
+
+    assert result == cached
+    mock_graph_store.get_all_memory_items.assert_not_called()
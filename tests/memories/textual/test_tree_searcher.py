@@ -1,7 +1,11 @@
+import threading
+import time
+
 from unittest.mock import MagicMock
 
 import pytest
 
+from memos.configs.memory import SearchDeadlineConfig
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
 
@@ -115,3 +119,147 @@ def test_searcher_respects_memory_type(mock_searcher):
     )
     # WorkingMemory triggers only once path A
     assert mock_searcher.graph_retriever.retrieve.call_args[1]["memory_scope"] == "WorkingMemory"
+
+
+def test_searcher_fine_mode_reuses_context_hits(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = ["Tell me about dogs", "Dogs"]
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.side_effect = [[[0.1] * 5], [[0.2] * 5]]
+
+    mock_searcher.graph_store.search_by_embedding.return_value = [{"id": "a"}, {"id": "b"}]
+    mock_searcher.graph_store.get_node_fields.return_value = [
+        {"id": "a", "memory": "Dogs bark", "memory_type": "LongTermMemory"},
+        {"id": "b", "memory": "I own a dog", "memory_type": "UserMemory"},
+    ]
+    mock_searcher.graph_retriever.retrieve.return_value = []
+    mock_searcher.reranker.rerank.return_value = []
+    mock_searcher.reasoner.reason.return_value = []
+
+    mock_searcher.search(query="Tell me about dogs", top_k=2, mode="fine")
+
+    # Context comes from one projected query instead of a get_node per hit
+    mock_searcher.graph_store.get_node.assert_not_called()
+    mock_searcher.graph_store.get_node_fields.assert_called_once_with(
+        ["a", "b"], fields=("memory", "memory_type")
+    )
+    mock_searcher.task_goal_parser.parse.assert_called_once_with(
+        "Tell me about dogs", "Dogs bark\nI own a dog"
+    )
+
+    # The query is embedded once; only the new rephrasing is embedded afterwards
+    assert [c.args[0] for c in mock_searcher.embedder.embed.call_args_list] == [
+        ["Tell me about dogs"],
+        ["Dogs"],
+    ]
+
+    seeds = {
+        c.kwargs["memory_scope"]: c.kwargs.get("seed_ids")
+        for c in mock_searcher.graph_retriever.retrieve.call_args_list
+    }
+    assert seeds["LongTermMemory"] == ["a"]
+    assert seeds["UserMemory"] == ["b"]
+    assert mock_searcher.graph_retriever.retrieve.call_args_list[-1].kwargs["query_embedding"] == [
+        [0.1] * 5,
+        [0.2] * 5,
+    ]
+
+
+def test_searcher_balanced_mode_uses_cross_encoder(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = []
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+
+    mock_searcher.graph_retriever.retrieve.return_value = []
+    mock_searcher.reranker.rerank.side_effect = [
+        [make_item("wm1", 0.9)],
+        [make_item("lt1", 0.8), make_item("um1", 0.7)],
+    ]
+    mock_searcher.cross_encoder_reranker = MagicMock()
+    mock_searcher.cross_encoder_reranker.rerank.side_effect = lambda query, ranked, top_k: [
+        (item, 1.0 - score) for item, score in reversed(ranked)
+    ][:top_k]
+
+    result = mock_searcher.search(query="q", top_k=2, mode="balanced")
+
+    candidates = mock_searcher.cross_encoder_reranker.rerank.call_args.args[1]
+    assert [item.memory for item, _ in candidates] == ["wm1", "lt1", "um1"]
+    assert [item.memory for item in result] == ["um1", "lt1"]
+    assert result[0].metadata.relativity == pytest.approx(0.3)
+    mock_searcher.reasoner.reason.assert_not_called()
+
+
+def _score_all(query, query_embedding, graph_results, top_k, parsed_goal):
+    return [(item, 0.5) for item in graph_results]
+
+
+def test_searcher_returns_partial_results_when_path_misses_deadline(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = []
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+    mock_searcher.graph_retriever.retrieve.side_effect = lambda memory_scope, **kwargs: [
+        make_item(memory_scope, 0.5)[0]
+    ]
+    mock_searcher.reranker.rerank.side_effect = _score_all
+
+    release = threading.Event()
+    mock_searcher.internet_retriever = MagicMock()
+    mock_searcher.internet_retriever.retrieve_from_internet.side_effect = lambda **kwargs: (
+        release.wait(5),
+        [make_item("web", 0.5)[0]],
+    )[1]
+    mock_searcher.deadlines = SearchDeadlineConfig(internet=0.05)
+
+    start = time.monotonic()
+    result = mock_searcher.search(query="q", top_k=5)
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert elapsed < 2
+    assert result.partial
+    assert result.timed_out_paths == ["internet"]
+    assert sorted(item.memory for item in result) == [
+        "LongTermMemory",
+        "UserMemory",
+        "WorkingMemory",
+    ]
+
+
+def test_searcher_total_budget_bounds_every_path(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = []
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+
+    release = threading.Event()
+
+    def slow_retrieve(memory_scope, **kwargs):
+        if memory_scope != "WorkingMemory":
+            release.wait(5)
+        return [make_item(memory_scope, 0.5)[0]]
+
+    mock_searcher.graph_retriever.retrieve.side_effect = slow_retrieve
+    mock_searcher.reranker.rerank.side_effect = _score_all
+    mock_searcher.deadlines = SearchDeadlineConfig(long_term=10, total=0.05)
+
+    result = mock_searcher.search(query="q", top_k=5)
+    release.set()
+
+    assert result.timed_out_paths == ["long_term"]
+    assert [item.memory for item in result] == ["WorkingMemory"]
+
+
+def test_searcher_without_deadlines_is_complete(mock_searcher):
+    parsed_goal = MagicMock()
+    parsed_goal.memories = []
+    mock_searcher.task_goal_parser.parse.return_value = parsed_goal
+    mock_searcher.embedder.embed.return_value = [[0.1] * 5]
+    mock_searcher.graph_retriever.retrieve.return_value = []
+    mock_searcher.reranker.rerank.side_effect = _score_all
+
+    result = mock_searcher.search(query="q", top_k=5)
+
+    assert not result.partial
+    assert result.timed_out_paths == []
@@ -0,0 +1,62 @@
+import pytest
+
+from memos.filters import normalize_filter
+
+
+def test_normalize_list_is_and():
+    node = normalize_filter(
+        [
+            {"field": "key", "op": "in", "value": ["A", "B"]},
+            {"field": "memory_type", "value": "LongTermMemory"},
+        ]
+    )
+    assert node == {
+        "and": [
+            {"field": "key", "op": "in", "value": ["A", "B"]},
+            {"field": "memory_type", "op": "=", "value": "LongTermMemory"},
+        ]
+    }
+
+
+def test_normalize_plain_mapping():
+    node = normalize_filter({"user_id": "u1", "status": "activated"})
+    assert node == {
+        "and": [
+            {"field": "user_id", "op": "=", "value": "u1"},
+            {"field": "status", "op": "=", "value": "activated"},
+        ]
+    }
+
+
+def test_normalize_nested_logic():
+    node = normalize_filter(
+        {
+            "or": [
+                {"field": "tags", "op": "contains", "value": "AI"},
+                {"not": {"field": "status", "op": "=", "value": "archived"}},
+            ]
+        }
+    )
+    assert node["or"][0]["value"] == ["AI"]
+    assert node["or"][1] == {"not": {"field": "status", "op": "=", "value": "archived"}}
+
+
+def test_normalize_empty():
+    assert normalize_filter(None) is None
+    assert normalize_filter({}) is None
+    assert normalize_filter([]) is None
+
+
+@pytest.mark.parametrize(
+    "bad_filter",
+    [
+        {"field": "key", "op": "~", "value": 1},
+        {"field": "key) DETACH DELETE n //", "value": 1},
+        {"field": "key"},
+        {"and": {"field": "key", "value": 1}},
+        {"or": [], "and": []},
+    ],
+)
+def test_normalize_invalid(bad_filter):
+    with pytest.raises(ValueError):
+        normalize_filter(bad_filter)
@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 
 from memos import log
 
@@ -17,3 +18,48 @@ def test_get_logger_returns_logger():
     assert any(isinstance(h, logging.StreamHandler) for h in logger.parent.handlers) or any(
         isinstance(h, logging.FileHandler) for h in logger.parent.handlers
     )
+
+
+def test_get_logger_configures_logging_once():
+    root = logging.getLogger("")
+    log.get_logger("first")
+    handlers = list(root.handlers)
+
+    for i in range(5):
+        log.get_logger(f"module_{i}")
+
+    assert root.handlers == handlers
+    assert sum(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers) == 1
+
+
+def test_file_sink_writes_through_queue(tmp_path, monkeypatch):
+    monkeypatch.setattr("memos.settings.MEMOS_DIR", tmp_path)
+    log.setup_logging(force=True)
+    try:
+        log.get_logger("memos.test_sink").warning("queued record")
+        log._listener.stop()  # drains the queue
+        log._listener.start()
+
+        assert "queued record" in (tmp_path / "logs" / "memos.log").read_text()
+    finally:
+        monkeypatch.undo()
+        log.setup_logging(force=True)
+
+
+def test_payload_is_lazy_and_truncated():
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "x" * 50
+
+    logger = log.get_logger("memos.test_payload")
+    logger.setLevel(logging.INFO)
+    try:
+        logger.debug("payload: %s", log.Payload(render))
+        assert calls == []
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+    assert str(log.Payload(render, limit=10)) == "x" * 10 + "... [40 more chars]"
+    assert str(log.Payload("short", limit=10)) == "short"
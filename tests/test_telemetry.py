@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from memos import telemetry
+
+
+@pytest.fixture
+def metrics():
+    telemetry.configure(metrics=True)
+    telemetry.reset()
+    yield
+    telemetry.configure(metrics=False)
+    telemetry.reset()
+
+
+def test_span_is_noop_when_disabled():
+    telemetry.configure(metrics=False)
+    telemetry.reset()
+
+    with telemetry.span("stage", key="value") as span:
+        span.set_attribute("other", 1)
+
+    assert telemetry.STAGE_DURATION.count(stage="stage") == 0
+    assert telemetry.render_prometheus().count("memos_stage_duration_seconds_count") == 0
+
+
+def test_span_records_duration_and_errors(metrics):
+    with telemetry.span("search.rerank"):
+        pass
+    with pytest.raises(RuntimeError), telemetry.span("search.rerank"):
+        raise RuntimeError("boom")
+
+    assert telemetry.STAGE_DURATION.count(stage="search.rerank") == 2
+    assert telemetry.STAGE_ERRORS.value(stage="search.rerank") == 1
+
+
+def test_traced_decorator(metrics):
+    @telemetry.traced("mos.search")
+    def search(query):
+        return query.upper()
+
+    assert search("q") == "Q"
+    assert search.__name__ == "search"
+    assert telemetry.STAGE_DURATION.count(stage="mos.search") == 1
+
+
+def test_record_llm_usage_ignores_missing_counts(metrics):
+    telemetry.record_llm_usage("openai", "gpt-4o", 12, 5)
+    telemetry.record_llm_usage("ollama", "qwen3", None, object())
+
+    assert telemetry.LLM_TOKENS.value(backend="openai", model="gpt-4o", kind="prompt") == 12
+    assert telemetry.LLM_TOKENS.value(backend="openai", model="gpt-4o", kind="completion") == 5
+    assert telemetry.LLM_TOKENS.value(backend="ollama", model="qwen3", kind="prompt") == 0
+
+
+def test_render_prometheus_histogram_is_cumulative(metrics):
+    histogram = telemetry.Histogram("test_seconds", "Test.", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage="a")
+    histogram.observe(0.5, stage="a")
+    histogram.observe(5.0, stage="a")
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="a",le="1"} 2' in lines
+    assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{stage="a"} 3' in lines
+    assert 'test_seconds_sum{stage="a"} 5.55' in lines
+
+
+def test_counter_is_thread_safe(metrics):
+    def work():
+        for _ in range(1000):
+            telemetry.record_embedding("ollama", 1)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert telemetry.EMBEDDED_TEXTS.value(backend="ollama") == 4000
+    assert 'memos_embedded_texts_total{backend="ollama"} 4000' in telemetry.render_prometheus()
+
+
+def test_tracing_nests_spans_across_threads():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    exporter_module = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    exporter = exporter_module.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    def recall():
+        with telemetry.span("search.recall"):
+            pass
+
+    telemetry.configure(metrics=False, tracing=True)
+    telemetry._tracer = provider.get_tracer("memos")
+    try:
+        with telemetry.span("search", mode="fast"):
+            worker = threading.Thread(target=telemetry.in_current_context(recall))
+            worker.start()
+            worker.join()
+    finally:
+        telemetry.configure(metrics=False)
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["memos.search"].attributes["mode"] == "fast"
+    assert spans["memos.search.recall"].parent.span_id == spans["memos.search"].context.span_id
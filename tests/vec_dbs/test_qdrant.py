@@ -113,3 +113,140 @@ def test_get_all(vec_db):
     results = vec_db.get_all()
     assert len(results) == 1
     assert isinstance(results[0], VecDBItem)
+
+
+def test_search_skips_vectors_by_default(vec_db):
+    vec_db.client.search.return_value = []
+    vec_db.search([0.1, 0.2, 0.3], top_k=1, payload_fields=["memory"])
+    _, kwargs = vec_db.client.search.call_args
+    assert kwargs["with_vectors"] is False
+    assert kwargs["with_payload"] == ["memory"]
+
+
+def test_search_batch(vec_db):
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    vec_db.client.search_batch.return_value = [
+        [type("obj", (object,), {"id": ids[0], "vector": None, "payload": {}, "score": 0.8})],
+        [type("obj", (object,), {"id": ids[1], "vector": None, "payload": {}, "score": 0.7})],
+    ]
+    results = vec_db.search_batch([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], top_k=1)
+    vec_db.client.search_batch.assert_called_once()
+    assert len(vec_db.client.search_batch.call_args.kwargs["requests"]) == 2
+    assert [r[0].id for r in results] == ids
+    assert results[1][0].score == 0.7
+
+
+def test_prefer_grpc(config, mock_qdrant_client):
+    config.config.prefer_grpc = True
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    VecDBFactory.from_config(config)
+    _, kwargs = mock_qdrant_client.call_args
+    assert kwargs["prefer_grpc"] is True
+
+
+def test_search_with_filter_language(vec_db):
+    vec_db.client.search.return_value = []
+    vec_db.search(
+        [0.1, 0.2, 0.3],
+        top_k=1,
+        filter={
+            "or": [
+                {"field": "metadata.user_id", "op": "in", "value": ["u1", "u2"]},
+                {"not": {"field": "metadata.status", "op": "=", "value": "archived"}},
+            ]
+        },
+    )
+    query_filter = vec_db.client.search.call_args.kwargs["query_filter"]
+    assert query_filter.should[0].match.any == ["u1", "u2"]
+    assert query_filter.should[1].must_not[0].match.value == "archived"
+
+
+def test_filter_ranges_and_legacy_mapping(vec_db):
+    qdrant_filter = vec_db._dict_to_filter(
+        [
+            {"field": "metadata.confidence", "op": ">=", "value": 80},
+            {"field": "metadata.updated_at", "op": "<", "value": "2025-01-01T00:00:00"},
+        ]
+    )
+    assert qdrant_filter.must[0].range.gte == 80
+    assert qdrant_filter.must[1].range.lt.year == 2025
+
+    legacy = vec_db._dict_to_filter({"tag": "sample"})
+    assert legacy.must[0].key == "tag"
+    assert legacy.must[0].match.value == "sample"
+
+    with pytest.raises(ValueError):
+        vec_db._dict_to_filter({"field": "memory", "op": "starts_with", "value": "a"})
+
+
+def test_payload_indexes_created_for_server(config, mock_qdrant_client):
+    config.config.path = None
+    config.config.host = "localhost"
+    config.config.port = 6333
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+    indexed = [
+        call.kwargs["field_name"] for call in vec_db.client.create_payload_index.call_args_list
+    ]
+    assert indexed == list(config.config.payload_indexes)
+
+
+def test_no_payload_indexes_in_local_mode(vec_db):
+    vec_db.client.create_payload_index.assert_not_called()
+
+
+def test_add_in_batches_with_progress(vec_db):
+    data = [
+        {"id": str(uuid.uuid4()), "vector": [0.1, 0.2, 0.3], "payload": {"i": i}} for i in range(5)
+    ]
+    progress = []
+    vec_db.add(data, batch_size=2, progress_callback=lambda done, total: progress.append(done))
+    assert vec_db.client.upsert.call_count == 3
+    assert [len(call.kwargs["points"]) for call in vec_db.client.upsert.call_args_list] == [2, 2, 1]
+    assert progress == [2, 4, 5]
+
+
+def test_add_parallel_for_server(config, mock_qdrant_client):
+    config.config.path = None
+    config.config.host = "localhost"
+    config.config.port = 6333
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+    data = [{"id": str(uuid.uuid4()), "vector": [0.1, 0.2, 0.3]} for _ in range(10)]
+    progress = []
+    vec_db.add(data, batch_size=3, workers=2, progress_callback=lambda d, t: progress.append(d))
+    assert vec_db.client.upsert.call_count == 4
+    assert sorted(progress)[-1] == 10
+
+
+def test_iter_by_filter_pages(vec_db):
+    page1 = [type("obj", (object,), {"id": str(uuid.uuid4()), "vector": None, "payload": {}})]
+    page2 = [type("obj", (object,), {"id": str(uuid.uuid4()), "vector": None, "payload": {}})]
+    vec_db.client.scroll.side_effect = [(page1, "next"), (page2, None)]
+    pages = list(vec_db.iter_by_filter(None, scroll_limit=1))
+    assert [len(page) for page in pages] == [1, 1]
+    assert vec_db.client.scroll.call_args_list[1].kwargs["offset"] == "next"
+
+
+def test_quantization_config_and_rescore(config, mock_qdrant_client):
+    config.config.vector_datatype = "float16"
+    config.config.quantization = "int8"
+    mock_qdrant_client.return_value.get_collection.side_effect = Exception("Not found")
+    vec_db = VecDBFactory.from_config(config)
+
+    create_kwargs = vec_db.client.create_collection.call_args.kwargs
+    assert create_kwargs["vectors_config"].datatype.value == "float16"
+    assert create_kwargs["quantization_config"].scalar.type.value == "int8"
+
+    vec_db.client.search.return_value = []
+    vec_db.search([0.1, 0.2, 0.3, 0.4], top_k=5)
+    search_params = vec_db.client.search.call_args.kwargs["search_params"]
+    assert search_params.quantization.rescore is True
+    assert search_params.quantization.oversampling == 2.0
+
+
+def test_no_quantization_by_default(vec_db):
+    assert vec_db.client.create_collection.call_args.kwargs["quantization_config"] is None
+    vec_db.client.search.return_value = []
+    vec_db.search([0.1, 0.2, 0.3, 0.4], top_k=5)
+    assert vec_db.client.search.call_args.kwargs["search_params"] is None